@@ -0,0 +1,188 @@
+"""
+    Headless batch runner and pattern classifier for the Game of Life.
+
+    Runs many seed configurations to a generation limit without pygame, and
+    classifies each one by hashing every generation's board:
+        extinct     - every cell died
+        still_life  - the board stopped changing (period 1)
+        oscillator  - the board repeats with a period > 1
+        spaceship   - the live cells repeat shifted to another place (displacement)
+        unresolved  - no repeat within the generation limit
+    Pattern files (.rle, .cells) are placed in the middle of a --width x --height
+    board, which grows to keep a --margin of empty cells around a bigger pattern;
+    .npy files are whole boards and are used as they are. The board has fixed
+    edges, so a spaceship is caught by its first shifted repeat, long before it
+    reaches one. Seeds are spread over a process pool, and a per-seed report is
+    written as JSON or CSV.
+
+    Usage:
+        python batch.py --soups 1000 --width 64 --height 64 --generations 5000 --out soups.csv
+        python batch.py --files patterns/*.rle seeds/*.npy --out seeds.json
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from engine import NumpyLife
+from patterns import pattern_size, read_array
+
+
+def soup_seed(index: int, width: int, height: int, density: float, seed: int) -> dict:
+    return {"name": f"soup-{seed}-{index}", "kind": "soup", "width": width, "height": height,
+            "density": density, "seed": seed, "index": index}
+
+
+def file_seed(path: str, width: int = 64, height: int = 64, margin: int = 8) -> dict:
+    return {"name": os.path.basename(path), "kind": "file", "path": path,
+            "width": width, "height": height, "margin": margin}
+
+
+def load_seed(spec: dict) -> np.ndarray:
+    """ Builds the starting board of a seed spec. Soups are generated inside the worker. """
+    if spec["kind"] == "soup":
+        rng = np.random.default_rng([spec["seed"], spec["index"]])
+        return (rng.random((spec["height"], spec["width"])) < spec["density"]).astype(np.uint8)
+    if spec["kind"] == "file":
+        if spec["path"].endswith(".npy"):
+            return np.load(spec["path"]).astype(np.uint8)
+        pattern_width, pattern_height = pattern_size(spec["path"])
+        width = max(spec["width"], pattern_width + 2 * spec["margin"])
+        height = max(spec["height"], pattern_height + 2 * spec["margin"])
+        return read_array(spec["path"], width, height, (width - pattern_width) // 2, (height - pattern_height) // 2)
+    raise ValueError(f"Unknown seed kind '{spec['kind']}'.")
+
+
+def _digest(board: np.ndarray) -> bytes:
+    return hashlib.blake2b(board.tobytes(), digest_size=16).digest()
+
+
+def _shape(state: np.ndarray) -> tuple:
+    """ (digest of the live cells cropped to their bounding box, its top left corner) """
+    rows, columns = np.flatnonzero(state.any(axis=1)), np.flatnonzero(state.any(axis=0))
+    top, left = int(rows[0]), int(columns[0])
+    crop = state[top:rows[-1] + 1, left:columns[-1] + 1]
+    return _digest(crop) + bytes(str(crop.shape), "ascii"), (left, top)
+
+
+def classify(state: np.ndarray, max_generations: int) -> dict:
+    """ Runs one board until it dies, repeats (in place or shifted) or reaches max_generations. """
+    height, width = state.shape
+    life = NumpyLife(width, height, state)
+
+    # digest of a board -> first generation it was seen in, and the same for the
+    # cropped live cells -> (generation, position), for repeats somewhere else
+    seen = {_digest(life.state): 0}
+    shapes = {}
+    if life.population:
+        shape, corner = _shape(life.state)
+        shapes[shape] = (0, corner)
+    population = [life.population]
+    classification, period, cycle_start, displacement = "unresolved", None, None, None
+
+    for generation in range(1, max_generations + 1):
+        life.step()
+        population.append(life.population)
+
+        if population[-1] == 0:
+            classification, cycle_start = "extinct", generation
+            break
+
+        key = _digest(life.state)
+        if key in seen:
+            cycle_start = seen[key]
+            period = generation - cycle_start
+            classification = "still_life" if period == 1 else "oscillator"
+            break
+        seen[key] = generation
+
+        shape, corner = _shape(life.state)
+        if shape in shapes:  # the same cells at another place: the board itself never repeated
+            cycle_start, (x, y) = shapes[shape]
+            classification, period = "spaceship", generation - cycle_start
+            displacement = (corner[0] - x, corner[1] - y)
+            break
+        shapes[shape] = (generation, corner)
+
+    return {
+        "classification": classification,
+        "period": period,
+        "cycle_start": cycle_start,
+        "displacement": displacement,
+        "generations": life.generation,
+        "final_population": population[-1],
+        "population": population,
+    }
+
+
+def run_seed(spec: dict, max_generations: int) -> dict:
+    start = time.perf_counter()
+    report = classify(load_seed(spec), max_generations)
+    report["wall_time"] = time.perf_counter() - start
+    return {"name": spec["name"], **report}
+
+
+def run_batch(seeds: list[dict], max_generations: int, workers: int = None) -> list[dict]:
+    """ Classifies every seed spec on a process pool. Reports are returned in seed order. """
+    if workers == 1:
+        return [run_seed(spec, max_generations) for spec in seeds]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(seeds) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_seed, seeds, [max_generations] * len(seeds), chunksize=chunksize))
+
+
+def write_reports(reports: list[dict], path: str):
+    if path.endswith(".csv"):
+        fields = ["name", "classification", "period", "cycle_start", "displacement", "generations",
+                  "final_population", "wall_time", "population"]
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for report in reports:
+                # The population curve goes into one column, as space separated counts
+                writer.writerow({**report, "population": " ".join(map(str, report["population"]))})
+    else:
+        with open(path, "w") as f:
+            json.dump(reports, f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--soups", type=int, default=0, help="number of random soups")
+    parser.add_argument("--width", type=int, default=64)
+    parser.add_argument("--height", type=int, default=64)
+    parser.add_argument("--density", type=float, default=0.35)
+    parser.add_argument("--seed", type=int, default=0, help="base seed of the random soups")
+    parser.add_argument("--files", nargs="*", default=[], help=".npy, .rle or .cells boards to classify")
+    parser.add_argument("--margin", type=int, default=8, help="empty cells kept around a pattern file")
+    parser.add_argument("--generations", type=int, default=2000, help="generation limit per seed")
+    parser.add_argument("--workers", type=int, default=None, help="process count (default: all cores)")
+    parser.add_argument("--out", default="report.json", help="output file, .json or .csv")
+    args = parser.parse_args()
+
+    seeds = [soup_seed(i, args.width, args.height, args.density, args.seed) for i in range(args.soups)]
+    seeds += [file_seed(path, args.width, args.height, args.margin) for path in args.files]
+    if not seeds:
+        parser.error("nothing to run, give --soups and/or --files")
+
+    start = time.perf_counter()
+    reports = run_batch(seeds, args.generations, args.workers)
+    write_reports(reports, args.out)
+
+    counts = {}
+    for report in reports:
+        counts[report["classification"]] = counts.get(report["classification"], 0) + 1
+    print(f"{len(reports)} seeds in {time.perf_counter() - start:.1f}s -> {args.out}")
+    for name, count in sorted(counts.items()):
+        print(f"  {name:<12} {count}")
+
+
+if __name__ == "__main__":
+    main()
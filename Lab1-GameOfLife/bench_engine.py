@@ -0,0 +1,85 @@
+"""
+    Benchmark: generations per second of GameOfLife.update (nested Python loops)
+    against the vectorized NumpyLife engine, on random soups of growing size.
+
+    Usage:
+        python bench_engine.py --sizes 50 100 200 500 1000 --seconds 2
+"""
+
+import argparse
+import os
+import time
+
+# The loop version lives in GameOfLife, which opens a window; keep it off-screen
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame as pg
+
+from engine import NumpyLife, cells_to_array
+from main import Cell, GameOfLife
+
+
+def random_soup(size: int, density: float, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (rng.random((size, size)) < density).astype(np.uint8)
+
+
+def time_generations(step, seconds: float, max_generations: int):
+    """ Calls step() until `seconds` have passed. Returns (generations, elapsed). """
+    generations = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < seconds and generations < max_generations:
+        step()
+        generations += 1
+        elapsed = time.perf_counter() - start
+    return generations, elapsed
+
+
+def bench_size(size: int, seconds: float, density: float, seed: int):
+    soup = random_soup(size, density, seed)
+
+    game = GameOfLife(size, size, size=1)
+    grid = [[Cell(x, y, game.display, size=1) for x in range(size)] for y in range(size)]
+    for y, x in zip(*np.nonzero(soup)):
+        grid[y][x].alive = True
+    game.set_config(grid)
+    game._paused = False
+    loop_gens, loop_time = time_generations(game.update, seconds, max_generations=10_000)
+
+    engine = NumpyLife(size, size, soup)
+    numpy_gens, numpy_time = time_generations(engine.step, seconds, max_generations=1_000_000)
+
+    # Both engines must agree after the same number of generations
+    check = NumpyLife(size, size, soup)
+    check.step(loop_gens)
+    same = np.array_equal(check.state, cells_to_array(game.grid))
+
+    return {
+        "size": size,
+        "loop_gps": loop_gens / loop_time,
+        "numpy_gps": numpy_gens / numpy_time,
+        "same": same,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100, 200, 500, 1000])
+    parser.add_argument("--seconds", type=float, default=2.0, help="time budget per engine and size")
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pg.init()
+    print(f"{'size':>6} {'loop gen/s':>12} {'numpy gen/s':>12} {'speedup':>9}  same")
+    for size in args.sizes:
+        r = bench_size(size, args.seconds, args.density, args.seed)
+        print(f"{r['size']:>6} {r['loop_gps']:>12.2f} {r['numpy_gps']:>12.1f} "
+              f"{r['numpy_gps'] / r['loop_gps']:>8.0f}x  {r['same']}")
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+    Scaling benchmark for the tiled ParallelLife stepper: generations per second
+    with 1, 2, 4 and 8 workers on one random soup, checked against NumpyLife.
+
+    Usage:
+        python bench_parallel.py --size 20000 --generations 5
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from engine import NumpyLife
+from parallel import ParallelLife
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=4000, help="board is size x size")
+    parser.add_argument("--generations", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--tile-size", type=int, default=1024)
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-check", action="store_true", help="skip the comparison with NumpyLife")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    soup = (rng.random((args.size, args.size)) < args.density).astype(np.uint8)
+
+    expected = None
+    if not args.no_check:
+        reference = NumpyLife(args.size, args.size, soup)
+        reference.step(args.generations)
+        expected = reference.to_array()
+
+    print(f"{args.size}x{args.size}, {args.generations} generations")
+    print(f"{'workers':>8} {'gen/s':>10} {'speedup':>8}  match")
+    base = None
+    for workers in args.workers:
+        with ParallelLife(args.size, args.size, soup, workers=workers, tile_size=args.tile_size) as life:
+            life.step()  # warm up the pool
+            start = time.perf_counter()
+            life.step(args.generations - 1)
+            elapsed = time.perf_counter() - start
+            match = "-" if expected is None else np.array_equal(life.state, expected)
+
+        rate = (args.generations - 1) / elapsed
+        base = base or rate
+        print(f"{workers:>8} {rate:>10.2f} {rate / base:>7.2f}x  {match}")
+
+
+if __name__ == "__main__":
+    main()
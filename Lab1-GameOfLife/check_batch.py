@@ -0,0 +1,44 @@
+"""
+    Check: batch.py classifies the stored patterns as what they are.
+
+    Every pattern file is placed on a board as `python batch.py --files` does
+    and classified; the result must match the expected classification, period
+    and displacement. Exits with status 1 on the first list of failures.
+
+    Usage:
+        python check_batch.py
+"""
+
+import os
+import sys
+
+from batch import classify, file_seed, load_seed
+from patterns import PATTERN_DIR
+
+# file -> (classification, period, displacement per period)
+EXPECTED = {
+    "block.rle": ("still_life", 1, None),
+    "blinker.rle": ("oscillator", 2, None),
+    "toad.cells": ("oscillator", 2, None),
+    "beacon.cells": ("oscillator", 2, None),
+    "glider.rle": ("spaceship", 4, (1, 1)),
+    "lwss.rle": ("spaceship", 4, (-2, 0)),
+}
+
+
+def main():
+    failures = []
+    for name, expected in EXPECTED.items():
+        report = classify(load_seed(file_seed(os.path.join(PATTERN_DIR, name))), 1000)
+        got = (report["classification"], report["period"], report["displacement"])
+        status = "ok" if got == expected else "FAIL"
+        print(f"{name:<14} {got[0]:<11} period {got[1]}  displacement {got[2]}  {status}")
+        if got != expected:
+            failures.append(f"{name}: expected {expected}, got {got}")
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+    Vectorized stepping engine for the Game of Life.
+
+    The board is kept as a packed NumPy uint8 array (1 = alive, 0 = dead) and
+    each generation is computed with shifted-slice sums instead of Python loops.
+    Edges follow the same bounded rules as GameOfLife.update: everything
+    outside the board counts as dead.
+
+    Any engine plugged into GameOfLife is expected to provide:
+        width, height, generation, population
+        load(state), to_array(), step(generations=1), set_cell(x, y, alive), clear()
+"""
+
+import numpy as np
+
+# (dy, dx) offsets of the 8 neighbours inside the padded buffer
+NEIGHBOR_OFFSETS = [(dy, dx) for dy in range(3) for dx in range(3) if (dy, dx) != (1, 1)]
+
+
+def cells_to_array(grid) -> np.ndarray:
+    """ Converts a list[list[Cell]] grid into a (height, width) uint8 array. """
+    return np.array([[cell.alive for cell in row] for row in grid], dtype=np.uint8)
+
+
+def sync_cells(grid, state: np.ndarray, previous: np.ndarray = None):
+    """ Copies `state` into the Cell grid. With `previous`, only changed cells are touched. """
+    if previous is None:
+        for row, values in zip(grid, state.tolist()):
+            for cell, alive in zip(row, values):
+                cell.alive = bool(alive)
+        return
+
+    ys, xs = np.nonzero(state != previous)
+    for y, x in zip(ys.tolist(), xs.tolist()):
+        grid[y][x].alive = bool(state[y, x])
+
+
+def life_step(state: np.ndarray) -> np.ndarray:
+    """ Returns the next generation of a (height, width) board, using bounded edges. """
+    height, width = state.shape
+    padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = state != 0
+
+    neighbors = np.zeros((height, width), dtype=np.uint8)
+    for dy, dx in NEIGHBOR_OFFSETS:
+        neighbors += padded[dy:dy + height, dx:dx + width]
+
+    alive = padded[1:-1, 1:-1].astype(bool)
+    return ((neighbors == 3) | (alive & (neighbors == 2))).astype(np.uint8)
+
+
+class NumpyLife:
+    """ Game of Life board stored as a NumPy array and stepped with array operations """
+    def __init__(self, width: int, height: int, state: np.ndarray = None):
+        self.width = width
+        self.height = height
+        self.generation = 0
+
+        # Two padded buffers are swapped every generation. The ring of zeros around
+        # the board plays the part of the bounds check in GameOfLife.update.
+        self._buffers = [np.zeros((height + 2, width + 2), dtype=np.uint8) for _ in range(2)]
+        self._current = 0
+
+        # Scratch arrays reused every generation, so stepping does not allocate
+        self._neighbors = np.zeros((height, width), dtype=np.uint8)
+        self._survive = np.zeros((height, width), dtype=bool)
+        self._born = np.zeros((height, width), dtype=bool)
+
+        if state is not None:
+            self.load(state)
+
+    @classmethod
+    def from_cells(cls, grid):
+        """ Builds an engine from a list[list[Cell]] grid. """
+        return cls(len(grid[0]), len(grid), cells_to_array(grid))
+
+    @property
+    def state(self) -> np.ndarray:
+        """ View (not a copy) of the current board, shape (height, width). """
+        return self._buffers[self._current][1:-1, 1:-1]
+
+    @property
+    def population(self) -> int:
+        return int(np.count_nonzero(self.state))
+
+    def load(self, state):
+        state = np.asarray(state)
+        if state.shape != (self.height, self.width):
+            raise ValueError("Invalid starting configuration.")
+        self.state[...] = state != 0
+
+    def to_array(self) -> np.ndarray:
+        return self.state.copy()
+
+    def set_cell(self, x: int, y: int, alive: bool):
+        self.state[y, x] = alive
+
+    def clear(self):
+        self.state[...] = 0
+
+    def step(self, generations: int = 1):
+        height, width = self.height, self.width
+        neighbors, survive, born = self._neighbors, self._survive, self._born
+
+        for _ in range(generations):
+            src = self._buffers[self._current]
+            dst = self._buffers[1 - self._current]
+
+            # Sum the 8 shifted views of the padded board
+            (dy, dx), (ey, ex) = NEIGHBOR_OFFSETS[:2]
+            np.add(src[dy:dy + height, dx:dx + width], src[ey:ey + height, ex:ex + width], out=neighbors)
+            for dy, dx in NEIGHBOR_OFFSETS[2:]:
+                np.add(neighbors, src[dy:dy + height, dx:dx + width], out=neighbors)
+
+            # A live cell survives with 2 or 3 neighbours, a dead cell is born with exactly 3
+            np.equal(neighbors, 2, out=survive)
+            np.logical_and(survive, src[1:-1, 1:-1], out=survive)
+            np.equal(neighbors, 3, out=born)
+            np.logical_or(survive, born, out=survive)
+            dst[1:-1, 1:-1] = survive
+
+            self._current = 1 - self._current
+            self.generation += 1
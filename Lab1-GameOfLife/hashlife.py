@@ -0,0 +1,291 @@
+"""
+    Hashlife backend for very long Game of Life runs.
+
+    The universe is a quadtree of hash-consed nodes: two regions with the same
+    content are the same Node object, so the result of advancing a region is
+    memoized once and reused wherever that region appears. A level-k node can
+    be advanced 2^(k-2) generations in a single call, which lets `jump(k)` skip
+    2^k generations at a time.
+
+    Unlike GameOfLife.update, Hashlife runs on an unbounded plane. Results agree
+    with the bounded stepper as long as the pattern stays away from the board edges.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class Node:
+    """ Quadtree node. A level-k node covers a 2^k x 2^k square. """
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level: int, population: int):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+class LRUCache:
+    """ Dict with a maximum size. The least recently used entry is evicted first. """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._data[key] = value
+        if len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+
+
+# The two leaves (level 0) are shared by every universe
+DEAD = Node(None, None, None, None, 0, 0)
+ALIVE = Node(None, None, None, None, 0, 1)
+
+
+class HashLife:
+    """ Hashlife universe. Implements the same engine interface as engine.NumpyLife. """
+    def __init__(self, width: int, height: int, state: np.ndarray = None,
+                 max_nodes: int = 1_000_000, max_results: int = 1_000_000):
+        # width/height only define the window used by load/to_array, the plane is unbounded
+        self.width = width
+        self.height = height
+        self.generation = 0
+
+        # Evicting a canonical node is safe: a later join simply builds a fresh
+        # equivalent node, and memoized results stay correct because they are
+        # keyed by the node objects themselves.
+        self._nodes = LRUCache(max_nodes)
+        self._results = LRUCache(max_results)
+        self._empty = [DEAD]
+
+        # Root of the universe and the board coordinates of its top-left corner
+        self.root = self._empty_node(3)
+        self.origin = (0, 0)
+
+        if state is not None:
+            self.load(state)
+
+    # ---- node construction ----
+
+    def _join(self, nw: Node, ne: Node, sw: Node, se: Node) -> Node:
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw, ne, sw, se, nw.level + 1,
+                        nw.population + ne.population + sw.population + se.population)
+            self._nodes.put(key, node)
+        return node
+
+    def _empty_node(self, level: int) -> Node:
+        while len(self._empty) <= level:
+            e = self._empty[-1]
+            self._empty.append(self._join(e, e, e, e))
+        return self._empty[level]
+
+    def _centre(self, m: Node) -> Node:
+        """ Returns a node one level up with `m` in its centre. """
+        e = self._empty_node(m.level - 1)
+        return self._join(self._join(e, e, e, m.nw), self._join(e, e, m.ne, e),
+                          self._join(e, m.sw, e, e), self._join(m.se, e, e, e))
+
+    @staticmethod
+    def _inner(m: Node) -> tuple:
+        return (m.nw.se, m.ne.sw, m.sw.ne, m.se.nw)
+
+    # ---- evolution ----
+
+    def _life_4x4(self, m: Node) -> Node:
+        """ Advances the centre 2x2 of a level-2 node by one generation. """
+        rows = [
+            [m.nw.nw, m.nw.ne, m.ne.nw, m.ne.ne],
+            [m.nw.sw, m.nw.se, m.ne.sw, m.ne.se],
+            [m.sw.nw, m.sw.ne, m.se.nw, m.se.ne],
+            [m.sw.sw, m.sw.se, m.se.sw, m.se.se],
+        ]
+        bits = [[leaf.population for leaf in row] for row in rows]
+
+        def next_state(y, x):
+            neighbors = sum(bits[y + i][x + j] for i in (-1, 0, 1) for j in (-1, 0, 1)) - bits[y][x]
+            if bits[y][x]:
+                return ALIVE if neighbors in (2, 3) else DEAD
+            return ALIVE if neighbors == 3 else DEAD
+
+        return self._join(next_state(1, 1), next_state(1, 2), next_state(2, 1), next_state(2, 2))
+
+    def _successor(self, m: Node, j: int) -> Node:
+        """ Returns the centre of `m` (one level down) advanced 2^j generations, j <= level - 2. """
+        if m.population == 0:
+            return self._empty_node(m.level - 1)
+
+        key = (m, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if m.level == 2:
+            result = self._life_4x4(m)
+        else:
+            j = min(j, m.level - 2)
+            join, succ = self._join, self._successor
+            a, b, c, d = m.nw, m.ne, m.sw, m.se
+
+            # Nine overlapping sub-squares of half size, each advanced 2^j
+            # generations (or 2^(level-3) when two passes are needed)
+            c1 = succ(a, j)
+            c2 = succ(join(a.ne, b.nw, a.se, b.sw), j)
+            c3 = succ(b, j)
+            c4 = succ(join(a.sw, a.se, c.nw, c.ne), j)
+            c5 = succ(join(a.se, b.sw, c.ne, d.nw), j)
+            c6 = succ(join(b.sw, b.se, d.nw, d.ne), j)
+            c7 = succ(c, j)
+            c8 = succ(join(c.ne, d.nw, c.se, d.sw), j)
+            c9 = succ(d, j)
+
+            if j < m.level - 2:
+                # One pass is enough: stitch the centres together
+                result = join(join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                              join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw))
+            else:
+                # Second pass advances the four combined squares again
+                result = join(succ(join(c1, c2, c4, c5), j), succ(join(c2, c3, c5, c6), j),
+                              succ(join(c4, c5, c7, c8), j), succ(join(c5, c6, c8, c9), j))
+
+        self._results.put(key, result)
+        return result
+
+    def _expand(self):
+        half = 1 << (self.root.level - 1)
+        self.root = self._centre(self.root)
+        self.origin = (self.origin[0] - half, self.origin[1] - half)
+
+    def jump(self, k: int):
+        """ Advances the universe 2^k generations in one step. """
+        # Grow until the root is big enough for a 2^k jump and every live cell is
+        # in its inner half, then once more so the pattern cannot reach the edge.
+        while self.root.level < k + 2 or sum(n.population for n in self._inner(self.root)) != self.root.population:
+            self._expand()
+        self._expand()
+
+        level = self.root.level
+        self.root = self._successor(self.root, k)
+        shift = 1 << (level - 2)
+        self.origin = (self.origin[0] + shift, self.origin[1] + shift)
+        self.generation += 1 << k
+
+    def step(self, generations: int = 1):
+        k = 0
+        while generations:
+            if generations & 1:
+                self.jump(k)
+            generations >>= 1
+            k += 1
+
+    # ---- dense grid I/O ----
+
+    @property
+    def population(self) -> int:
+        return self.root.population
+
+    def _build(self, state: np.ndarray, x: int, y: int, level: int) -> Node:
+        size = 1 << level
+        block = state[y:y + size, x:x + size]
+        if not block.any():
+            return self._empty_node(level)
+        if level == 0:
+            return ALIVE
+        half = size >> 1
+        return self._join(self._build(state, x, y, level - 1), self._build(state, x + half, y, level - 1),
+                          self._build(state, x, y + half, level - 1), self._build(state, x + half, y + half, level - 1))
+
+    def load(self, state):
+        """ Replaces the universe with a dense (height, width) grid placed at (0, 0). """
+        state = np.asarray(state)
+        if state.shape != (self.height, self.width):
+            raise ValueError("Invalid starting configuration.")
+        level = max(3, int(max(self.width, self.height) - 1).bit_length())
+        self.root = self._build(state != 0, 0, 0, level)
+        self.origin = (0, 0)
+
+    def _paint(self, node: Node, x: int, y: int, out: np.ndarray):
+        size = 1 << node.level
+        height, width = out.shape
+        if node.population == 0 or x >= width or y >= height or x + size <= 0 or y + size <= 0:
+            return
+        if node.level == 0:
+            out[y, x] = 1
+            return
+        half = size >> 1
+        self._paint(node.nw, x, y, out)
+        self._paint(node.ne, x + half, y, out)
+        self._paint(node.sw, x, y + half, out)
+        self._paint(node.se, x + half, y + half, out)
+
+    def to_array(self, x: int = 0, y: int = 0, width: int = None, height: int = None) -> np.ndarray:
+        """ Returns the (height, width) window with top-left corner at (x, y) as a uint8 array. """
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        out = np.zeros((height, width), dtype=np.uint8)
+        self._paint(self.root, self.origin[0] - x, self.origin[1] - y, out)
+        return out
+
+    def _set(self, node: Node, x: int, y: int, alive: bool) -> Node:
+        if node.level == 0:
+            return ALIVE if alive else DEAD
+        half = 1 << (node.level - 1)
+        nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+        if y < half:
+            if x < half:
+                nw = self._set(nw, x, y, alive)
+            else:
+                ne = self._set(ne, x - half, y, alive)
+        else:
+            if x < half:
+                sw = self._set(sw, x, y - half, alive)
+            else:
+                se = self._set(se, x - half, y - half, alive)
+        return self._join(nw, ne, sw, se)
+
+    def set_cell(self, x: int, y: int, alive: bool):
+        while True:
+            dx, dy = x - self.origin[0], y - self.origin[1]
+            size = 1 << self.root.level
+            if 0 <= dx < size and 0 <= dy < size:
+                break
+            self._expand()
+        self.root = self._set(self.root, dx, dy, alive)
+
+    def clear(self):
+        self.root = self._empty_node(3)
+        self.origin = (0, 0)
+
+    def cache_info(self) -> dict:
+        return {
+            "nodes": len(self._nodes),
+            "results": len(self._results),
+            "result_hits": self._results.hits,
+            "result_misses": self._results.misses,
+            "evictions": self._nodes.evictions + self._results.evictions,
+        }
@@ -0,0 +1,196 @@
+"""
+    Checkpoint and delta history for long Game of Life runs.
+
+    A history is a directory with:
+        meta.json        - width, height, checkpoint interval
+        checkpoints.bin  - full boards (uint8, height x width each), read through np.memmap
+        checkpoints.idx  - generation of every checkpoint (int64)
+        deltas.bin       - flat indices of the cells that flipped, one block per generation (uint32)
+        deltas.idx       - (generation, offset, count) of every block (int64)
+
+    Data is always written before its index entry, so after a crash the
+    index tells how much of each data file is complete and the rest is dropped.
+    Readers get zero-copy NumPy views into the mapped files.
+
+    Usage:
+        history = History.create("run1", width, height, checkpoint_interval=100)
+        history.record(life.to_array())          # generation 0
+        for _ in range(n):
+            life.step()
+            history.record(life.to_array())
+
+        history = History.open("run1")
+        generation, state = history.resume()     # latest generation
+        board = history.state_at(1234)           # scrub back
+"""
+
+import json
+import os
+
+import numpy as np
+
+CELL = np.uint8
+INDEX = np.dtype("<u4")
+RECORD = np.dtype([("generation", "<i8"), ("offset", "<i8"), ("count", "<i8")])
+
+
+class History:
+    """ Memory-mapped checkpoints plus a per-generation delta log """
+    def __init__(self, path: str):
+        self.path = path
+        with open(self._file("meta.json")) as f:
+            meta = json.load(f)
+        self.width = meta["width"]
+        self.height = meta["height"]
+        self.checkpoint_interval = meta["checkpoint_interval"]
+        self._cells = self.width * self.height
+
+        self._repair()
+        self._last = None  # board of the latest recorded generation
+        self._maps = {}
+
+    @classmethod
+    def create(cls, path: str, width: int, height: int, checkpoint_interval: int = 100):
+        os.makedirs(path, exist_ok=True)
+        for name in ("checkpoints.bin", "checkpoints.idx", "deltas.bin", "deltas.idx"):
+            open(os.path.join(path, name), "wb").close()
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump({"width": width, "height": height, "checkpoint_interval": checkpoint_interval}, f)
+        return cls(path)
+
+    @classmethod
+    def open(cls, path: str):
+        return cls(path)
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    # ---- crash recovery ----
+
+    def _repair(self):
+        """ Drops any partially written tail left by a crash. """
+        checkpoint_count = min(os.path.getsize(self._file("checkpoints.idx")) // 8,
+                               os.path.getsize(self._file("checkpoints.bin")) // max(1, self._cells))
+        os.truncate(self._file("checkpoints.idx"), checkpoint_count * 8)
+        os.truncate(self._file("checkpoints.bin"), checkpoint_count * self._cells)
+
+        record_count = os.path.getsize(self._file("deltas.idx")) // RECORD.itemsize
+        records = np.fromfile(self._file("deltas.idx"), dtype=RECORD, count=record_count)
+        data_size = os.path.getsize(self._file("deltas.bin")) // INDEX.itemsize
+        # Keep the records whose data made it to disk
+        while record_count and records[record_count - 1]["offset"] + records[record_count - 1]["count"] > data_size:
+            record_count -= 1
+        end = int(records[record_count - 1]["offset"] + records[record_count - 1]["count"]) if record_count else 0
+        os.truncate(self._file("deltas.idx"), record_count * RECORD.itemsize)
+        os.truncate(self._file("deltas.bin"), end * INDEX.itemsize)
+
+    # ---- zero-copy readers ----
+
+    def _map(self, name: str, dtype, shape_tail=()):
+        """ Maps a file read-only, re-mapping when it has grown since the last call. """
+        size = os.path.getsize(self._file(name))
+        cached = self._maps.get(name)
+        if cached is not None and cached[0] == size:
+            return cached[1]
+        itemsize = np.dtype(dtype).itemsize * int(np.prod(shape_tail, dtype=np.int64))
+        count = size // itemsize if itemsize else 0
+        if count == 0:
+            array = np.zeros((0, *shape_tail), dtype=dtype)
+        else:
+            array = np.memmap(self._file(name), dtype=dtype, mode="r", shape=(count, *shape_tail))
+        self._maps[name] = (size, array)
+        return array
+
+    @property
+    def checkpoint_generations(self) -> np.ndarray:
+        return self._map("checkpoints.idx", "<i8")
+
+    @property
+    def checkpoints(self) -> np.ndarray:
+        """ All checkpoints as one (n, height, width) memory-mapped array. """
+        return self._map("checkpoints.bin", CELL, (self.height, self.width))
+
+    @property
+    def records(self) -> np.ndarray:
+        return self._map("deltas.idx", RECORD)
+
+    @property
+    def latest_generation(self) -> int:
+        records = self.records
+        if len(records):
+            return int(records[-1]["generation"])
+        generations = self.checkpoint_generations
+        return int(generations[-1]) if len(generations) else -1
+
+    def delta(self, generation: int) -> np.ndarray:
+        """ Flat indices of the cells that flipped to reach `generation` (a view into the log). """
+        records = self.records
+        position = int(np.searchsorted(records["generation"], generation))
+        if position == len(records) or records[position]["generation"] != generation:
+            raise KeyError(f"No delta for generation {generation}.")
+        record = records[position]
+        data = self._map("deltas.bin", INDEX)
+        return data[int(record["offset"]):int(record["offset"] + record["count"])]
+
+    def state_at(self, generation: int) -> np.ndarray:
+        """ Rebuilds the board of `generation` from the nearest checkpoint before it. """
+        generations = self.checkpoint_generations
+        position = int(np.searchsorted(generations, generation, side="right")) - 1
+        if position < 0 or generation > self.latest_generation:
+            raise KeyError(f"Generation {generation} is not in the history.")
+
+        state = np.array(self.checkpoints[position])
+        flat = state.reshape(-1)
+        for g in range(int(generations[position]) + 1, generation + 1):
+            flat[self.delta(g)] ^= 1
+        return state
+
+    def resume(self) -> tuple[int, np.ndarray]:
+        """ Returns (generation, board) of the latest recorded generation, ready to keep recording. """
+        generation = self.latest_generation
+        if generation < 0:
+            raise KeyError("The history is empty.")
+        self._last = self.state_at(generation)
+        return generation, self._last.copy()
+
+    # ---- writing ----
+
+    def record(self, state: np.ndarray):
+        """ Appends the next generation. The first call records generation 0. """
+        state = np.asarray(state, dtype=CELL)
+        if state.shape != (self.height, self.width):
+            raise ValueError("Board size does not match the history.")
+        if self._last is None and self.latest_generation >= 0:
+            self.resume()
+
+        generation = self.latest_generation + 1
+        if self._last is not None:
+            flipped = np.flatnonzero(self._last != state).astype(INDEX)
+            offset = os.path.getsize(self._file("deltas.bin")) // INDEX.itemsize
+            with open(self._file("deltas.bin"), "ab") as f:
+                f.write(flipped.tobytes())
+            entry = np.array([(generation, offset, len(flipped))], dtype=RECORD)
+            with open(self._file("deltas.idx"), "ab") as f:
+                f.write(entry.tobytes())
+
+        if generation % self.checkpoint_interval == 0:
+            with open(self._file("checkpoints.bin"), "ab") as f:
+                f.write(np.ascontiguousarray(state).tobytes())
+            with open(self._file("checkpoints.idx"), "ab") as f:
+                f.write(np.array([generation], dtype="<i8").tobytes())
+
+        self._last = state.copy()
+
+    def truncate(self, generation: int):
+        """ Forgets everything after `generation`, e.g. before continuing from a rewound board. """
+        records = self.records
+        keep = int(np.searchsorted(records["generation"], generation, side="right"))
+        end = int(records[keep - 1]["offset"] + records[keep - 1]["count"]) if keep else 0
+        checkpoints = int(np.searchsorted(self.checkpoint_generations, generation, side="right"))
+
+        self._maps = {}  # drop the mappings before shrinking the files
+        os.truncate(self._file("deltas.idx"), keep * RECORD.itemsize)
+        os.truncate(self._file("deltas.bin"), end * INDEX.itemsize)
+        os.truncate(self._file("checkpoints.idx"), checkpoints * 8)
+        os.truncate(self._file("checkpoints.bin"), checkpoints * self._cells)
+        self._last = None
@@ -7,6 +7,15 @@
 import pygame as pg
 import numpy as np
 
+import time
+
+from engine import NumpyLife, cells_to_array, sync_cells
+from patterns import available_patterns, find_pattern, iter_runs, pattern_size
+
+ALIVE_COLOR = (255, 0, 0)
+DEAD_COLOR  = (255, 255, 255)
+LINE_COLOR  = (0, 0, 0)
+
 class Cell:
     def __init__(self, x: int, y: int, display: pg.Surface, size=10):
         self.position = np.array([x, y])
@@ -20,8 +29,67 @@ class Cell:
                          (self.position[0] * self._size, self.position[1] * self._size, 
                           self._size, self._size))
     
+class IncrementalRenderer:
+    """ Draws only the cells that changed since the last frame and returns the dirty rects """
+    def __init__(self, display: pg.Surface, width: int, height: int, size: int, full_redraw_ratio=0.05):
+        self.display = display
+        self.width = width
+        self.height = height
+        self.size = size
+        # Above this fraction of changed cells one full blit is cheaper than many small ones
+        self.full_redraw_ratio = full_redraw_ratio
+        self._shown = None  # board currently on screen
+
+        # Grid lines are drawn once on an off-screen layer; white is transparent
+        self._lines = pg.Surface((width * size, height * size))
+        self._lines.fill(DEAD_COLOR)
+        self._lines.set_colorkey(DEAD_COLOR)
+        for i in range(width):
+            pg.draw.line(self._lines, LINE_COLOR, (i * size, 0), (i * size, height * size))
+        for i in range(height):
+            pg.draw.line(self._lines, LINE_COLOR, (0, i * size), (width * size, i * size))
+
+        self._cells = pg.Surface((width, height))
+        self._cells.set_colorkey(DEAD_COLOR)
+        self._palette = np.array([DEAD_COLOR, ALIVE_COLOR], dtype=np.uint8)
+
+    def _draw_all(self, state: np.ndarray) -> list[pg.Rect]:
+        # Push the whole board in one call: one pixel per cell, then scale up
+        pg.surfarray.blit_array(self._cells, self._palette[state.T])
+        self.display.fill(DEAD_COLOR)
+        self.display.blit(self._lines, (0, 0))
+        self.display.blit(pg.transform.scale(self._cells, self.display.get_size()), (0, 0))
+        return [self.display.get_rect()]
+
+    def draw(self, state: np.ndarray) -> list[pg.Rect]:
+        if self._shown is None:
+            changed = None
+        else:
+            ys, xs = np.nonzero(state != self._shown)
+            if len(ys) > self.full_redraw_ratio * state.size:
+                changed = None
+            else:
+                changed = zip(ys.tolist(), xs.tolist())
+        self._shown = state.copy()
+
+        if changed is None:
+            return self._draw_all(state)
+
+        rects = []
+        size = self.size
+        for y, x in changed:
+            rect = pg.Rect(x * size, y * size, size, size)
+            if state[y, x]:
+                self.display.fill(ALIVE_COLOR, rect)
+            else:
+                self.display.fill(DEAD_COLOR, rect)
+                self.display.blit(self._lines, rect, rect)
+            rects.append(rect)
+        return rects
+
 class GameOfLife:
-    def __init__(self, width: int, height: int, size=10, config: list[Cell] = None):
+    def __init__(self, width: int, height: int, size=10, config: list[Cell] = None, engine=None,
+                 incremental=False, history=None):
         self.width = width
         self.height = height
         self.size = size
@@ -38,16 +106,107 @@ class GameOfLife:
             
             self.grid = config
 
+        # Optional stepping engine (e.g. engine.NumpyLife). When set, it holds the
+        # board and the Cell grid is only a view of it used for drawing.
+        self.engine = engine
+        if engine is not None:
+            if engine.width != width or engine.height != height:
+                raise ValueError("Engine size does not match the board.")
+            if config is None:
+                sync_cells(self.grid, engine.to_array())
+            else:
+                engine.load(cells_to_array(config))
+
+        # Incremental rendering and history work on the engine's array, so they need an engine
+        if (incremental or history is not None) and self.engine is None:
+            self.engine = NumpyLife(width, height, cells_to_array(self.grid))
+
+        self.renderer = None
+        if incremental:
+            self.renderer = IncrementalRenderer(self.display, width, height, size)
+
+        # Optional history.History: every generation is recorded, and an existing
+        # history is resumed from its latest generation
+        self.history = history
+        self._scrub = None  # generation shown while scrubbing back, if not the latest
+        if history is not None:
+            if history.latest_generation >= 0:
+                generation, state = history.resume()
+                self._show(state, generation)
+            else:
+                history.record(self.engine.to_array())
+        self._clock = pg.time.Clock()
+        self._frame_time = 0.0
+
     def set_config(self, config: list[Cell]):
         if len(config) != self.height or len(config[0]) != self.width:
             raise ValueError("Invalid starting configuration.")
         self.grid = config
+        if self.engine is not None:
+            self.engine.load(cells_to_array(config))
+
+        # A new configuration starts a new run
+        if self.history is not None:
+            self.history.truncate(-1)
+            self.engine.generation = 0
+            self._scrub = None
+            self.history.record(self.engine.to_array())
+
+    def toggle(self, x: int, y: int):
+        if self.engine is not None:
+            alive = not self.engine.to_array()[y, x]
+            self.engine.set_cell(x, y, alive)
+        else:
+            alive = not self.grid[y][x].alive
+        self.grid[y][x].alive = alive
+
+    def clear(self):
+        for row in self.grid:
+            for cell in row:
+                cell.alive = False
+        if self.engine is not None:
+            self.engine.clear()
+
+    def _show(self, state: np.ndarray, generation: int):
+        self.engine.load(state)
+        self.engine.generation = generation
+        sync_cells(self.grid, state)
+
+    def _step_engine(self):
+        # Continuing from a rewound generation drops the history recorded after it
+        if self._scrub is not None:
+            self.history.truncate(self._scrub)
+            self._scrub = None
+
+        # The incremental renderer draws straight from the engine, so it skips the view
+        previous = self.engine.to_array() if self.renderer is None else None
+        self.engine.step()
+        if previous is None and self.history is None:
+            return
+
+        current = self.engine.to_array()
+        if self.history is not None:
+            self.history.record(current)
+        if previous is not None:
+            # Copy only the cells that changed into the view
+            sync_cells(self.grid, current, previous)
+
+    def scrub(self, generation: int):
+        """ Shows a recorded generation. Unpausing continues from it and drops the later history. """
+        latest = self.history.latest_generation
+        generation = max(0, min(generation, latest))
+        self._show(self.history.state_at(generation), generation)
+        self._scrub = generation if generation < latest else None
 
     def update(self):
         # If paused, do not update the grid
         if self._paused:
             return
 
+        if self.engine is not None:
+            self._step_engine()
+            return
+
         new_states = [[False for _ in range(self.width)] for _ in range(self.height)]
         for y in range(self.height):
             for x in range(self.width):
@@ -95,7 +254,23 @@ class GameOfLife:
         pg.draw.rect(self.display, (255, 255, 255), (0, 0, 100, 30))
         self.display.blit(text, (0, 0))
 
-    def run(self):
+    def draw_incremental(self) -> list[pg.Rect]:
+        """ Redraws only the changed cells plus the status overlay. Returns the dirty rects. """
+        rects = self.renderer.draw(self.engine.to_array())
+
+        # Status and frame time overlay (smoothed over recent frames)
+        status = "Paused" if self._paused else "Running"
+        fps = 1000.0 / self._frame_time if self._frame_time > 0 else 0.0
+        text = self.font.render(f"{status}  {self._frame_time:.1f} ms  {fps:.0f} fps", True,
+                                (255, 0, 0) if self._paused else (0, 160, 0))
+        overlay = pg.Rect(0, 0, max(320, text.get_width()), 30)
+        pg.draw.rect(self.display, (255, 255, 255), overlay)
+        self.display.blit(text, (0, 0))
+        rects.append(overlay)
+        return rects
+
+    def run(self, fps: int = 10):
+        """ Main loop. fps=0 steps as fast as possible. """
         running = True
         while running:
             for event in pg.event.get():
@@ -109,21 +284,33 @@ class GameOfLife:
 
                     # Clear grid on 'c' press
                     if event.key == pg.K_c:
-                        for row in self.grid:
-                            for cell in row:
-                                cell.alive = False
+                        self.clear()
+
+                    # Scrub through the recorded history with the arrow keys while paused
+                    if self._paused and self.history is not None:
+                        if event.key == pg.K_LEFT:
+                            self.scrub(self.engine.generation - 1)
+                        if event.key == pg.K_RIGHT:
+                            self.scrub(self.engine.generation + 1)
                 
                 # On mouse click, toggle cell state if paused
                 if event.type == pg.MOUSEBUTTONDOWN and self._paused:
                     x, y = pg.mouse.get_pos()
                     x, y = x // self.size, y // self.size
-                    self.grid[y][x].alive = not self.grid[y][x].alive   # Toggle cell state
+                    self.toggle(x, y)   # Toggle cell state
 
-            self.display.fill((255, 255, 255))
-            self.update()
-            self.draw()
-            pg.display.update()
-            pg.time.delay(100)
+            start = time.perf_counter()
+            if self.renderer is not None:
+                self.update()
+                pg.display.update(self.draw_incremental())
+            else:
+                self.display.fill((255, 255, 255))
+                self.update()
+                self.draw()
+                pg.display.update()
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self._frame_time = 0.9 * self._frame_time + 0.1 * elapsed
+            self._clock.tick(fps)
 
 class Configurations:
     def __init__(self, width, height, display: pg.Surface):
@@ -131,22 +318,31 @@ class Configurations:
         self._height = height
         self.display = display
 
-    def get_block(self):
-        block = [[Cell(x, y, self.display) for x in range(self._width)] for y in range(self._height)]
+    def empty(self):
+        return [[Cell(x, y, self.display) for x in range(self._width)] for y in range(self._height)]
 
-        block[self._height//2][self._width//2].alive = True 
-        block[self._height//2][self._width//2 + 1].alive = True
-        block[self._height//2 + 1][self._width//2].alive = True
-        block[self._height//2 + 1][self._width//2 + 1].alive = True
-        
-        return block
+    def available(self) -> list[str]:
+        return available_patterns()
+
+    def load(self, name: str, x: int = None, y: int = None):
+        """ Builds a grid with a pattern from the store (patterns/). Centred unless (x, y) is given. """
+        path = find_pattern(name)
+        width, height = pattern_size(path)
+        x = (self._width - width) // 2 if x is None else x
+        y = (self._height - height) // 2 if y is None else y
+
+        grid = self.empty()
+        for rx, ry, length in iter_runs(path):
+            for cx in range(x + rx, x + rx + length):
+                if 0 <= y + ry < self._height and 0 <= cx < self._width:
+                    grid[y + ry][cx].alive = True
+        return grid
+
+    def get_block(self):
+        return self.load("block", self._width//2, self._height//2)
     
     def get_blinker(self):
-        blinker = [[Cell(x, y, self.display) for x in range(self._width)] for y in range(self._height)]
-        blinker[self._height//2][self._width//2].alive = True
-        blinker[self._height//2][self._width//2 + 1].alive = True
-
-        return blinker
+        return self.load("blinker", self._width//2, self._height//2)
 
 if __name__ == "__main__":
     pg.init()
@@ -0,0 +1,136 @@
+"""
+    Multi-core tiled Game of Life stepper.
+
+    The board lives in two padded buffers in `multiprocessing.shared_memory`: the
+    current generation and the next one. The grid is split into tiles and each
+    worker process steps its tiles in place, so no tile is ever copied between
+    processes. Halo exchange happens through the shared buffer: a tile reads the
+    one-cell border of its neighbours straight from the current generation, and
+    all tiles of a generation finish before the buffers are swapped. The ring of
+    zeros around the board gives the same bounded edges as GameOfLife.update.
+"""
+
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from engine import NEIGHBOR_OFFSETS
+
+# Buffers attached in each worker process: name -> ndarray over shared memory
+_worker_buffers = {}
+_worker_memory = []
+
+
+def _attach(names: list[str], shape: tuple[int, int]):
+    for name in names:
+        memory = shared_memory.SharedMemory(name=name)
+        _worker_memory.append(memory)  # keep the mapping alive
+        _worker_buffers[name] = np.ndarray(shape, dtype=np.uint8, buffer=memory.buf)
+
+
+def step_tile(src: np.ndarray, dst: np.ndarray, y0: int, y1: int, x0: int, x1: int):
+    """ Steps the tile of board rows y0:y1 and columns x0:x1 from padded `src` into padded `dst`. """
+    height, width = y1 - y0, x1 - x0
+    # Tile plus its one-cell halo, in padded coordinates
+    region = src[y0:y1 + 2, x0:x1 + 2]
+
+    neighbors = np.zeros((height, width), dtype=np.uint8)
+    for dy, dx in NEIGHBOR_OFFSETS:
+        neighbors += region[dy:dy + height, dx:dx + width]
+
+    alive = region[1:-1, 1:-1].astype(bool)
+    dst[y0 + 1:y1 + 1, x0 + 1:x1 + 1] = (neighbors == 3) | (alive & (neighbors == 2))
+
+
+def _step_tiles(task):
+    src_name, dst_name, tiles = task
+    src, dst = _worker_buffers[src_name], _worker_buffers[dst_name]
+    for tile in tiles:
+        step_tile(src, dst, *tile)
+
+
+class ParallelLife:
+    """ Game of Life stepped by a pool of worker processes over shared memory tiles """
+    def __init__(self, width: int, height: int, state: np.ndarray = None, workers: int = 4,
+                 tile_size: int = 1024):
+        self.width = width
+        self.height = height
+        self.workers = workers
+        self.generation = 0
+
+        shape = (height + 2, width + 2)
+        self._memory = [shared_memory.SharedMemory(create=True, size=shape[0] * shape[1]) for _ in range(2)]
+        self._buffers = [np.ndarray(shape, dtype=np.uint8, buffer=m.buf) for m in self._memory]
+        for buffer in self._buffers:
+            buffer[...] = 0
+        self._current = 0
+
+        # (y0, y1, x0, x1) tiles, dealt round-robin so every worker gets a similar share
+        tiles = [(y, min(y + tile_size, height), x, min(x + tile_size, width))
+                 for y in range(0, height, tile_size) for x in range(0, width, tile_size)]
+        self._shares = [tiles[i::workers] for i in range(workers) if tiles[i::workers]]
+
+        self._pool = None
+        if workers > 1:
+            self._pool = Pool(workers, initializer=_attach,
+                              initargs=([m.name for m in self._memory], shape))
+
+        if state is not None:
+            self.load(state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """ Stops the workers and frees the shared memory. """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self._memory:
+            self._buffers = []
+            for memory in self._memory:
+                memory.close()
+                memory.unlink()
+            self._memory = []
+
+    @property
+    def state(self) -> np.ndarray:
+        return self._buffers[self._current][1:-1, 1:-1]
+
+    @property
+    def population(self) -> int:
+        return int(np.count_nonzero(self.state))
+
+    def load(self, state):
+        state = np.asarray(state)
+        if state.shape != (self.height, self.width):
+            raise ValueError("Invalid starting configuration.")
+        self.state[...] = state != 0
+
+    def to_array(self) -> np.ndarray:
+        return self.state.copy()
+
+    def set_cell(self, x: int, y: int, alive: bool):
+        self.state[y, x] = alive
+
+    def clear(self):
+        self.state[...] = 0
+
+    def step(self, generations: int = 1):
+        for _ in range(generations):
+            src, dst = self._current, 1 - self._current
+            if self._pool is None:
+                for share in self._shares:
+                    for tile in share:
+                        step_tile(self._buffers[src], self._buffers[dst], *tile)
+            else:
+                # map() returns only when every tile is done: that is the barrier
+                # between generations, after which the halos are up to date
+                names = (self._memory[src].name, self._memory[dst].name)
+                self._pool.map(_step_tiles, [(*names, share) for share in self._shares])
+            self._current = dst
+            self.generation += 1
@@ -0,0 +1,200 @@
+"""
+    Streaming I/O for the standard Game of Life pattern formats, and a pattern store.
+
+    Supported formats:
+        RLE (.rle)        - header line `x = <width>, y = <height>, rule = B3/S23`
+                            then runs such as `2o3b$` (o = alive, b = dead, $ = next row, ! = end)
+        plaintext (.cells) - one line per row, `O` alive and `.` dead, `!` starts a comment
+
+    Readers yield runs of live cells (x, y, length) while reading the file line by
+    line, and writers consume one row at a time, so large patterns never need a
+    full Cell grid (or even a full dense array when loaded into a BitLife).
+"""
+
+import os
+import re
+
+import numpy as np
+
+from bitboard import BitLife
+
+PATTERN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "patterns")
+RLE_LINE_LENGTH = 70
+
+_RLE_HEADER = re.compile(r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)")
+_RLE_TOKEN = re.compile(r"(\d*)([a-zA-Z$!])")
+
+
+# ---- readers ----
+
+def rle_size(lines) -> tuple[int, int]:
+    """ Reads (width, height) from the RLE header line. """
+    for line in lines:
+        if line.startswith("#"):
+            continue
+        match = _RLE_HEADER.match(line.strip())
+        if match is None:
+            break
+        return int(match.group(1)), int(match.group(2))
+    raise ValueError("RLE pattern has no 'x = .., y = ..' header.")
+
+
+def iter_rle(lines):
+    """ Yields (x, y, length) runs of live cells from RLE lines. """
+    x = y = 0
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or _RLE_HEADER.match(line):
+            continue
+        for count, tag in _RLE_TOKEN.findall(line):
+            count = int(count) if count else 1
+            if tag == "!":
+                return
+            if tag == "$":
+                x, y = 0, y + count
+            elif tag == "b":
+                x += count
+            else:
+                # 'o' and the extra states of multi-state rules all count as alive
+                yield x, y, count
+                x += count
+
+
+def plaintext_size(lines) -> tuple[int, int]:
+    width = height = 0
+    for line in lines:
+        if line.startswith("!"):
+            continue
+        width = max(width, len(line.rstrip()))
+        height += 1
+    return width, height
+
+
+def iter_plaintext(lines):
+    """ Yields (x, y, length) runs of live cells from plaintext lines. """
+    y = 0
+    for line in lines:
+        if line.startswith("!"):
+            continue
+        for match in re.finditer(r"[O*]+", line.rstrip()):
+            yield match.start(), y, match.end() - match.start()
+        y += 1
+
+
+def _reader(path: str):
+    if path.endswith(".rle"):
+        return rle_size, iter_rle
+    if path.endswith(".cells") or path.endswith(".txt"):
+        return plaintext_size, iter_plaintext
+    raise ValueError(f"Unknown pattern format '{path}'.")
+
+
+def pattern_size(path: str) -> tuple[int, int]:
+    size, _ = _reader(path)
+    with open(path) as f:
+        return size(f)
+
+
+def iter_runs(path: str):
+    """ Streams the live-cell runs of a pattern file. """
+    _, runs = _reader(path)
+    with open(path) as f:
+        yield from runs(f)
+
+
+def read_bitboard(path: str, width: int = None, height: int = None, x: int = 0, y: int = 0) -> BitLife:
+    """ Loads a pattern straight into a bit-packed board, placed with its top-left corner at (x, y). """
+    pattern_width, pattern_height = pattern_size(path)
+    width = pattern_width + x if width is None else width
+    height = pattern_height + y if height is None else height
+    board = BitLife(width, height)
+    for rx, ry, length in iter_runs(path):
+        if 0 <= ry + y < height and rx + x < width:
+            board.set_run(rx + x, ry + y, length)
+    return board
+
+
+def read_array(path: str, width: int = None, height: int = None, x: int = 0, y: int = 0) -> np.ndarray:
+    """ Loads a pattern as a dense (height, width) uint8 array, e.g. for NumpyLife.load. """
+    pattern_width, pattern_height = pattern_size(path)
+    width = pattern_width + x if width is None else width
+    height = pattern_height + y if height is None else height
+    state = np.zeros((height, width), dtype=np.uint8)
+    for rx, ry, length in iter_runs(path):
+        if 0 <= ry + y < height:
+            state[ry + y, rx + x:rx + x + length] = 1
+    return state
+
+
+# ---- writers ----
+
+def write_rle(f, rows, width: int, height: int, name: str = None):
+    """ Writes rows (iterables of 0/1) as RLE. Rows are consumed one at a time. """
+    if name:
+        f.write(f"#N {name}\n")
+    f.write(f"x = {width}, y = {height}, rule = B3/S23\n")
+
+    line = ""
+    pending_rows = 0  # row ends not written yet, so empty rows collapse into `n$`
+
+    def emit(token):
+        nonlocal line
+        if len(line) + len(token) > RLE_LINE_LENGTH:
+            f.write(line + "\n")
+            line = ""
+        line += token
+
+    for index, row in enumerate(rows):
+        row = np.asarray(row) != 0
+        if index > 0:
+            pending_rows += 1
+        if not row.any():
+            continue
+        if pending_rows:
+            emit(f"{pending_rows if pending_rows > 1 else ''}$")
+            pending_rows = 0
+
+        # Boundaries between runs of equal cells; trailing dead cells are dropped
+        edges = np.flatnonzero(np.diff(row.astype(np.int8))) + 1
+        starts = np.concatenate(([0], edges))
+        ends = np.concatenate((edges, [len(row)]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            alive = bool(row[start])
+            if not alive and end == len(row):
+                break
+            count = end - start
+            emit(f"{count if count > 1 else ''}{'o' if alive else 'b'}")
+
+    f.write(line + "!\n")
+
+
+def write_plaintext(f, rows, name: str = None):
+    if name:
+        f.write(f"!Name: {name}\n")
+    for row in rows:
+        f.write("".join("O" if cell else "." for cell in np.asarray(row).tolist()).rstrip(".") + "\n")
+
+
+def save_pattern(path: str, rows, width: int, height: int, name: str = None):
+    """ Writes rows to `path`, choosing the format from the extension. """
+    with open(path, "w") as f:
+        if path.endswith(".rle"):
+            write_rle(f, rows, width, height, name)
+        else:
+            write_plaintext(f, rows, name)
+
+
+# ---- pattern store ----
+
+def available_patterns(directory: str = PATTERN_DIR) -> list[str]:
+    names = {os.path.splitext(file)[0] for file in os.listdir(directory)
+             if file.endswith((".rle", ".cells"))}
+    return sorted(names)
+
+
+def find_pattern(name: str, directory: str = PATTERN_DIR) -> str:
+    for extension in (".rle", ".cells"):
+        path = os.path.join(directory, name + extension)
+        if os.path.exists(path):
+            return path
+    raise KeyError(f"No pattern named '{name}' in {directory}.")
@@ -0,0 +1,91 @@
+"""
+    Sparse active-set Game of Life simulator.
+
+    Only live cells are stored, as a set of (x, y) coordinates. Each generation
+    counts neighbours by visiting the live cells only, so the cost grows with the
+    population and not with the board area. Boards can be far larger than a dense
+    Cell grid would allow, or unbounded.
+"""
+
+import numpy as np
+
+NEIGHBORS = [(dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dx, dy) != (0, 0)]
+
+
+class SparseLife:
+    """ Game of Life on a set of live cells. Implements the same engine interface as engine.NumpyLife. """
+    def __init__(self, width: int, height: int, state: np.ndarray = None, bounded: bool = True, cells=()):
+        # With bounded=True the edges follow GameOfLife.update (outside cells are dead);
+        # otherwise width/height only define the window used by load/to_array.
+        self.width = width
+        self.height = height
+        self.bounded = bounded
+        self.generation = 0
+        self.cells: set[tuple[int, int]] = set()
+
+        if state is not None:
+            self.load(state)
+        for x, y in cells:
+            self.set_cell(x, y, True)
+
+    @property
+    def population(self) -> int:
+        return len(self.cells)
+
+    def _inside(self, x: int, y: int) -> bool:
+        return not self.bounded or (0 <= x < self.width and 0 <= y < self.height)
+
+    def load(self, state):
+        state = np.asarray(state)
+        if state.shape != (self.height, self.width):
+            raise ValueError("Invalid starting configuration.")
+        ys, xs = np.nonzero(state)
+        self.cells = set(zip(xs.tolist(), ys.tolist()))
+
+    def to_array(self, x: int = 0, y: int = 0, width: int = None, height: int = None) -> np.ndarray:
+        """ Returns the (height, width) window with top-left corner at (x, y) as a uint8 array. """
+        width = self.width if width is None else width
+        height = self.height if height is None else height
+        out = np.zeros((height, width), dtype=np.uint8)
+        for cx, cy in self.cells:
+            if x <= cx < x + width and y <= cy < y + height:
+                out[cy - y, cx - x] = 1
+        return out
+
+    def set_cell(self, x: int, y: int, alive: bool):
+        if alive and self._inside(x, y):
+            self.cells.add((x, y))
+        else:
+            self.cells.discard((x, y))
+
+    def clear(self):
+        self.cells = set()
+
+    def bounding_box(self):
+        """ Returns (min_x, min_y, max_x, max_y) of the live cells, or None if the board is empty. """
+        if not self.cells:
+            return None
+        xs = [x for x, _ in self.cells]
+        ys = [y for _, y in self.cells]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def step(self, generations: int = 1):
+        for _ in range(generations):
+            # Every live cell adds one to each of its neighbours; cells that are
+            # not in `counts` have no live neighbours and stay dead.
+            counts: dict[tuple[int, int], int] = {}
+            get = counts.get
+            for x, y in self.cells:
+                for dx, dy in NEIGHBORS:
+                    key = (x + dx, y + dy)
+                    counts[key] = get(key, 0) + 1
+
+            cells = self.cells
+            new_cells = {cell for cell, n in counts.items()
+                         if n == 3 or (n == 2 and cell in cells)}
+            if self.bounded:
+                width, height = self.width, self.height
+                new_cells = {(x, y) for x, y in new_cells if 0 <= x < width and 0 <= y < height}
+
+            self.cells = new_cells
+            self.generation += 1
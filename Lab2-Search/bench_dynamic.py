@@ -0,0 +1,87 @@
+"""
+    Benchmark: D* Lite replanning against a full re-solve after k random edits.
+    Every round toggles k random interior walls (and, with --weighted, also changes
+    k random cell costs), then measures the planner repairing its plan and A* solving
+    the edited maze from scratch. Both path costs must match.
+
+    Usage:
+        python bench_dynamic.py --size 200 --edits 1 10 100 --rounds 5 --weighted
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+from compact_maze import CompactMaze
+from dynamic import DStarLite
+from main import MazeSolver
+
+
+def edit(maze, rng: random.Random, k: int, weighted: bool) -> list:
+    """ Applies k random wall toggles (and k cost changes if weighted), returns the changed cells """
+    changed = []
+    for _ in range(k):
+        x, y = rng.randrange(maze.width - 1), rng.randrange(maze.height - 1)
+        changed.extend(maze.toggle_wall(x, y, rng.choice((1, 2))))  # right or bottom, never an outer wall
+        if weighted:
+            x, y = rng.randrange(maze.width), rng.randrange(maze.height)
+            maze.set_cost(x, y, rng.randint(1, 9))
+            changed.append((x, y))
+    return changed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=200)
+    parser.add_argument("--edits", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--weighted", action="store_true", help="random cell costs in 1..9, edited too")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'edits':>5} {'replan s':>9} {'expanded':>9} {'full s':>8} {'expanded':>9} {'speedup':>8} {'same cost':>9}")
+    for k in args.edits:
+        rng = random.Random(args.seed)
+        size = args.size
+        maze = CompactMaze(size, size, (0, rng.randrange(size)), (size - 1, rng.randrange(size)))
+        maze.generate('kruskal', args.seed)
+        if args.weighted:
+            for y in range(size):
+                for x in range(size):
+                    maze.set_cost(x, y, rng.randint(1, 9))
+
+        planner = DStarLite(maze)
+        planner.plan()
+
+        replan_time = full_time = 0.0
+        replan_expanded = full_expanded = 0
+        same = True
+        for _ in range(args.rounds):
+            changed = edit(maze, rng, k, args.weighted)
+
+            before = planner.stats.expanded
+            start = time.perf_counter()
+            planner.update(changed)
+            path = planner.plan()
+            replan_time += time.perf_counter() - start
+            replan_expanded += planner.stats.expanded - before
+
+            solver = MazeSolver(maze, algorithm='astar')
+            start = time.perf_counter()
+            deque(solver.solve_gen(), maxlen=0)
+            full_time += time.perf_counter() - start
+            full_expanded += solver.stats.expanded
+
+            if path is None:
+                same &= solver.stats.path_length == 0
+            else:
+                same &= solver.stats.path_cost == planner.stats.path_cost
+
+        rounds = args.rounds
+        print(f"{k:>5} {replan_time / rounds:>9.4f} {replan_expanded // rounds:>9} {full_time / rounds:>8.4f} "
+              f"{full_expanded // rounds:>9} {full_time / max(replan_time, 1e-9):>7.1f}x {str(same):>9}")
+
+
+if __name__ == "__main__":
+    main()
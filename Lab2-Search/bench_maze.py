@@ -0,0 +1,73 @@
+"""
+    Benchmark: dict-based Maze against array-backed CompactMaze.
+    For each size, reports peak memory during generation (tracemalloc) and the time of generation and BFS solve,
+    and checks that both produce the same maze and path from the same seed.
+
+    Usage:
+        python bench_maze.py --sizes 1000 2000 --seed 0
+"""
+
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from collections import deque
+
+from compact_maze import CompactMaze
+from main import Maze, MazeSolver
+
+
+def peak_memory(build, generate) -> float:
+    """ Peak MB allocated while building and generating a maze (timed separately, tracemalloc is slow). """
+    gc.collect()
+    tracemalloc.start()
+    maze = build()
+    deque(generate(maze), maxlen=0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def timed(build, generate, solve):
+    """ Returns (maze, path, generation seconds, solve seconds). """
+    gc.collect()
+    start = time.perf_counter()
+    maze = build()
+    deque(generate(maze), maxlen=0)
+    gen_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    path = [cell for tag, cell in solve(maze) if tag == 'path']
+    solve_time = time.perf_counter() - start
+    return maze, path, gen_time, solve_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'maze':>8} {'peak MB':>9} {'gen s':>8} {'solve s':>8} {'path':>7}")
+    for size in args.sizes:
+        entrance, exit = (0, size // 2), (size - 1, size // 3)
+        results = {}
+        for name, cls, solve in (("dict", Maze, lambda m: MazeSolver(m).solve_gen()),
+                                 ("compact", CompactMaze, lambda m: m.solve_gen())):
+            build = lambda: cls(size, size, entrance, exit)
+            random.seed(args.seed)
+            peak = peak_memory(build, lambda m: m.generate_gen())
+            random.seed(args.seed)
+            maze, path, gen_time, solve_time = timed(build, lambda m: m.generate_gen(), solve)
+            results[name] = (maze, path)
+            print(f"{size:>6} {name:>8} {peak:>9.1f} {gen_time:>8.2f} {solve_time:>8.2f} {len(path):>7}")
+
+        (dict_maze, dict_path), (compact, compact_path) = results["dict"], results["compact"]
+        same = dict_path == compact_path and all(
+            dict_maze.cell_walls(x, y) == compact.cell_walls(x, y) for y in range(size) for x in range(size))
+        print(f"{'':>6} same maze and path: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+    Benchmark: solve_batch against one MazeSolver per agent.
+    Agents start from --sources spawn cells and go to random goals, so batching
+    can share one search per spawn cell. The per-agent baseline runs on the first
+    --baseline agents only and is extrapolated to queries per second.
+
+    Usage:
+        python bench_multi_agent.py --size 300 --agents 1000 --sources 10 --workers 1 4
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+from compact_maze import CompactMaze
+from main import MazeSolver
+from multi_agent import solve_batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=300)
+    parser.add_argument("--agents", type=int, default=1000)
+    parser.add_argument("--sources", type=int, default=10, help="distinct start cells")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--baseline", type=int, default=20, help="agents solved one by one with MazeSolver")
+    parser.add_argument("--loops", type=int, default=0, help="extra walls removed, so paths are not unique")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    size = args.size
+    maze = CompactMaze(size, size, (0, 0), (size - 1, size - 1))
+    maze.generate('kruskal', args.seed)
+    for _ in range(args.loops):
+        maze.set_wall(rng.randrange(size - 1), rng.randrange(size - 1), rng.choice((1, 2)), False)
+
+    spawns = [(rng.randrange(size), rng.randrange(size)) for _ in range(args.sources)]
+    pairs = [(rng.choice(spawns), (rng.randrange(size), rng.randrange(size))) for _ in range(args.agents)]
+
+    # Baseline: one BFS per agent
+    start = time.perf_counter()
+    lengths = []
+    for source, goal in pairs[:args.baseline]:
+        maze.entrance, maze.exit = source, goal
+        solver = MazeSolver(maze)
+        deque(solver.solve_gen(), maxlen=0)
+        lengths.append(solver.stats.path_length)
+    baseline_qps = args.baseline / (time.perf_counter() - start)
+    print(f"per-agent MazeSolver: {baseline_qps:10.1f} q/s")
+
+    for workers in args.workers:
+        paths, stats = solve_batch(maze, pairs, workers=workers)
+        same = [len(p) for p in paths[:args.baseline]] == lengths
+        print(f"solve_batch workers={workers}: {stats.qps:10.1f} q/s  groups={stats.groups}  "
+              f"expanded={stats.expanded}  {stats.seconds:.2f} s  same lengths: {same}")
+
+
+if __name__ == "__main__":
+    main()
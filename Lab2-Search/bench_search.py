@@ -0,0 +1,57 @@
+"""
+    Benchmark of the MazeSolver search strategies on the same generated mazes.
+    Reports nodes expanded, peak frontier size, path length/cost and wall time per algorithm.
+    With --weighted, every cell gets a random traversal cost in 1..9 (used by Dijkstra and A*).
+
+    Usage:
+        python bench_search.py --sizes 100 300 --seeds 0 1 2
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+from compact_maze import CompactMaze
+from main import MazeSolver
+from search import SEARCHES
+
+
+def build_maze(size: int, seed: int) -> CompactMaze:
+    random.seed(seed)
+    maze = CompactMaze(size, size, (0, random.randrange(size)), (size - 1, random.randrange(size)))
+    deque(maze.generate_gen(), maxlen=0)
+    return maze
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--algorithms", nargs="+", default=list(SEARCHES))
+    parser.add_argument("--weighted", action="store_true", help="random cell costs in 1..9")
+    args = parser.parse_args()
+
+    print(f"{'size':>5} {'seed':>4} {'algorithm':>13} {'expanded':>9} {'frontier':>9} "
+          f"{'length':>7} {'cost':>7} {'time s':>8}")
+    for size in args.sizes:
+        for seed in args.seeds:
+            maze = build_maze(size, seed)
+            cost = None
+            if args.weighted:
+                rng = random.Random(seed)
+                weights = [rng.randint(1, 9) for _ in range(size * size)]
+                cost = lambda cell: weights[cell[1] * size + cell[0]]
+
+            for algorithm in args.algorithms:
+                solver = MazeSolver(maze, algorithm=algorithm, cost=cost)
+                start = time.perf_counter()
+                deque(solver.solve_gen(), maxlen=0)
+                elapsed = time.perf_counter() - start
+                stats = solver.stats
+                print(f"{size:>5} {seed:>4} {algorithm:>13} {stats.expanded:>9} {stats.peak_frontier:>9} "
+                      f"{stats.path_length:>7} {stats.path_cost:>7} {elapsed:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+    Benchmark of MazeIndex against a fresh BFS per query.
+    Builds the index once per maze, then answers random (a, b) queries in batch
+    and reports index build time and queries per second for both approaches.
+
+    Usage:
+        python bench_tree_index.py --sizes 200 1000 --queries 10000
+"""
+
+import argparse
+import random
+import time
+
+from compact_maze import CompactMaze
+from search import SearchStats, bfs
+from tree_index import MazeIndex
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 1000])
+    parser.add_argument("--queries", type=int, default=10000)
+    parser.add_argument("--bfs-queries", type=int, default=20, help="BFS is slow, so it gets fewer queries")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'size':>5} {'build s':>8} {'levels':>6} {'index q/s':>10} {'path q/s':>10} {'bfs q/s':>9} {'agree':>6}")
+    for size in args.sizes:
+        maze = CompactMaze(size, size, (0, 0), (size - 1, size - 1))
+        maze.generate('dfs', args.seed)
+        rng = random.Random(args.seed)
+        cells = [(rng.randrange(size), rng.randrange(size)) for _ in range(2 * args.queries)]
+        pairs = list(zip(cells[::2], cells[1::2]))
+
+        start = time.perf_counter()
+        index = MazeIndex(maze)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        distances = index.distances(pairs)
+        index_qps = len(pairs) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        index.paths(pairs[:args.bfs_queries * 10])
+        path_qps = len(pairs[:args.bfs_queries * 10]) / (time.perf_counter() - start)
+
+        # The same first queries answered by a full BFS each
+        start = time.perf_counter()
+        agree = True
+        for (a, b), expected in zip(pairs[:args.bfs_queries], distances):
+            stats = SearchStats()
+            for _ in bfs(maze, a, b, stats):
+                pass
+            agree &= stats.path_length - 1 == expected
+        bfs_qps = args.bfs_queries / (time.perf_counter() - start)
+
+        print(f"{size:>5} {build:>8.2f} {len(index.up):>6} {index_qps:>10.0f} {path_qps:>10.0f} "
+              f"{bfs_qps:>9.1f} {str(agree):>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+    Correctness checks for the maze solvers, kept apart from the timings in harness.py.
+
+    Unreachable exit: the exit of a small maze of each kind is walled off, and
+    every solver (and CompactMaze.solve_gen) must then finish without a path.
+    Replanning: D* Lite on small mazes with cells cheaper than 1, through random
+    wall and cost edits and agent moves, must keep the cost Dijkstra finds from
+    the agent's cell. Failures are printed and the exit status is 1.
+
+    Usage:
+        python check_search.py
+        python check_search.py --mazes compact --solvers bfs astar --replans 50
+"""
+
+import argparse
+import random
+import sys
+from collections import deque
+
+from dynamic import DStarLite
+from harness import MAZES, SOLVER_NAMES, build_maze, solve
+from main import MazeSolver
+
+
+def check_unreachable(kinds, solvers) -> list[str]:
+    """ Every solver must end with no path when the exit is walled off. Returns the failures. """
+    failures = []
+    for kind in kinds:
+        maze = build_maze(kind, 'animated', 8, 0)
+        x, y = maze.exit
+        for w, (dx, dy) in enumerate(((0, -1), (1, 0), (0, 1), (-1, 0))):
+            if 0 <= x + dx < maze.width and 0 <= y + dy < maze.height:
+                maze.set_wall(x, y, w, True)
+        lengths = {solver: solve(maze, solver)[1] for solver in solvers}
+        if hasattr(maze, 'solve_gen'):
+            lengths['solve_gen'] = sum(step == 'path' for step, _ in maze.solve_gen())
+        for name, length in lengths.items():
+            print(f"{kind:>8} {name:>13} {'FAILED' if length else 'ok'}")
+            if length:
+                failures.append(f"{kind}/{name}: found a path of {length} cells to a walled-off exit")
+    return failures
+
+
+def check_replanning(kinds, mazes: int, size: int = 8) -> list[str]:
+    """ D* Lite path costs after edits and moves against Dijkstra. Returns the failures. """
+    failures = []
+    for kind in kinds:
+        wrong = 0
+        for seed in range(mazes):
+            rng = random.Random(seed)
+            maze = MAZES[kind](size, size, (0, rng.randrange(size)), (size - 1, rng.randrange(size)))
+            maze.generate('kruskal', seed)
+            for _ in range(size * size // 3):
+                maze.set_cost(rng.randrange(size), rng.randrange(size), 0.2)
+            planner = DStarLite(maze)
+            path = planner.plan()
+            for _ in range(3):
+                if path and len(path) > 2:
+                    planner.move_to(path[1])
+                    maze.entrance = path[1]
+                changed = []
+                for _ in range(3):
+                    changed += maze.toggle_wall(rng.randrange(size - 1), rng.randrange(size - 1), rng.choice((1, 2)))
+                    x, y = rng.randrange(size), rng.randrange(size)
+                    maze.set_cost(x, y, rng.choice((0.1, 0.5, 3)))
+                    changed.append((x, y))
+                planner.update(changed)
+                path = planner.plan()
+                dijkstra = MazeSolver(maze, algorithm='dijkstra')
+                deque(dijkstra.solve_gen(), maxlen=0)
+                if path is None:
+                    wrong += dijkstra.stats.path_length != 0
+                else:
+                    wrong += abs(planner.stats.path_cost - dijkstra.stats.path_cost) > 1e-9
+        print(f"{kind:>8} {'D* Lite':>13} {'FAILED' if wrong else 'ok'}")
+        if wrong:
+            failures.append(f"{kind}/D* Lite: {wrong} of {3 * mazes} replans differ from Dijkstra's cost")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mazes", nargs="+", default=list(MAZES), choices=list(MAZES))
+    parser.add_argument("--solvers", nargs="+", default=SOLVER_NAMES, choices=SOLVER_NAMES)
+    parser.add_argument("--replans", type=int, default=200, help="mazes in the D* Lite check")
+    args = parser.parse_args()
+
+    failures = check_unreachable(args.mazes, args.solvers) + check_replanning(args.mazes, args.replans)
+    for line in failures:
+        print("FAILED", line)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+    Array-backed maze representation.
+
+    The four walls of a cell are packed into the low bits of one byte
+    (bit 0 top, bit 1 right, bit 2 bottom, bit 3 left, same order as Maze.walls),
+    and cells are addressed by the flat index y * width + x. A 1000x1000 maze
+    takes 2 MB (walls + visited) instead of several hundred MB of dict and lists.
+"""
+
+import random
+from array import array
+from collections import deque
+from collections.abc import Set
+
+TOP, RIGHT, BOTTOM, LEFT = 1, 2, 4, 8
+ALL_WALLS = TOP | RIGHT | BOTTOM | LEFT
+WALL_BITS = (TOP, RIGHT, BOTTOM, LEFT)
+
+
+class VisitedView(Set):
+    """ Read-only set of (x, y) tuples over a visited bytearray, so visualize can iterate it """
+    def __init__(self, flags: bytearray, width: int):
+        self._flags = flags
+        self._width = width
+
+    def __contains__(self, cell):
+        x, y = cell
+        return 0 <= x < self._width and bool(self._flags[y * self._width + x])
+
+    def __iter__(self):
+        width = self._width
+        index = self._flags.find(1)
+        while index != -1:
+            yield index % width, index // width
+            index = self._flags.find(1, index + 1)
+
+    def __len__(self):
+        return self._flags.count(1)
+
+
+class CompactMaze:
+    """ Same interface as Maze, but walls and visited flags live in bytearrays indexed by flat cell index """
+    def __init__(self, width: int, height: int, entrance: tuple[int,int], exit: tuple[int,int]):
+        self.width    = width
+        self.height   = height
+        self.entrance = entrance
+        self.exit     = exit
+
+        # wall_bits[y * width + x] = TOP | RIGHT | BOTTOM | LEFT for the walls that are present
+        self.wall_bits = bytearray([ALL_WALLS]) * (width * height)
+        self.visited_flags = bytearray(width * height)
+        self.seed = None  # seed of the last generate(), if any
+        self.costs = {}   # costs[(x, y)] = price of entering the cell, 1 when missing
+
+    def generate(self, algorithm: str = 'dfs', seed=None):
+        """ Generates the whole maze at once, see generation.py. The same seed gives the same maze. """
+        from generation import generate_walls  # generation.py imports this module
+        self.wall_bits = generate_walls(self.width, self.height, algorithm, seed, self.entrance)
+        self.visited_flags = bytearray([1]) * (self.width * self.height)
+        self.seed = seed
+
+    @property
+    def visited(self) -> VisitedView:
+        return VisitedView(self.visited_flags, self.width)
+
+    def index(self, x: int, y: int) -> int:
+        return y * self.width + x
+
+    def has_wall(self, x: int, y: int, w: int) -> bool:
+        return bool(self.wall_bits[y * self.width + x] & WALL_BITS[w])
+
+    def cell_walls(self, x: int, y: int) -> tuple[bool, bool, bool, bool]:
+        bits = self.wall_bits[y * self.width + x]
+        return bool(bits & TOP), bool(bits & RIGHT), bool(bits & BOTTOM), bool(bits & LEFT)
+
+    def set_wall(self, x: int, y: int, w: int, present: bool) -> tuple:
+        """ Adds or removes wall w of cell (x, y), on both sides. Returns the two cells it separates. """
+        dx, dy = ((0, -1), (1, 0), (0, 1), (-1, 0))[w]
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < self.width and 0 <= ny < self.height):
+            raise ValueError(f"wall {w} of {(x, y)} is an outer wall")
+        bit, other = WALL_BITS[w], WALL_BITS[(w + 2) % 4]
+        i, j = self.index(x, y), self.index(nx, ny)
+        if present:
+            self.wall_bits[i] |= bit
+            self.wall_bits[j] |= other
+        else:
+            self.wall_bits[i] &= ~bit
+            self.wall_bits[j] &= ~other
+        return (x, y), (nx, ny)
+
+    def toggle_wall(self, x: int, y: int, w: int) -> tuple:
+        return self.set_wall(x, y, w, not self.has_wall(x, y, w))
+
+    def set_cost(self, x: int, y: int, cost: float):
+        """ Price of entering cell (x, y), used by Dijkstra, A* and D* Lite """
+        self.costs[(x, y)] = cost
+
+    def cost(self, cell: tuple[int, int]) -> float:
+        return self.costs.get(cell, 1)
+
+    def generate_gen(self):
+        """ Uses DFS to generate maze. It is a generator function, yields each step.
+            Consumes the random module exactly like Maze.generate_gen, so a seed gives the same maze,
+            and yields the same tuples of changed (x, y) cells. """
+        width, height = self.width, self.height
+        walls, visited = self.wall_bits, self.visited_flags
+
+        start = self.index(*self.entrance)
+        stack = [start]
+        visited[:] = bytes(len(visited))
+        visited[start] = 1
+
+        while stack:
+            current = stack[-1]
+            cx, cy = current % width, current // width
+
+            # (dx, dy, wall bit on the current cell, wall bit on the neighbor, flat offset)
+            neighbors = [
+                (0, -1, TOP,    BOTTOM, -width),
+                (1,  0, RIGHT,  LEFT,    1),
+                (0,  1, BOTTOM, TOP,     width),
+                (-1, 0, LEFT,   RIGHT,  -1),
+            ]
+            random.shuffle(neighbors)
+
+            carved = False
+            for dx, dy, w, ow, offset in neighbors:
+                nx, ny = cx + dx, cy + dy
+                neighbor = current + offset
+                if 0 <= nx < width and 0 <= ny < height and not visited[neighbor]:
+                    walls[current] &= ~w
+                    walls[neighbor] &= ~ow
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+                    carved = True
+                    yield ((cx, cy), (nx, ny))
+                    break
+
+            if not carved:
+                stack.pop()
+                yield ()
+
+        yield ()
+
+    def solve_gen(self):
+        """ BFS from entrance to exit on flat indices, with the same ('visit', cell) / ('path', cell)
+            events as MazeSolver.solve_gen. Parents are kept in an array instead of a dict. """
+        width = self.width
+        walls = self.wall_bits
+        start = self.index(*self.entrance)
+        goal = self.index(*self.exit)
+
+        came_from = array("i", [-1]) * len(walls)  # -1 = not reached yet
+        came_from[start] = start
+        queue = deque([start])
+        moves = ((TOP, -width), (RIGHT, 1), (BOTTOM, width), (LEFT, -1))
+
+        while queue:
+            current = queue.popleft()
+            yield ('visit', (current % width, current // width))
+            if current == goal:
+                break
+
+            bits = walls[current]
+            for wall, offset in moves:
+                # Outer walls are never carved, so an open side always leads inside the maze
+                if not bits & wall:
+                    neighbor = current + offset
+                    if came_from[neighbor] == -1:
+                        came_from[neighbor] = current
+                        queue.append(neighbor)
+
+        if came_from[goal] == -1:
+            return  # walled off: no 'path' events, like search.py's strategies
+
+        path = [goal]
+        while path[-1] != start:
+            path.append(came_from[path[-1]])
+        path.reverse()
+
+        for index in path:
+            yield ('path', (index % width, index // width))
@@ -0,0 +1,152 @@
+"""
+    Incremental replanning with D* Lite (Koenig & Likhachev).
+
+    The planner searches backwards from the goal and keeps, for every cell it
+    has touched, g (current estimate of the cost to the goal) and rhs (one-step
+    lookahead from the neighbors). After walls are toggled or cell costs change,
+    only the cells whose rhs changed are put back on the queue, so a small edit
+    far from the agent costs a handful of expansions instead of a new search.
+    Moving the agent only bumps the key modifier `km`, the queue is not rebuilt.
+
+        planner = DStarLite(maze)
+        path = planner.plan()
+        changed = maze.toggle_wall(x, y, w)    # or maze.set_cost(x, y, c) -> [(x, y)]
+        planner.update(changed)
+        planner.move_to(path[3])
+        path = planner.plan()
+"""
+
+import heapq
+
+from search import SearchStats, open_neighbors
+
+INF = float('inf')
+
+
+class DStarLite:
+    """ Shortest path from `start` to `goal` that is repaired after maze edits instead of recomputed.
+        The price of entering a cell is maze.cost(cell). The Manhattan heuristic is scaled by the
+        cheapest cell cost, taken from the maze's costs as search.astar does and lowered when an
+        update brings a cheaper one. `min_cost` overrides it and must not exceed any cell cost. """
+    def __init__(self, maze, start: tuple[int, int] = None, goal: tuple[int, int] = None, min_cost: float = None):
+        self.maze     = maze
+        self.start    = start or maze.entrance
+        self.goal     = goal or maze.exit
+        self.fixed    = min_cost is not None
+        self.min_cost = min_cost if self.fixed else self._cheapest()
+        self.km       = 0  # sum of heuristic distances the start moved by
+        self.stats    = SearchStats()  # expansions accumulate over every plan()
+
+        self.g   = {}
+        self.rhs = {self.goal: 0}
+        self.queued = {}  # cell -> its key in the heap; heap entries with another key are stale
+        self.heap = []
+        self._push(self.goal)
+
+    def _cost(self, cell) -> float:
+        cost = getattr(self.maze, 'cost', None)
+        return cost(cell) if cost else 1
+
+    def _cheapest(self) -> float:
+        costs = getattr(self.maze, 'costs', None)
+        return min(1, *costs.values()) if costs else 1
+
+    def _heuristic(self, a, b) -> float:
+        return (abs(a[0] - b[0]) + abs(a[1] - b[1])) * self.min_cost
+
+    def _key(self, cell) -> tuple:
+        best = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        # Rounded: with fractional costs, sums that are equal may differ in the last bit, and
+        # the first part must then tie so that the second decides (as in exact arithmetic)
+        return (round(best + self._heuristic(self.start, cell) + self.km, 9), round(best, 9))
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self.queued[cell] = key
+        heapq.heappush(self.heap, (key, cell))
+
+    def _top_key(self) -> tuple:
+        # Drop stale entries so the top is a real one
+        heap, queued = self.heap, self.queued
+        while heap and queued.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else (INF, INF)
+
+    def _update_vertex(self, cell):
+        if cell != self.goal:
+            self.rhs[cell] = min((self._cost(n) + self.g.get(n, INF) for n in open_neighbors(self.maze, cell)),
+                                 default=INF)
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self._push(cell)
+        else:
+            self.queued.pop(cell, None)
+
+    def _compute(self):
+        g, rhs, stats = self.g, self.rhs, self.stats
+        while self._top_key() < self._key(self.start) or g.get(self.start, INF) != rhs.get(self.start, INF):
+            stats.peak_frontier = max(stats.peak_frontier, len(self.queued))
+            old_key, cell = heapq.heappop(self.heap)
+            new_key = self._key(cell)
+            if old_key < new_key:
+                self._push(cell)  # the key went up since it was queued (km grew), requeue
+                continue
+
+            del self.queued[cell]
+            stats.expanded += 1
+            if g.get(cell, INF) > rhs.get(cell, INF):
+                g[cell] = rhs[cell]  # overconsistent: settle it
+                for neighbor in open_neighbors(self.maze, cell):
+                    self._update_vertex(neighbor)
+            else:
+                g[cell] = INF  # underconsistent: reset and recompute it together with its neighbors
+                self._update_vertex(cell)
+                for neighbor in open_neighbors(self.maze, cell):
+                    self._update_vertex(neighbor)
+
+    def plan(self):
+        """ Brings the plan up to date and returns the path from start to goal, or None if there is none """
+        self._compute()
+        if self.g.get(self.start, INF) == INF:
+            return None
+
+        path = [self.start]
+        cell = self.start
+        limit = self.maze.width * self.maze.height
+        while cell != self.goal and len(path) <= limit:
+            cell = min(open_neighbors(self.maze, cell), key=lambda n: self._cost(n) + self.g.get(n, INF))
+            path.append(cell)
+        self.stats.path_length = len(path)
+        self.stats.path_cost = self.g[self.start]
+        return path
+
+    def update(self, cells):
+        """ Tells the planner that walls or costs around these cells changed.
+            Pass the two cells of a toggled wall, or the cell whose cost changed. """
+        touched = set()
+        for cell in cells:
+            touched.add(cell)
+            # All grid neighbors, not open_neighbors: a wall that just went up hides the old one
+            x, y = cell
+            for nx, ny in ((x, y - 1), (x + 1, y), (x, y + 1), (x - 1, y)):
+                if 0 <= nx < self.maze.width and 0 <= ny < self.maze.height:
+                    touched.add((nx, ny))
+        for cell in touched:
+            self._update_vertex(cell)
+        cheapest = self.min_cost if self.fixed else self._cheapest()
+        if cheapest < self.min_cost:
+            # A smaller heuristic changes every key: re-key the queue from the current start
+            self.min_cost, self.km = cheapest, 0
+            for cell in self.queued:
+                self.queued[cell] = self._key(cell)
+            self.heap = [(key, cell) for cell, key in self.queued.items()]
+            heapq.heapify(self.heap)
+
+    def move_to(self, cell: tuple[int, int]):
+        """ The agent moved: later keys are offset by km instead of re-keying the whole queue """
+        self.km += self._heuristic(self.start, cell)
+        self.start = cell
+
+    def solve_gen(self):
+        """ Same events as MazeSolver.solve_gen: plans (or replans) and yields the path """
+        for cell in self.plan() or ():
+            yield ('path', cell)
@@ -0,0 +1,212 @@
+"""
+    Bulk maze generation without per-step yields.
+
+    Every algorithm runs to completion on a flat bytearray of wall bits (the
+    layout of CompactMaze: one byte per cell, TOP | RIGHT | BOTTOM | LEFT) and
+    takes a `random.Random`, so the same seed always gives the same maze.
+
+        dfs     - randomized depth-first search (recursive backtracker), iterative
+        kruskal - random spanning tree with union-find over the shuffled walls
+        wilson  - loop-erased random walks, uniform over all spanning trees
+        eller   - row by row with set labels; only one row is kept in memory,
+                  so `eller_rows` can stream mazes taller than memory
+"""
+
+import random
+from array import array
+
+from compact_maze import ALL_WALLS, BOTTOM, LEFT, RIGHT, TOP
+
+# (wall on the cell, wall on the neighbor)
+OPPOSITE = {TOP: BOTTOM, RIGHT: LEFT, BOTTOM: TOP, LEFT: RIGHT}
+
+
+def _moves(index: int, width: int, height: int):
+    """ Returns (neighbor index, wall on the cell, wall on the neighbor) for every in-bounds neighbor """
+    x, y = index % width, index // width
+    moves = []
+    if y > 0:
+        moves.append((index - width, TOP, BOTTOM))
+    if x < width - 1:
+        moves.append((index + 1, RIGHT, LEFT))
+    if y < height - 1:
+        moves.append((index + width, BOTTOM, TOP))
+    if x > 0:
+        moves.append((index - 1, LEFT, RIGHT))
+    return moves
+
+
+def dfs(width: int, height: int, rng: random.Random, start: tuple[int, int] = (0, 0)) -> bytearray:
+    walls = bytearray([ALL_WALLS]) * (width * height)
+    visited = bytearray(width * height)
+    first = start[1] * width + start[0]
+    visited[first] = 1
+    stack = [first]
+
+    size = width * height
+    while stack:
+        current = stack[-1]
+        x = current % width
+
+        # Only the unvisited neighbors are collected, then one is drawn at random
+        options = []
+        if current >= width and not visited[current - width]:
+            options.append((current - width, TOP, BOTTOM))
+        if x < width - 1 and not visited[current + 1]:
+            options.append((current + 1, RIGHT, LEFT))
+        if current + width < size and not visited[current + width]:
+            options.append((current + width, BOTTOM, TOP))
+        if x > 0 and not visited[current - 1]:
+            options.append((current - 1, LEFT, RIGHT))
+        if not options:
+            stack.pop()
+            continue
+        neighbor, w, ow = options[rng.randrange(len(options))]
+        walls[current] &= ~w
+        walls[neighbor] &= ~ow
+        visited[neighbor] = 1
+        stack.append(neighbor)
+
+    return walls
+
+
+def kruskal(width: int, height: int, rng: random.Random) -> bytearray:
+    walls = bytearray([ALL_WALLS]) * (width * height)
+    parent = array("i", range(width * height))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    # Every interior wall, as (cell, direction): RIGHT to the cell on the right, BOTTOM to the one below
+    edges = [(i, RIGHT) for i in range(width * height) if i % width < width - 1]
+    edges += [(i, BOTTOM) for i in range(width * (height - 1))]
+    rng.shuffle(edges)
+
+    remaining = width * height - 1
+    for cell, w in edges:
+        neighbor = cell + 1 if w == RIGHT else cell + width
+        a, b = find(cell), find(neighbor)
+        if a != b:
+            parent[a] = b
+            walls[cell] &= ~w
+            walls[neighbor] &= ~OPPOSITE[w]
+            remaining -= 1
+            if not remaining:
+                break
+
+    return walls
+
+
+def wilson(width: int, height: int, rng: random.Random) -> bytearray:
+    n = width * height
+    walls = bytearray([ALL_WALLS]) * n
+    in_tree = bytearray(n)
+    in_tree[rng.randrange(n)] = 1
+    step = array("i", [0]) * n  # last move taken out of a cell during the current walk
+
+    for origin in range(n):
+        if in_tree[origin]:
+            continue
+
+        # Random walk until the tree is hit. Overwriting step[] on revisits erases the loops.
+        current = origin
+        while not in_tree[current]:
+            moves = _moves(current, width, height)
+            choice = rng.randrange(len(moves))
+            step[current] = choice
+            current = moves[choice][0]
+
+        # Retrace the loop-erased walk and add it to the tree
+        current = origin
+        while not in_tree[current]:
+            moves = _moves(current, width, height)
+            neighbor, w, ow = moves[step[current]]
+            walls[current] &= ~w
+            walls[neighbor] &= ~ow
+            in_tree[current] = 1
+            current = neighbor
+
+    return walls
+
+
+def eller_rows(width: int, height: int, rng: random.Random):
+    """ Yields the maze one row at a time, as `width` bytes of wall bits """
+    labels = list(range(width))
+    next_label = width
+    open_top = bytearray(width)  # cells whose top wall was carved from the row above
+
+    for y in range(height):
+        last = y == height - 1
+        row = bytearray([ALL_WALLS]) * width
+        for x in range(width):
+            if open_top[x]:
+                row[x] &= ~TOP
+
+        # Members of each label in this row, so merging touches only the smaller set
+        members = {}
+        for x, label in enumerate(labels):
+            members.setdefault(label, []).append(x)
+
+        # Join neighbors in different sets at random (always on the last row)
+        for x in range(width - 1):
+            a, b = labels[x], labels[x + 1]
+            if a != b and (last or rng.random() < 0.5):
+                row[x] &= ~RIGHT
+                row[x + 1] &= ~LEFT
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for cell in members[b]:
+                    labels[cell] = a
+                members[a].extend(members.pop(b))
+
+        if last:
+            yield bytes(row)
+            return
+
+        # Each set carves down at least once; cells not carved into get fresh labels
+        open_top = bytearray(width)
+        for cells in members.values():
+            down = [x for x in cells if rng.random() < 0.5] or [cells[rng.randrange(len(cells))]]
+            for x in down:
+                row[x] &= ~BOTTOM
+                open_top[x] = 1
+        for x in range(width):
+            if not open_top[x]:
+                labels[x] = next_label
+                next_label += 1
+
+        yield bytes(row)
+
+
+def eller(width: int, height: int, rng: random.Random) -> bytearray:
+    walls = bytearray()
+    for row in eller_rows(width, height, rng):
+        walls += row
+    return walls
+
+
+def write_eller(f, width: int, height: int, seed=None):
+    """ Streams an Eller maze into a binary file object, one row of wall bytes at a time """
+    rng = random.Random(seed)
+    for row in eller_rows(width, height, rng):
+        f.write(row)
+
+
+GENERATORS = {
+    'dfs': dfs,
+    'kruskal': kruskal,
+    'wilson': wilson,
+    'eller': eller,
+}
+
+
+def generate_walls(width: int, height: int, algorithm: str = 'dfs', seed=None,
+                   start: tuple[int, int] = (0, 0)) -> bytearray:
+    """ Runs one algorithm to completion and returns the flat wall bytes """
+    rng = random.Random(seed)
+    if algorithm == 'dfs':
+        return dfs(width, height, rng, start)
+    return GENERATORS[algorithm](width, height, rng)
@@ -0,0 +1,189 @@
+"""
+    Headless benchmark harness: generates mazes over a grid of sizes, seeds and
+    generators, runs every solver on each one and records wall time, peak memory
+    (tracemalloc), cells visited and path length. Nothing here opens a window.
+
+    Results go to JSON or CSV. With --baseline, every row is compared with the
+    row of the same (maze, generator, size, seed, solver) in a stored run. Rows
+    that got slower or bigger than --tolerance, or whose visited count or path
+    length changed, are printed and the exit status is 1, so CI can fail on it.
+
+    Usage:
+        python harness.py --sizes 50 200 --seeds 0 1 2 --out results.json
+        python harness.py --sizes 50 200 --seeds 0 1 2 --baseline results.json
+"""
+
+import argparse
+import csv
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from compact_maze import CompactMaze
+from generation import GENERATORS
+from main import Maze, MazeSolver
+from search import SEARCHES
+from tree_index import MazeIndex
+
+MAZES = {'dict': Maze, 'compact': CompactMaze}
+# 'animated' is the step-by-step generate_gen, seeded through the global random module
+GENERATOR_NAMES = ['animated'] + list(GENERATORS)
+# 'index' answers the query from a MazeIndex built for the maze (build time included)
+SOLVER_NAMES = list(SEARCHES) + ['index']
+
+FIELDS = ["maze", "generator", "size", "seed", "solver", "gen_seconds", "gen_peak_mb",
+          "solve_seconds", "solve_peak_mb", "visited", "path_length"]
+KEY = ("maze", "generator", "size", "seed", "solver")
+
+
+def measure(run, memory: bool = True, repeat: int = 3):
+    """ Runs `run()` and returns (result, seconds, peak MB). Seconds is the best of `repeat` runs.
+        Memory comes from a separate run because tracemalloc slows allocation down,
+        so `run` must be deterministic. """
+    seconds = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = run()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    peak = 0.0
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def build_maze(kind: str, generator: str, size: int, seed: int):
+    rng = random.Random(seed)
+    maze = MAZES[kind](size, size, (0, rng.randrange(size)), (size - 1, rng.randrange(size)))
+    if generator == 'animated':
+        random.seed(seed)
+        deque(maze.generate_gen(), maxlen=0)
+    else:
+        maze.generate(generator, seed)
+    return maze
+
+
+def solve(maze, solver: str) -> tuple[int, int]:
+    """ Returns (cells visited, path length) """
+    if solver == 'index':
+        path = MazeIndex(maze).path(maze.entrance, maze.exit)
+        return 0, len(path or ())
+    runner = MazeSolver(maze, algorithm=solver)
+    deque(runner.solve_gen(), maxlen=0)
+    return runner.stats.expanded, runner.stats.path_length
+
+
+def run_grid(kinds, generators, sizes, seeds, solvers, memory: bool = True, repeat: int = 3):
+    """ Yields one result row per (maze kind, generator, size, seed, solver) """
+    for kind in kinds:
+        for generator in generators:
+            for size in sizes:
+                for seed in seeds:
+                    maze, gen_seconds, gen_peak = measure(lambda: build_maze(kind, generator, size, seed),
+                                                          memory, repeat)
+                    for solver in solvers:
+                        (visited, length), seconds, peak = measure(lambda: solve(maze, solver), memory, repeat)
+                        yield {
+                            "maze": kind, "generator": generator, "size": size, "seed": seed,
+                            "solver": solver,
+                            "gen_seconds": round(gen_seconds, 6), "gen_peak_mb": round(gen_peak, 3),
+                            "solve_seconds": round(seconds, 6), "solve_peak_mb": round(peak, 3),
+                            "visited": visited, "path_length": length,
+                        }
+
+
+def write_results(rows: list[dict], path: str):
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=1)
+
+
+def read_results(path: str) -> list[dict]:
+    if path.endswith(".csv"):
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            for field in FIELDS:
+                if field not in ("maze", "generator", "solver"):
+                    row[field] = float(row[field])
+        return rows
+    with open(path) as f:
+        return json.load(f)
+
+
+def regressions(rows: list[dict], baseline: list[dict], tolerance: float, min_seconds: float) -> list[str]:
+    """ Describes every row that is slower, bigger or different from its baseline row.
+        Differences below `min_seconds` are ignored, they are timer noise. """
+    previous = {tuple(row[k] for k in KEY): row for row in baseline}
+    found = []
+    for row in rows:
+        key = tuple(row[k] for k in KEY)
+        old = previous.get(key)
+        if old is None:
+            continue
+        name = "/".join(map(str, key))
+        for field in ("visited", "path_length"):
+            if row[field] != old[field]:
+                found.append(f"{name}: {field} changed {old[field]:g} -> {row[field]:g}")
+        for field in ("gen_seconds", "solve_seconds"):
+            if row[field] > old[field] * (1 + tolerance) and row[field] - old[field] > min_seconds:
+                found.append(f"{name}: {field} {old[field]:.4f} -> {row[field]:.4f}")
+        for field in ("gen_peak_mb", "solve_peak_mb"):
+            if old[field] and row[field] > old[field] * (1 + tolerance):
+                found.append(f"{name}: {field} {old[field]:.2f} -> {row[field]:.2f}")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--mazes", nargs="+", default=['compact'], choices=list(MAZES))
+    parser.add_argument("--generators", nargs="+", default=['animated'], choices=GENERATOR_NAMES)
+    parser.add_argument("--solvers", nargs="+", default=SOLVER_NAMES, choices=SOLVER_NAMES)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per measurement, the best one counts")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--out", help="output file, .json or .csv")
+    parser.add_argument("--baseline", help="earlier results (.json or .csv) to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown / growth")
+    parser.add_argument("--min-seconds", type=float, default=0.02, help="ignore time differences below this")
+    args = parser.parse_args()
+
+    print(f"{'maze':>8} {'generator':>9} {'size':>5} {'seed':>4} {'solver':>13} {'gen s':>8} {'gen MB':>7} "
+          f"{'solve s':>8} {'solve MB':>8} {'visited':>8} {'path':>6}")
+    rows = []
+    for row in run_grid(args.mazes, args.generators, args.sizes, args.seeds, args.solvers,
+                       not args.no_memory, args.repeat):
+        rows.append(row)
+        print(f"{row['maze']:>8} {row['generator']:>9} {row['size']:>5} {row['seed']:>4} {row['solver']:>13} "
+              f"{row['gen_seconds']:>8.3f} {row['gen_peak_mb']:>7.1f} {row['solve_seconds']:>8.3f} "
+              f"{row['solve_peak_mb']:>8.1f} {row['visited']:>8} {row['path_length']:>6}")
+
+    if args.out:
+        write_results(rows, args.out)
+
+    if args.baseline:
+        found = regressions(rows, read_results(args.baseline), args.tolerance, args.min_seconds)
+        for line in found:
+            print("REGRESSION", line)
+        print(f"{len(found)} regressions against {args.baseline}")
+        if found:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
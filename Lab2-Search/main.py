@@ -7,8 +7,13 @@
 import random
 import pygame
 import sys
+import time
 from collections import deque
 
+from compact_maze import BOTTOM, LEFT, RIGHT, TOP
+from generation import generate_walls
+from search import MOVES, SEARCHES, SearchStats
+
 CELL_SIZE            = 20
 WALL_COLOR           = (30, 30, 30)
 BG_COLOR             = (240, 240, 240)
@@ -28,16 +33,60 @@ class Maze:
         self.entrance = entrance
         self.exit     = exit
         self.visited = set() # keep track of visited cells
+        self.seed = None     # seed of the last generate(), if any
+        self.costs = {}      # costs[(x,y)] = price of entering the cell, 1 when missing
 
         # walls[(x,y)] = [top, right, bottom, left] - keeps track of whether wall is present
         self.walls = {
             (x, y): [True, True, True, True]
             for y in range(height) for x in range(width)
         }
-        
+
+    def generate(self, algorithm: str = 'dfs', seed=None):
+        """ Generates the whole maze at once, without per-step yields (see generation.py).
+            algorithm: 'dfs', 'kruskal', 'wilson' or 'eller'. The same seed gives the same maze. """
+        self.load_wall_bits(generate_walls(self.width, self.height, algorithm, seed, self.entrance))
+        self.seed = seed
+
+    def load_wall_bits(self, bits: bytes):
+        """ Fills `walls` from flat wall bytes in the CompactMaze layout (y * width + x, TOP | RIGHT | BOTTOM | LEFT) """
+        masks = (TOP, RIGHT, BOTTOM, LEFT)
+        for y in range(self.height):
+            for x in range(self.width):
+                b = bits[y * self.width + x]
+                self.walls[(x, y)] = [bool(b & m) for m in masks]
+        self.visited = set(self.walls)
+
+    def has_wall(self, x: int, y: int, w: int) -> bool:
+        """ Whether wall w (0 top, 1 right, 2 bottom, 3 left) of cell (x, y) is present """
+        return self.walls[(x, y)][w]
+
+    def cell_walls(self, x: int, y: int) -> tuple[bool, bool, bool, bool]:
+        return tuple(self.walls[(x, y)])
+
+    def set_wall(self, x: int, y: int, w: int, present: bool) -> tuple:
+        """ Adds or removes wall w of cell (x, y), on both sides. Returns the two cells it separates. """
+        dx, dy, _ = MOVES[w]
+        nx, ny = x + dx, y + dy
+        if not (0 <= nx < self.width and 0 <= ny < self.height):
+            raise ValueError(f"wall {w} of {(x, y)} is an outer wall")
+        self.walls[(x, y)][w] = present
+        self.walls[(nx, ny)][(w + 2) % 4] = present
+        return (x, y), (nx, ny)
+
+    def toggle_wall(self, x: int, y: int, w: int) -> tuple:
+        return self.set_wall(x, y, w, not self.walls[(x, y)][w])
+
+    def set_cost(self, x: int, y: int, cost: float):
+        """ Price of entering cell (x, y), used by Dijkstra, A* and D* Lite """
+        self.costs[(x, y)] = cost
+
+    def cost(self, cell: tuple[int, int]) -> float:
+        return self.costs.get(cell, 1)
 
     def generate_gen(self):
-        """ Uses DFS to generate maze. It is a generator function, yields each step. """
+        """ Uses DFS to generate maze. It is a generator function, yields each step
+            as the tuple of cells it changed (empty when only backtracking). """
         # DFS
         stack = [self.entrance]
         self.visited = {self.entrance}
@@ -68,24 +117,40 @@ class Maze:
                     self.visited.add((nx, ny))
                     stack.append((nx, ny))
                     carved = True
-                    yield  # one step of carving
+                    yield ((cx, cy), (nx, ny))  # one step of carving
                     break  # update the current cell
 
             if not carved:
                 # Means all cells around have been visited, or out of bounce => go back 
                 stack.pop()
-                yield  # backtracking step
+                yield ()  # backtracking step
 
-        yield
+        yield ()
 
 class MazeSolver:
-    """ Solves a maze using BFS step by step """
-    def __init__(self, maze: Maze):
+    """ Solves a maze step by step, with BFS by default. Works with Maze and CompactMaze.
+
+        `algorithm` is a name from search.SEARCHES ('bfs', 'astar', 'bidirectional', 'dijkstra')
+        or any generator function with the same signature. `cost(cell)` weights cells for
+        Dijkstra and A* (the maze's own set_cost values when omitted).
+        Counters of the last run are in `stats`. """
+    def __init__(self, maze: Maze, algorithm='bfs', cost=None):
         self.maze   = maze
         self.width  = maze.width
         self.height = maze.height
+        self.algorithm = algorithm
+        self.cost   = cost
+        self.stats  = SearchStats()
 
     def solve_gen(self):
+        self.stats = SearchStats()
+        # Costs set on the maze itself count when no cost function was given
+        cost = self.cost or (self.maze.cost if getattr(self.maze, 'costs', None) else None)
+        if self.algorithm != 'bfs':
+            search = SEARCHES[self.algorithm] if isinstance(self.algorithm, str) else self.algorithm
+            yield from search(self.maze, self.maze.entrance, self.maze.exit, self.stats, cost=cost)
+            return
+
         start = self.maze.entrance
         goal  = self.maze.exit
         queue = deque([start])
@@ -93,7 +158,9 @@ class MazeSolver:
 
         # BFS
         while queue:
+            self.stats.peak_frontier = max(self.stats.peak_frontier, len(queue))
             current = queue.popleft()
+            self.stats.expanded += 1
 
             # yield a “visit” event so the visualizer can color it
             yield ('visit', current)
@@ -105,13 +172,16 @@ class MazeSolver:
             cx, cy = current
             for dx, dy, w_idx in [(0,-1,0),(1,0,1),(0,1,2),(-1,0,3)]:
                 # Visit each neighbor 
-                if not self.maze.walls[(cx, cy)][w_idx]:
+                if not self.maze.has_wall(cx, cy, w_idx):
                     # If can get to this neighbor (i.e. there is no wall)
                     nx, ny = cx + dx, cy + dy
                     if 0 <= nx < self.width and 0 <= ny < self.height and (nx,ny) not in came_from:
                         came_from[(nx,ny)] = current
                         queue.append((nx,ny))
 
+        if goal not in came_from:
+            return  # no path, so no 'path' events
+
         # reconstruct path
         path = []
         node = goal
@@ -119,13 +189,111 @@ class MazeSolver:
             path.append(node)
             node = came_from[node]
         path.reverse()
+        self.stats.path_length = len(path)
+        self.stats.path_cost = sum(cost(cell) for cell in path[1:]) if cost else len(path) - 1
 
         for cell in path:
             # yield "coloring path" event
             yield ('path', cell)
 
+class MazeRenderer:
+    """ Keeps the picture of the maze on an off-screen surface and repaints only the cells marked dirty,
+        so the cost of a frame depends on how much changed, not on the size of the maze. """
+    def __init__(self, screen, maze: Maze, cell_size: int = CELL_SIZE):
+        self.screen = screen
+        self.maze = maze
+        self.size = cell_size
+        self.surface = pygame.Surface(screen.get_size())
+        self.solver_visited = set()
+        self.solution_path  = set()
+        self.dirty = set()
+        self.paint_cost = 20e-6  # running estimate of seconds per repainted cell
+        self.paint_all()
+
+    def paint_all(self):
+        """ Paints the whole maze once: cell fills, then every wall drawn a single time """
+        maze, size, surface = self.maze, self.size, self.surface
+        surface.fill(BG_COLOR)
+        for x, y in maze.visited:
+            surface.fill(GEN_VISITED_COLOR, (x*size, y*size, size, size))
+        for y in range(maze.height):
+            for x in range(maze.width):
+                self._draw_walls(x, y)
+        self._draw_marks()
+        self.screen.blit(surface, (0, 0))
+        pygame.display.flip()
+
+    def _draw_walls(self, x: int, y: int):
+        size = self.size
+        top, right, bottom, left = self.maze.cell_walls(x, y)
+        sx, sy = x * size, y * size
+        if top:
+            pygame.draw.line(self.surface, WALL_COLOR, (sx, sy), (sx+size, sy))
+        if right:
+            pygame.draw.line(self.surface, WALL_COLOR, (sx+size, sy), (sx+size, sy+size))
+        if bottom:
+            pygame.draw.line(self.surface, WALL_COLOR, (sx, sy+size), (sx+size, sy+size))
+        if left:
+            pygame.draw.line(self.surface, WALL_COLOR, (sx, sy), (sx, sy+size))
+
+    def _draw_marks(self):
+        size = self.size
+        for (x, y), color in ((self.maze.entrance, ENTRANCE_COLOR), (self.maze.exit, EXIT_COLOR)):
+            self.surface.fill(color, (x*size, y*size, size, size))
+
+    def paint_cell(self, x: int, y: int) -> pygame.Rect:
+        """ Repaints one cell on the off-screen surface and returns its rect """
+        maze, size, surface = self.maze, self.size, self.surface
+        rect = pygame.Rect(x*size, y*size, size, size)
+        surface.set_clip(rect)
+
+        if (x, y) in self.solver_visited:
+            color = SOL_VISITED_COLOR
+        elif (x, y) in maze.visited:
+            color = GEN_VISITED_COLOR
+        else:
+            color = BG_COLOR
+        surface.fill(color, rect)
+        if (x, y) in self.solution_path:
+            surface.fill(PATH_COLOR, (x*size + size//4, y*size + size//4, size//2, size//2))
+
+        # Walls of the neighbors touch this rect too (shared edges and corners), the clip keeps them inside
+        for nx, ny in ((x, y), (x, y-1), (x+1, y), (x, y+1), (x-1, y)):
+            if 0 <= nx < maze.width and 0 <= ny < maze.height:
+                self._draw_walls(nx, ny)
+        if (x, y) == maze.entrance or (x, y) == maze.exit:
+            self._draw_marks()
+
+        surface.set_clip(None)
+        return rect
+
+    def apply(self, event):
+        """ Records one generator event: a tuple of changed cells, or a solver ('visit' | 'path', cell) """
+        if event and isinstance(event[0], str):
+            tag, cell = event
+            (self.solver_visited if tag == 'visit' else self.solution_path).add(cell)
+            self.dirty.add(cell)
+        elif event:
+            self.dirty.update(event)
+
+    def flush(self):
+        """ Repaints the dirty cells and pushes only their rects to the display """
+        if not self.dirty:
+            return
+        start = time.perf_counter()
+        rects = [self.paint_cell(x, y) for x, y in self.dirty]
+        self.dirty.clear()
+        for rect in rects:
+            self.screen.blit(self.surface, rect, rect)
+        if len(rects) > 256:
+            pygame.display.flip()  # many small updates cost more than one full one
+        else:
+            pygame.display.update(rects)
+        self.paint_cost = 0.8 * self.paint_cost + 0.2 * (time.perf_counter() - start) / len(rects)
+
+
 def visualize(maze: Maze, solve_gen):
-    """ Visualize generation and solving in pygame """
+    """ Visualize generation and solving in pygame. `maze` can be a Maze or a CompactMaze. """
     pygame.init()
     screen = pygame.display.set_mode((maze.width * CELL_SIZE, maze.height * CELL_SIZE))
     clock  = pygame.time.Clock()
@@ -161,16 +329,18 @@ def visualize(maze: Maze, solve_gen):
             pygame.draw.rect(screen, PATH_COLOR, rect)
 
         # draw walls
-        for (x, y), walls in maze.walls.items():
-            sx, sy = x * CELL_SIZE, y * CELL_SIZE
-            if walls[0]:
-                pygame.draw.line(screen, WALL_COLOR, (sx, sy), (sx+CELL_SIZE, sy))
-            if walls[1]:
-                pygame.draw.line(screen, WALL_COLOR, (sx+CELL_SIZE, sy), (sx+CELL_SIZE, sy+CELL_SIZE))
-            if walls[2]:
-                pygame.draw.line(screen, WALL_COLOR, (sx, sy+CELL_SIZE), (sx+CELL_SIZE, sy+CELL_SIZE))
-            if walls[3]:
-                pygame.draw.line(screen, WALL_COLOR, (sx, sy), (sx, sy+CELL_SIZE))
+        for y in range(maze.height):
+            for x in range(maze.width):
+                walls = maze.cell_walls(x, y)
+                sx, sy = x * CELL_SIZE, y * CELL_SIZE
+                if walls[0]:
+                    pygame.draw.line(screen, WALL_COLOR, (sx, sy), (sx+CELL_SIZE, sy))
+                if walls[1]:
+                    pygame.draw.line(screen, WALL_COLOR, (sx+CELL_SIZE, sy), (sx+CELL_SIZE, sy+CELL_SIZE))
+                if walls[2]:
+                    pygame.draw.line(screen, WALL_COLOR, (sx, sy+CELL_SIZE), (sx+CELL_SIZE, sy+CELL_SIZE))
+                if walls[3]:
+                    pygame.draw.line(screen, WALL_COLOR, (sx, sy), (sx, sy+CELL_SIZE))
 
         # highlight entrance & exit
         ex, ey = maze.entrance
@@ -218,6 +388,50 @@ def visualize(maze: Maze, solve_gen):
     sys.exit()
 
 
+def visualize_budgeted(maze: Maze, solve_gen, budget_ms: float = 10, speed: float = None, cell_size: int = None):
+    """ Like visualize, but each frame consumes as many generation/solving events as fit in `budget_ms`
+        (at most `speed` events per second when given) and repaints only the cells they touched.
+        `cell_size` defaults to whatever fits the maze in about 1000 pixels. """
+    if cell_size is None:
+        cell_size = max(2, min(CELL_SIZE, 1000 // max(maze.width, maze.height)))
+    pygame.init()
+    screen = pygame.display.set_mode((maze.width * cell_size + 1, maze.height * cell_size + 1))
+    clock  = pygame.time.Clock()
+    renderer = MazeRenderer(screen, maze, cell_size)
+
+    phases = [maze.generate_gen(), solve_gen]
+    allowance = 0.0  # events this frame may still consume when `speed` is set
+
+    running = True
+    while running:
+        clock.tick(FPS)
+        for e in pygame.event.get():
+            if e.type == pygame.QUIT:
+                running = False
+
+        if speed is not None:
+            allowance = min(allowance + speed / FPS, speed)
+        deadline = time.perf_counter() + budget_ms / 1000
+        consumed = 0
+        while phases and (speed is None or allowance >= 1):
+            try:
+                renderer.apply(next(phases[0]))
+            except StopIteration:
+                phases.pop(0)
+                continue
+            consumed += 1
+            allowance -= 1
+            # The budget covers repainting the dirty cells too. Checking the clock
+            # on every event would cost more than the events themselves.
+            if consumed % 64 == 0 and time.perf_counter() + len(renderer.dirty) * renderer.paint_cost > deadline:
+                break
+
+        renderer.flush()
+
+    pygame.quit()
+    sys.exit()
+
+
 if __name__ == "__main__":
     W, H = 50, 30
     entrance = (0, random.randrange(H))
@@ -0,0 +1,218 @@
+"""
+    Saving and loading mazes.
+
+    Binary format (.maze), little endian:
+        header  40 bytes: b'MAZE', version, flags (bit 0: seed present), 2 pad bytes,
+                width, height, entrance x, y, exit x, y (uint32 each), seed (int64)
+        walls   ceil(width * height / 2) bytes, 4 wall bits per cell
+                (TOP | RIGHT | BOTTOM | LEFT as in CompactMaze), cell i in the
+                low nibble of byte i // 2 when i is even, the high nibble when odd
+    A 1000x1000 maze is 500 KB. MappedMaze reads walls straight from an mmap of
+    the file, so opening a huge maze costs no parse and no walls dict.
+
+    write_text and write_png export a picture of the maze for people.
+"""
+
+import mmap
+import struct
+import zlib
+from functools import cached_property
+
+from compact_maze import BOTTOM, LEFT, RIGHT, TOP, WALL_BITS, CompactMaze, VisitedView
+from tree_index import flat_walls
+
+MAGIC = b'MAZE'
+VERSION = 1
+HEADER = struct.Struct('<4sBBxxIIIIIIq')
+HAS_SEED = 1
+
+# translate() tables between one cell per byte and two cells per byte
+_LOW   = bytes(b & 0x0F for b in range(256))
+_HIGH  = bytes(b >> 4 for b in range(256))
+_SHIFT = bytes((b << 4) & 0xFF for b in range(256))
+
+
+def pack_walls(walls: bytes) -> bytes:
+    """ One byte per cell -> two cells per byte """
+    walls = bytes(walls)
+    if len(walls) % 2:
+        walls += b'\x00'
+    even = walls[0::2]
+    odd = walls[1::2].translate(_SHIFT)
+    # OR of two byte strings through big integers, much faster than a Python loop
+    packed = int.from_bytes(even, 'little') | int.from_bytes(odd, 'little')
+    return packed.to_bytes(len(even), 'little')
+
+
+def unpack_walls(packed: bytes, cells: int) -> bytearray:
+    """ Two cells per byte -> one byte per cell (a bytearray in the CompactMaze layout) """
+    walls = bytearray(2 * len(packed))
+    walls[0::2] = packed.translate(_LOW)
+    walls[1::2] = packed.translate(_HIGH)
+    del walls[cells:]
+    return walls
+
+
+def _header(maze) -> bytes:
+    seed = getattr(maze, 'seed', None)
+    if seed is not None and not isinstance(seed, int):
+        raise ValueError("only integer seeds can be stored")
+    return HEADER.pack(MAGIC, VERSION, HAS_SEED if seed is not None else 0,
+                       maze.width, maze.height, *maze.entrance, *maze.exit, seed or 0)
+
+
+def _read_header(data: bytes) -> dict:
+    magic, version, flags, width, height, ex, ey, tx, ty, seed = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a maze file")
+    if version != VERSION:
+        raise ValueError(f"unsupported maze file version {version}")
+    return dict(width=width, height=height, entrance=(ex, ey), exit=(tx, ty),
+                seed=seed if flags & HAS_SEED else None)
+
+
+def save_maze(maze, path: str):
+    """ Writes a Maze, CompactMaze or MappedMaze to a .maze file """
+    with open(path, 'wb') as f:
+        f.write(_header(maze))
+        f.write(pack_walls(flat_walls(maze)))
+
+
+def load_maze(path: str, cls=CompactMaze):
+    """ Reads a .maze file into a new `cls` (CompactMaze, or main.Maze) """
+    with open(path, 'rb') as f:
+        data = f.read()
+    info = _read_header(data)
+    walls = unpack_walls(data[HEADER.size:], info['width'] * info['height'])
+
+    maze = cls(info['width'], info['height'], info['entrance'], info['exit'])
+    if hasattr(maze, 'load_wall_bits'):
+        maze.load_wall_bits(walls)
+    else:
+        maze.wall_bits = walls
+        maze.visited_flags = bytearray([1]) * len(walls)
+    maze.seed = info['seed']
+    return maze
+
+
+class MappedMaze:
+    """ Read-only maze whose walls are read from an mmap of a .maze file.
+        has_wall and cell_walls decode one nibble; nothing is loaded up front. """
+    def __init__(self, path: str):
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        info = _read_header(self._map)
+        self.width    = info['width']
+        self.height   = info['height']
+        self.entrance = info['entrance']
+        self.exit     = info['exit']
+        self.seed     = info['seed']
+        self.costs    = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def _bits(self, x: int, y: int) -> int:
+        i = y * self.width + x
+        byte = self._map[HEADER.size + (i >> 1)]
+        return byte >> 4 if i & 1 else byte & 0x0F
+
+    def has_wall(self, x: int, y: int, w: int) -> bool:
+        return bool(self._bits(x, y) & WALL_BITS[w])
+
+    def cell_walls(self, x: int, y: int) -> tuple[bool, bool, bool, bool]:
+        bits = self._bits(x, y)
+        return bool(bits & TOP), bool(bits & RIGHT), bool(bits & BOTTOM), bool(bits & LEFT)
+
+    def cost(self, cell: tuple[int, int]) -> float:
+        return 1
+
+    @cached_property
+    def wall_bits(self) -> bytes:
+        """ All walls unpacked to one byte per cell, for the flat-index tools (MazeIndex, solve_batch).
+            Decoded once on first use; has_wall never needs it. """
+        return bytes(unpack_walls(self._map[HEADER.size:], self.width * self.height))
+
+    @property
+    def visited(self) -> VisitedView:
+        return VisitedView(bytearray([1]) * (self.width * self.height), self.width)
+
+
+def to_text(maze) -> str:
+    """ ASCII picture: '+' posts, '---' and '|' walls, 'S' entrance and 'E' exit """
+    lines = []
+    for y in range(maze.height):
+        top, middle = ['+'], ['|' if maze.has_wall(0, y, 3) else ' ']
+        for x in range(maze.width):
+            walls = maze.cell_walls(x, y)
+            mark = 'S' if (x, y) == maze.entrance else 'E' if (x, y) == maze.exit else ' '
+            top.append('---+' if walls[0] else '   +')
+            middle.append(f' {mark} ' + ('|' if walls[1] else ' '))
+        lines.append(''.join(top))
+        lines.append(''.join(middle))
+    last = maze.height - 1
+    lines.append('+' + ''.join('---+' if maze.has_wall(x, last, 2) else '   +' for x in range(maze.width)))
+    return '\n'.join(lines) + '\n'
+
+
+def write_text(maze, path: str):
+    with open(path, 'w') as f:
+        f.write(to_text(maze))
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def write_png(maze, path: str, scale: int = 2):
+    """ Grayscale PNG: every cell and every wall is one `scale` x `scale` block,
+        walls black, passages white, entrance and exit gray. Rows are built and
+        compressed one at a time, so big mazes do not need the whole image in memory. """
+    walls = flat_walls(maze)
+    width, height = maze.width, maze.height
+    columns = 2 * width + 1
+    # 0 where the wall is present, 255 where it is open
+    open_top  = bytes(0 if b & TOP else 255 for b in range(256))
+    open_left = bytes(0 if b & LEFT else 255 for b in range(256))
+    open_bottom = bytes(0 if b & BOTTOM else 255 for b in range(256))
+
+    def scaled(row: bytearray) -> bytes:
+        out = bytearray(len(row) * scale)
+        for k in range(scale):
+            out[k::scale] = row
+        return (b'\x00' + bytes(out)) * scale  # filter type 0 before every row
+
+    compressor = zlib.compressobj()
+    chunks = []
+    for y in range(height):
+        cells = walls[y * width:(y + 1) * width]
+        line = bytearray(columns)  # posts stay 0
+        line[1::2] = bytes(cells).translate(open_top)
+        chunks.append(compressor.compress(scaled(line)))
+
+        line = bytearray([255]) * columns
+        line[0:2 * width:2] = bytes(cells).translate(open_left)
+        line[-1] = 0 if cells[-1] & RIGHT else 255
+        for (x, cy) in (maze.entrance, maze.exit):
+            if cy == y:
+                line[2 * x + 1] = 128
+        chunks.append(compressor.compress(scaled(line)))
+
+    line = bytearray(columns)
+    line[1::2] = bytes(walls[(height - 1) * width:]).translate(open_bottom)
+    chunks.append(compressor.compress(scaled(line)))
+    chunks.append(compressor.flush())
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(_png_chunk(b'IHDR', struct.pack('>IIBBBBB', columns * scale, (2 * height + 1) * scale,
+                                                   8, 0, 0, 0, 0)))
+        f.write(_png_chunk(b'IDAT', b''.join(chunks)))
+        f.write(_png_chunk(b'IEND', b''))
@@ -0,0 +1,159 @@
+"""
+    Batch pathfinding for many agents in one maze.
+
+    Calling MazeSolver once per agent repeats the same search whenever agents
+    share a start or a goal. solve_batch groups the queries instead:
+      - by source, when there are fewer distinct starts than goals: one search
+        tree from each start answers every query leaving from it;
+      - by goal otherwise: one reverse search from each goal, and every start
+        follows its parent pointers straight to the goal.
+    A search stops as soon as all cells its group asks about are settled.
+    Groups are independent, so with workers > 1 they are spread over a
+    process pool that gets the wall bytes once per worker.
+
+    Unit cost uses BFS. If the maze has costs (set_cost), each group runs
+    Dijkstra instead, with the cost of entering a cell as in search.py.
+"""
+
+import heapq
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from compact_maze import BOTTOM, LEFT, RIGHT, TOP
+from tree_index import flat_walls
+
+# Set in every pool worker by _attach
+_worker_maze = {}
+
+
+class BatchStats:
+    """ Counters of one solve_batch call """
+    def __init__(self):
+        self.queries  = 0
+        self.groups   = 0    # searches run, one per distinct source or goal
+        self.expanded = 0    # cells settled over all searches
+        self.seconds  = 0.0
+
+    @property
+    def qps(self) -> float:
+        return self.queries / self.seconds if self.seconds else float('inf')
+
+    def as_dict(self) -> dict:
+        return {**vars(self), 'qps': self.qps}
+
+
+def _attach(walls: bytes, width: int, costs: dict):
+    _worker_maze.update(walls=walls, width=width, costs=costs)
+
+
+def search_tree(walls, width: int, root: int, targets: set, costs: dict = None, reverse: bool = False):
+    """ Search from flat index `root` until every target is settled (or the maze is exhausted).
+        Returns (parents, expanded); parents[v] is the cell before v on the way from the root.
+        With costs, entering v costs costs.get(v, 1); `reverse` charges the cell being left instead,
+        which is the forward cost of a path that ends at the root. """
+    moves = ((TOP, -width), (RIGHT, 1), (BOTTOM, width), (LEFT, -1))
+    parents = {root: None}
+    remaining = set(targets)
+    remaining.discard(root)
+    expanded = 0
+
+    if not costs:
+        queue = deque([root])
+        while queue and remaining:
+            current = queue.popleft()
+            expanded += 1
+            bits = walls[current]
+            for wall, offset in moves:
+                # Outer walls are never carved, so an open side always leads inside the maze
+                if not bits & wall:
+                    neighbor = current + offset
+                    if neighbor not in parents:
+                        parents[neighbor] = current
+                        remaining.discard(neighbor)
+                        queue.append(neighbor)
+        return parents, expanded
+
+    distance = {root: 0}
+    heap = [(0, root)]
+    settled = set()
+    while heap and remaining:
+        d, current = heapq.heappop(heap)
+        if current in settled:
+            continue
+        settled.add(current)
+        remaining.discard(current)
+        expanded += 1
+        bits = walls[current]
+        for wall, offset in moves:
+            if not bits & wall:
+                neighbor = current + offset
+                new_distance = d + costs.get(current if reverse else neighbor, 1)
+                if new_distance < distance.get(neighbor, float('inf')):
+                    distance[neighbor] = new_distance
+                    parents[neighbor] = current
+                    heapq.heappush(heap, (new_distance, neighbor))
+    return parents, expanded
+
+
+def _solve_group(root: int, others: list, reverse: bool, walls=None, width=None, costs=None):
+    """ Paths (as flat index lists, or None) from root to each of `others`, or from each of them to root """
+    if walls is None:
+        walls, width, costs = _worker_maze['walls'], _worker_maze['width'], _worker_maze['costs']
+    parents, expanded = search_tree(walls, width, root, set(others), costs, reverse)
+
+    paths = []
+    for cell in others:
+        if cell not in parents:
+            paths.append(None)
+            continue
+        path = []
+        while cell is not None:
+            path.append(cell)
+            cell = parents[cell]
+        if not reverse:
+            path.reverse()  # parents lead back to the root, a forward path starts there
+        paths.append(path)
+    return paths, expanded
+
+
+def solve_batch(maze, pairs, workers: int = 1):
+    """ Solves every (start, goal) pair and returns (paths, stats).
+        paths[i] is the list of cells from pairs[i][0] to pairs[i][1], or None if unreachable. """
+    stats = BatchStats()
+    begin = time.perf_counter()
+    pairs = list(pairs)
+    stats.queries = len(pairs)
+
+    width = maze.width
+    walls = bytes(flat_walls(maze))
+    costs = {y * width + x: c for (x, y), c in getattr(maze, 'costs', {}).items() if c != 1}
+    flat = [(sy * width + sx, gy * width + gx) for (sx, sy), (gx, gy) in pairs]
+
+    # Group around whichever side has fewer distinct cells
+    reverse = len({g for _, g in flat}) < len({s for s, _ in flat})
+    groups = {}
+    for i, (start, goal) in enumerate(flat):
+        root, other = (goal, start) if reverse else (start, goal)
+        members = groups.setdefault(root, ([], []))
+        members[0].append(i)
+        members[1].append(other)
+    stats.groups = len(groups)
+
+    roots = list(groups)
+    if workers > 1 and len(roots) > 1:
+        with ProcessPoolExecutor(workers, initializer=_attach, initargs=(walls, width, costs)) as pool:
+            results = list(pool.map(_solve_group, roots, [groups[r][1] for r in roots], [reverse] * len(roots),
+                                    chunksize=max(1, len(roots) // (4 * workers))))
+    else:
+        results = [_solve_group(r, groups[r][1], reverse, walls, width, costs) for r in roots]
+
+    paths = [None] * len(pairs)
+    for root, (group_paths, expanded) in zip(roots, results):
+        stats.expanded += expanded
+        for i, path in zip(groups[root][0], group_paths):
+            if path is not None:
+                paths[i] = [(v % width, v // width) for v in path]
+
+    stats.seconds = time.perf_counter() - begin
+    return paths, stats
@@ -0,0 +1,201 @@
+"""
+    Search strategies for MazeSolver.
+
+    Every strategy is a generator function
+        search(maze, start, goal, stats, cost=None)
+    that yields ('visit', cell) for each expanded cell and then ('path', cell)
+    for each cell of the path found, the same events as MazeSolver.solve_gen,
+    so visualize can animate any of them. `cost(cell)` is the price of entering
+    a cell (1 when omitted). `stats` collects nodes expanded, peak frontier size
+    and path length. Strategies work with Maze and CompactMaze (through has_wall).
+"""
+
+import heapq
+from collections import deque
+
+# (dx, dy, index of the wall between the cell and that neighbor)
+MOVES = [(0, -1, 0), (1, 0, 1), (0, 1, 2), (-1, 0, 3)]
+
+
+class SearchStats:
+    """ Counters filled in by a search while it runs """
+    def __init__(self):
+        self.expanded = 0       # cells taken off the frontier
+        self.peak_frontier = 0  # largest frontier size seen
+        self.path_length = 0    # cells on the path found, 0 if none
+        self.path_cost = 0      # sum of cost() over the path, without the start
+
+    def as_dict(self) -> dict:
+        return dict(vars(self))
+
+
+def open_neighbors(maze, cell):
+    """ Yields the cells reachable from `cell` in one step """
+    x, y = cell
+    for dx, dy, w in MOVES:
+        if not maze.has_wall(x, y, w):
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < maze.width and 0 <= ny < maze.height:
+                yield (nx, ny)
+
+
+def _unit_cost(cell) -> int:
+    return 1
+
+
+def _emit_path(came_from: dict, goal, stats: SearchStats, cost):
+    """ Rebuilds the path from parents and yields it as 'path' events """
+    if goal not in came_from:
+        return
+    path = []
+    node = goal
+    while node is not None:
+        path.append(node)
+        node = came_from[node]
+    path.reverse()
+
+    stats.path_length = len(path)
+    stats.path_cost = sum(cost(cell) for cell in path[1:])
+    for cell in path:
+        yield ('path', cell)
+
+
+def bfs(maze, start, goal, stats: SearchStats, cost=None):
+    """ Breadth-first search: shortest path in number of steps """
+    queue = deque([start])
+    came_from = {start: None}
+
+    while queue:
+        stats.peak_frontier = max(stats.peak_frontier, len(queue))
+        current = queue.popleft()
+        stats.expanded += 1
+        yield ('visit', current)
+        if current == goal:
+            break
+
+        for neighbor in open_neighbors(maze, current):
+            if neighbor not in came_from:
+                came_from[neighbor] = current
+                queue.append(neighbor)
+
+    yield from _emit_path(came_from, goal, stats, cost or _unit_cost)
+
+
+def dijkstra(maze, start, goal, stats: SearchStats, cost=None):
+    """ Dijkstra: cheapest path when cells have different traversal costs """
+    yield from _best_first(maze, start, goal, stats, cost or _unit_cost, heuristic=None)
+
+
+def astar(maze, start, goal, stats: SearchStats, cost=None, min_cost: float = None):
+    """ A* with the Manhattan distance times the cheapest cell cost as heuristic.
+        `min_cost` must not exceed any cell cost or the path may not be the cheapest. When it
+        is omitted it comes from the maze's own costs (cells without one cost 1); for any
+        other cost function it is 0, which makes the search a Dijkstra. """
+    if min_cost is None:
+        if cost is None:
+            min_cost = 1
+        elif cost == getattr(maze, 'cost', None):
+            min_cost = min(1, *maze.costs.values()) if maze.costs else 1
+        else:
+            min_cost = 0
+    gx, gy = goal
+
+    def manhattan(cell):
+        return (abs(cell[0] - gx) + abs(cell[1] - gy)) * min_cost
+
+    yield from _best_first(maze, start, goal, stats, cost or _unit_cost, heuristic=manhattan)
+
+
+def _best_first(maze, start, goal, stats: SearchStats, cost, heuristic):
+    # Heap entries are (priority, tie, cell); `tie` keeps the order stable and
+    # prefers the most recently pushed entry among equal priorities (deeper cells)
+    distance = {start: 0}
+    came_from = {start: None}
+    heap = [(0, 0, start)]
+    pushed = 0
+    closed = set()
+
+    while heap:
+        stats.peak_frontier = max(stats.peak_frontier, len(heap))
+        _, _, current = heapq.heappop(heap)
+        if current in closed:
+            continue  # stale entry, a cheaper one was expanded already
+        closed.add(current)
+        stats.expanded += 1
+        yield ('visit', current)
+        if current == goal:
+            break
+
+        for neighbor in open_neighbors(maze, current):
+            new_distance = distance[current] + cost(neighbor)
+            if new_distance < distance.get(neighbor, float('inf')):
+                distance[neighbor] = new_distance
+                came_from[neighbor] = current
+                pushed += 1
+                priority = new_distance + (heuristic(neighbor) if heuristic else 0)
+                heapq.heappush(heap, (priority, -pushed, neighbor))
+
+    yield from _emit_path(came_from, goal, stats, cost)
+
+
+def bidirectional_bfs(maze, start, goal, stats: SearchStats, cost=None):
+    """ BFS from both ends at once, expanding the smaller frontier one full layer at a time """
+    parents = ({start: None}, {goal: None})  # forward and backward search trees
+    depths = ({start: 0}, {goal: 0})
+    frontiers = (deque([start]), deque([goal]))
+    meeting = start if start == goal else None
+
+    while meeting is None and frontiers[0] and frontiers[1]:
+        stats.peak_frontier = max(stats.peak_frontier, len(frontiers[0]) + len(frontiers[1]))
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        frontier, mine, other = frontiers[side], parents[side], parents[1 - side]
+        mine_depth, other_depth = depths[side], depths[1 - side]
+
+        # Expand the whole layer, and keep the meeting cell with the shortest total path
+        best = None
+        for _ in range(len(frontier)):
+            current = frontier.popleft()
+            stats.expanded += 1
+            yield ('visit', current)
+            for neighbor in open_neighbors(maze, current):
+                if neighbor in mine:
+                    continue
+                mine[neighbor] = current
+                mine_depth[neighbor] = mine_depth[current] + 1
+                frontier.append(neighbor)
+                if neighbor in other:
+                    length = mine_depth[neighbor] + other_depth[neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, neighbor)
+        if best is not None:
+            meeting = best[1]
+
+    if meeting is None:
+        return
+
+    # Join start..meeting with meeting..goal
+    forward = []
+    node = meeting
+    while node is not None:
+        forward.append(node)
+        node = parents[0][node]
+    forward.reverse()
+    node = parents[1][meeting]
+    while node is not None:
+        forward.append(node)
+        node = parents[1][node]
+
+    cost = cost or _unit_cost
+    stats.path_length = len(forward)
+    stats.path_cost = sum(cost(cell) for cell in forward[1:])
+    for cell in forward:
+        yield ('path', cell)
+
+
+# Strategy registry: MazeSolver(maze, algorithm=<name>) picks one of these
+SEARCHES = {
+    'bfs': bfs,
+    'astar': astar,
+    'bidirectional': bidirectional_bfs,
+    'dijkstra': dijkstra,
+}
@@ -0,0 +1,170 @@
+"""
+    Precomputed path index for perfect mazes.
+
+    A maze from generate_gen / generate is a spanning tree of the grid: there is
+    exactly one path between any two cells. MazeIndex roots that tree at the
+    entrance once (parent and depth of every cell) and builds a binary-lifting
+    table (up[k][v] = 2^k-th ancestor of v), so afterwards
+        distance(a, b)  costs O(log n)  - depth[a] + depth[b] - 2 * depth[lca]
+        path(a, b)      costs O(path)   - walk a and b up to their lca
+    without any search. If the maze has loops or unreachable cells the tree
+    shortcut is wrong, so the index falls back to BFS for every query.
+"""
+
+from array import array
+from collections import deque
+
+from compact_maze import BOTTOM, LEFT, RIGHT, TOP
+from search import SearchStats, bfs
+
+
+def flat_walls(maze) -> bytes:
+    """ Flat wall bytes of a Maze or CompactMaze, in the CompactMaze layout """
+    if hasattr(maze, 'wall_bits'):
+        return maze.wall_bits
+    bits = bytearray(maze.width * maze.height)
+    for y in range(maze.height):
+        for x in range(maze.width):
+            top, right, bottom, left = maze.cell_walls(x, y)
+            bits[y * maze.width + x] = top * TOP | right * RIGHT | bottom * BOTTOM | left * LEFT
+    return bits
+
+
+class MazeIndex:
+    """ Built once per maze, answers path length and path queries between any two cells """
+    def __init__(self, maze, root: tuple[int, int] = None):
+        self.maze   = maze
+        self.width  = maze.width
+        self.height = maze.height
+        self.root   = root or maze.entrance
+
+        self.is_tree = self._build_tree()
+        self.up = self._build_lifting() if self.is_tree else []
+
+    def _build_tree(self) -> bool:
+        """ BFS from the root filling parent[] and depth[]. Returns False if the maze is not a spanning tree. """
+        width, size = self.width, self.width * self.height
+        walls = flat_walls(self.maze)
+        root = self.root[1] * width + self.root[0]
+
+        self.parent = parent = array("i", [-1]) * size
+        self.depth  = depth  = array("i", [0]) * size
+        parent[root] = root
+        queue = deque([root])
+        reached = 1
+        moves = ((TOP, -width), (RIGHT, 1), (BOTTOM, width), (LEFT, -1))
+
+        while queue:
+            current = queue.popleft()
+            bits = walls[current]
+            for wall, offset in moves:
+                # Outer walls are never carved, so an open side always leads inside the maze
+                if bits & wall:
+                    continue
+                neighbor = current + offset
+                if neighbor == parent[current]:
+                    continue
+                if parent[neighbor] != -1:
+                    return False  # second way into a reached cell: the maze has a loop
+                parent[neighbor] = current
+                depth[neighbor] = depth[current] + 1
+                reached += 1
+                queue.append(neighbor)
+
+        return reached == size
+
+    def _build_lifting(self) -> list:
+        """ up[0] = parent, up[k][v] = up[k-1][up[k-1][v]], as many levels as the deepest cell needs """
+        up = [self.parent]
+        levels = max(self.depth).bit_length()
+        for _ in range(1, levels):
+            previous = up[-1]
+            up.append(array("i", [previous[v] for v in previous]))
+        return up
+
+    def _flat(self, cell: tuple[int, int]) -> int:
+        return cell[1] * self.width + cell[0]
+
+    def _cell(self, index: int) -> tuple[int, int]:
+        return index % self.width, index // self.width
+
+    def _lca(self, a: int, b: int) -> int:
+        depth, up = self.depth, self.up
+        if depth[a] < depth[b]:
+            a, b = b, a
+
+        # Lift a to the depth of b, one power of two per set bit of the difference
+        diff = depth[a] - depth[b]
+        k = 0
+        while diff:
+            if diff & 1:
+                a = up[k][a]
+            diff >>= 1
+            k += 1
+        if a == b:
+            return a
+
+        # Lift both just below their lowest common ancestor
+        for k in range(len(up) - 1, -1, -1):
+            level = up[k]
+            if level[a] != level[b]:
+                a, b = level[a], level[b]
+        return up[0][a]
+
+    def lca(self, a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
+        """ Lowest common ancestor of two cells in the tree rooted at `root` """
+        return self._cell(self._lca(self._flat(a), self._flat(b)))
+
+    def _search(self, a: tuple[int, int], b: tuple[int, int]):
+        """ Fallback for mazes with loops: BFS path as a list of cells, or None if unreachable """
+        path = [cell for tag, cell in bfs(self.maze, a, b, SearchStats()) if tag == 'path']
+        return path or None
+
+    def distance(self, a: tuple[int, int], b: tuple[int, int]):
+        """ Number of steps on the path from a to b (None if there is no path) """
+        if not self.is_tree:
+            path = self._search(a, b)
+            return None if path is None else len(path) - 1
+        i, j = self._flat(a), self._flat(b)
+        depth = self.depth
+        return depth[i] + depth[j] - 2 * depth[self._lca(i, j)]
+
+    def path(self, a: tuple[int, int], b: tuple[int, int]):
+        """ Cells of the path from a to b, both included (None if there is no path) """
+        if not self.is_tree:
+            return self._search(a, b)
+        i, j = self._flat(a), self._flat(b)
+        top = self._lca(i, j)
+        parent = self.parent
+
+        head, tail = [], []
+        while i != top:
+            head.append(i)
+            i = parent[i]
+        while j != top:
+            tail.append(j)
+            j = parent[j]
+        head.append(top)
+        head.extend(reversed(tail))
+        return [self._cell(v) for v in head]
+
+    def distances(self, pairs) -> list:
+        """ Batch version of distance() for an iterable of (a, b) cell pairs """
+        if not self.is_tree:
+            return [self.distance(a, b) for a, b in pairs]
+        width, depth, lca = self.width, self.depth, self._lca
+        result = []
+        for (ax, ay), (bx, by) in pairs:
+            i, j = ay * width + ax, by * width + bx
+            result.append(depth[i] + depth[j] - 2 * depth[lca(i, j)])
+        return result
+
+    def paths(self, pairs) -> list:
+        """ Batch version of path() """
+        return [self.path(a, b) for a, b in pairs]
+
+    def solve_gen(self, start: tuple[int, int] = None, goal: tuple[int, int] = None):
+        """ Same ('path', cell) events as MazeSolver.solve_gen, without visiting anything """
+        path = self.path(start or self.maze.entrance, goal or self.maze.exit)
+        for cell in path or ():
+            yield ('path', cell)
@@ -0,0 +1,611 @@
+"""
+    Automated player for WumpusGame with exact hazard probabilities.
+
+    The knowledge base (WumpusKB) enumerates every hazard placement that is
+    consistent with what the agent has seen. Percepts only ever talk about one
+    hazard kind at a time (breeze -> pits, rustle -> bats, stench -> wumpus), and
+    the only link between the kinds is that all hazards start in different rooms.
+    So the KB keeps:
+        pit_pairs, bat_pairs  consistent placements of each kind, as room bitmasks
+        combos                the disjoint (pits, bats) pairs among them
+        wumpus                W[w0][w]: likelihood of the wumpus observations so far
+                              for a wumpus that started in w0 and is now in w
+    A placement (pits, bats, w0) is consistent iff its pits and bats are in combos
+    and w0 is outside both. Observations filter these lists in place, so the work
+    done on earlier turns is kept; marginals are recomputed only after the KB
+    changed, and in O(len(combos)) thanks to the wumpus row sums.
+
+    The enumeration grows with the square of the cave size per hazard kind, so
+    big caves (caves.py) use FactoredKB instead: each hazard kind on its own,
+    placements counted per group of interchangeable rooms, and the wumpus as
+    one distribution over rooms. WumpusAgent picks it above EXACT_ROOMS rooms.
+
+    Usage:
+        python agent.py --games 1000 --seed 0
+        python agent.py --games 200 --cave torus:40x40 --pits 30 --bats 30
+"""
+
+import argparse
+import random
+import time
+from itertools import combinations
+from math import comb
+
+from caves import Cave, parse_cave
+from main import BREEZE, CAVE, DODECAHEDRON, RUSTLE, STENCH, WumpusGame
+
+PITS = 2
+BATS = 2
+WUMPUS_MOVE = 0.75  # chance the wumpus wakes up after a missed arrow
+EXACT_ROOMS = 30    # largest cave WumpusAgent reasons about with the exact WumpusKB
+
+
+def bits(mask: int) -> list[int]:
+    """ Indices of the set bits of a mask """
+    result = []
+    while mask:
+        low = mask & -mask
+        result.append(low.bit_length() - 1)
+        mask ^= low
+    return result
+
+
+class WumpusKB:
+    """ Exact belief over hazard placements, updated from percepts """
+    def __init__(self, cave: dict = CAVE, pits: int = PITS, bats: int = BATS):
+        self.rooms = sorted(cave)
+        self.index = {room: i for i, room in enumerate(self.rooms)}
+        self.neighbors = [[self.index[r] for r in cave[room]] for room in self.rooms]
+        self.neighbor_mask = [sum(1 << j for j in near) for near in self.neighbors]
+        n = len(self.rooms)
+
+        self.pit_pairs = [sum(1 << i for i in c) for c in combinations(range(n), pits)]
+        self.bat_pairs = [sum(1 << i for i in c) for c in combinations(range(n), bats)]
+        self._combos = None  # built on first use, then filtered in place
+        self.wumpus = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+
+        self.version = 0     # bumped on every change, keys the marginals cache
+        self._cached = None
+        self._bits = {}      # mask -> bits(mask), masks repeat a lot
+        self._counted = None # (combos, start counts) for wumpus_marginal
+
+    def copy(self) -> 'WumpusKB':
+        """ Independent KB for lookahead. The placement lists are shared: filters always build new ones. """
+        other = object.__new__(WumpusKB)
+        other.__dict__.update(self.__dict__)
+        other.wumpus = [row[:] for row in self.wumpus]
+        return other
+
+    # ---- observations -------------------------------------------------
+
+    def _keep_pits(self, keep):
+        self.pit_pairs = [m for m in self.pit_pairs if keep(m)]
+        if self._combos is not None:
+            self._combos = [c for c in self._combos if keep(c[0])]
+        self.version += 1
+
+    def _keep_bats(self, keep):
+        self.bat_pairs = [m for m in self.bat_pairs if keep(m)]
+        if self._combos is not None:
+            self._combos = [c for c in self._combos if keep(c[1])]
+        self.version += 1
+
+    def _weigh_wumpus(self, likelihood: list[float]):
+        """ Multiplies every W[w0][w] by likelihood[w] and renormalizes """
+        total = 0.0
+        for row in self.wumpus:
+            for w, l in enumerate(likelihood):
+                row[w] *= l
+            total += sum(row)
+        if total > 0:
+            for row in self.wumpus:
+                for w in range(len(row)):
+                    row[w] /= total
+        self.version += 1
+
+    def observe_room(self, room: int, warnings: list[str]):
+        """ The player is alive in `room` and hears `warnings` (from adjacent_hazards) """
+        i = self.index[room]
+        bit, near = 1 << i, self.neighbor_mask[i]
+        breezes, rustles, stench = warnings.count(BREEZE), warnings.count(RUSTLE), warnings.count(STENCH)
+
+        self._keep_pits(lambda m: not m & bit and (m & near).bit_count() == breezes)
+        self._keep_bats(lambda m: (m & near).bit_count() == rustles)
+        self._weigh_wumpus([float(w != i and bool(near >> w & 1) == bool(stench))
+                            for w in range(len(self.rooms))])
+
+    def observe_start(self, room: int, warnings: list[str]):
+        """ The game never starts the player on a hazard """
+        bit = 1 << self.index[room]
+        self._keep_bats(lambda m: not m & bit)
+        self.observe_room(room, warnings)
+
+    def observe_bat(self, room: int, present: bool):
+        """ Entering `room` did (or did not) end in a bat carrying the player off """
+        i = self.index[room]
+        bit = 1 << i
+        self._keep_bats(lambda m: bool(m & bit) == present)
+        if present:
+            # The player was carried off alive, so the wumpus was not there either
+            self._weigh_wumpus([float(w != i) for w in range(len(self.rooms))])
+
+    def observe_miss(self, path: list[int]):
+        """ An arrow flew through `path` and missed; then the wumpus may have moved """
+        missed = {self.index[room] for room in path}
+        self._weigh_wumpus([0.0 if w in missed else 1.0 for w in range(len(self.rooms))])
+
+        moved = []
+        for row in self.wumpus:
+            new = [p * (1 - WUMPUS_MOVE) for p in row]
+            for w, p in enumerate(row):
+                if p:
+                    share = p * WUMPUS_MOVE / len(self.neighbors[w])
+                    for v in self.neighbors[w]:
+                        new[v] += share
+            moved.append(new)
+        self.wumpus = moved
+        self.version += 1
+
+    # ---- inference ----------------------------------------------------
+
+    def _mask_bits(self, mask: int) -> list[int]:
+        cached = self._bits.get(mask)
+        if cached is None:
+            cached = self._bits[mask] = bits(mask)
+        return cached
+
+    @property
+    def combos(self) -> list[tuple[int, int]]:
+        """ Consistent (pits, bats) pairs that do not share a room """
+        if self._combos is None:
+            self._combos = [(p, b) for p in self.pit_pairs for b in self.bat_pairs if not p & b]
+        return self._combos
+
+    def marginals(self) -> dict:
+        """ P(pit), P(bat), P(wumpus) and P(pit or wumpus) per room index, cached until the next observation """
+        if self._cached is not None and self._cached[0] == self.version:
+            return self._cached[1]
+
+        n = len(self.rooms)
+        W = self.wumpus
+        row_sum = [sum(row) for row in W]
+        all_rows = sum(row_sum)
+        column = [sum(W[i][w] for i in range(n)) for w in range(n)]
+
+        pit, bat, both = [0.0] * n, [0.0] * n, [0.0] * n
+        start_count = [0] * n  # combos with the wumpus start excluded from room i
+        total = 0.0
+        mask_bits = self._mask_bits
+        for pits, bats in self.combos:
+            taken = mask_bits(pits | bats)
+            weight = all_rows - sum(row_sum[i] for i in taken)  # wumpus starts outside pits and bats
+            total += weight
+            for i in taken:
+                start_count[i] += 1
+            for r in mask_bits(pits):
+                pit[r] += weight
+                both[r] += column[r] - sum(W[i][r] for i in taken)
+            for r in mask_bits(bats):
+                bat[r] += weight
+
+        if total <= 0:
+            raise ValueError("no hazard placement is consistent with the observations")
+        count = len(self.combos)
+        wumpus = [(count * column[w] - sum(start_count[i] * W[i][w] for i in range(n))) / total
+                  for w in range(n)]
+        pit = [p / total for p in pit]
+        result = {
+            'pit': pit,
+            'bat': [b / total for b in bat],
+            'wumpus': wumpus,
+            'deadly': [pit[r] + wumpus[r] - both[r] / total for r in range(n)],
+        }
+        self._cached = (self.version, result)
+        return result
+
+    def wumpus_marginal(self) -> list[float]:
+        """ P(wumpus) per room index without the pit and bat sums of marginals(). The per-room
+            count of combos that exclude the wumpus start only changes with the combos, so it is
+            kept across wumpus-only observations (missed arrows, stenches). """
+        combos = self.combos
+        if self._counted is None or self._counted[0] is not combos:
+            start_count = [0] * len(self.rooms)
+            for pits, bats in combos:
+                for i in self._mask_bits(pits | bats):
+                    start_count[i] += 1
+            self._counted = (combos, start_count)
+        start_count = self._counted[1]
+
+        n = len(self.rooms)
+        W = self.wumpus
+        count = len(combos)
+        total = sum((count - start_count[i]) * sum(W[i]) for i in range(n))
+        if total <= 0:
+            raise ValueError("no hazard placement is consistent with the observations")
+        return [sum((count - start_count[i]) * W[i][w] for i in range(n)) / total for w in range(n)]
+
+    def entry_outcomes(self, room: int, bats: bool = True) -> tuple[float, float, dict]:
+        """ What happens on entering `room`: (P(death), P(carried by a bat), {(breezes, rustles, stench): P})
+            where the last part is the chance to be alive there, not carried, hearing those warnings.
+            With bats=False the bats in `room` are ignored (a bat drop never chains). """
+        x = self.index[room]
+        bit, near = 1 << x, self.neighbor_mask[x]
+        n = len(self.rooms)
+        W = self.wumpus
+        row_sum = [sum(row) for row in W]
+        at_x = [row[x] for row in W]
+        at_near = [sum(row[w] for w in self.neighbors[x]) for row in W]
+        all_rows, all_x, all_near = sum(row_sum), sum(at_x), sum(at_near)
+
+        total = death = carried = 0.0
+        percepts = {}
+        mask_bits = self._mask_bits
+        for pits, bats_mask in self.combos:
+            taken = mask_bits(pits | bats_mask)
+            weight = all_rows - sum(row_sum[i] for i in taken)
+            if weight <= 0:
+                continue
+            total += weight
+            wumpus_here = all_x - sum(at_x[i] for i in taken)
+            if pits & bit:
+                death += weight
+                continue
+            death += wumpus_here
+            if bats and bats_mask & bit:
+                carried += weight - wumpus_here
+                continue
+            stench = all_near - sum(at_near[i] for i in taken)
+            key = ((pits & near).bit_count(), (bats_mask & near).bit_count())
+            percepts[key + (1,)] = percepts.get(key + (1,), 0.0) + stench
+            percepts[key + (0,)] = percepts.get(key + (0,), 0.0) + weight - wumpus_here - stench
+
+        if total <= 0:
+            raise ValueError("no hazard placement is consistent with the observations")
+        percepts = {k: p / total for k, p in percepts.items() if p > 1e-12 * total}
+        return death / total, carried / total, percepts
+
+    def probabilities(self) -> dict:
+        """ Same as marginals(), keyed by room number """
+        return {kind: dict(zip(self.rooms, values)) for kind, values in self.marginals().items()}
+
+
+class HazardCounts:
+    """ Where `count` hazards of one kind can be among n rooms, as exact placement counts.
+        Facts are rooms ruled out (`excluded`) and "exactly k of these rooms" constraints; a
+        constraint with k = 0 is just more exclusions. Rooms that fall under the same set of
+        constraints are interchangeable, so placements are counted per group of them with
+        binomials, in a DP over the groups. Its state is the number of hazards placed so far
+        and how many each open constraint got; a constraint is checked and dropped from the
+        state after its last group, and groups go in room order, so the state only spans the
+        constraints around one spot of the cave. All rooms under no constraint are one group,
+        however big the cave. """
+    def __init__(self, rooms: int, count: int):
+        self.rooms = rooms
+        self.count = count
+        self.excluded = 0
+        self.constraints = {}  # mask -> k, with k > 0; visiting a room again adds nothing
+        self._marginal = None  # cached until the facts change
+
+    def exclude(self, mask: int):
+        if mask & ~self.excluded:
+            self.excluded |= mask
+            self._marginal = None
+
+    def require(self, mask: int, k: int):
+        if k == 0:
+            self.exclude(mask)
+        elif self.constraints.get(mask) != k:
+            self.constraints[mask] = k
+            self._marginal = None
+
+    def marginal(self) -> list[float]:
+        """ P(a hazard in room i) for every room index """
+        if self._marginal is None:
+            self._marginal = self._count()
+        return self._marginal
+
+    def _count(self) -> list[float]:
+        open_rooms = ((1 << self.rooms) - 1) & ~self.excluded
+        merged = {}
+        for mask, k in self.constraints.items():
+            mask &= open_rooms
+            if not mask or merged.get(mask, k) != k:
+                raise ValueError("no hazard placement is consistent with the observations")
+            merged[mask] = k
+        constraints = sorted(merged.items(), key=lambda c: c[0] & -c[0])  # by lowest room
+        constrained = 0
+        for mask, _ in constraints:
+            constrained |= mask
+
+        groups = {}  # signature (which constraints cover the room) -> room indices
+        for i in bits(constrained):
+            signature = tuple(mask >> i & 1 for mask, _ in constraints)
+            groups.setdefault(signature, []).append(i)
+        free = open_rooms & ~constrained
+        signatures = [(0,) * len(constraints)] + sorted(groups, key=lambda sig: (sig.index(1), sig))
+        members = [bits(free)] + [groups[sig] for sig in signatures[1:]]
+        sizes = [len(rooms) for rooms in members]
+        wanted = [k for _, k in constraints]
+        closing = [[] for _ in signatures]  # constraints whose last group this is
+        for c in range(len(constraints)):
+            closing[max(g for g, sig in enumerate(signatures) if sig[c])].append(c)
+
+        def step(state, g, m):
+            placed = state[0] + m
+            if placed > self.count:
+                return None
+            counts = [a + m * b for a, b in zip(state[1:], signatures[g])]
+            for c in closing[g]:
+                if counts[c] != wanted[c]:
+                    return None
+                counts[c] = 0
+            if any(a > k for a, k in zip(counts, wanted)):
+                return None
+            return (placed,) + tuple(counts)
+
+        # forward[g]: ways to fill the groups before g; backward[g]: ways to finish from a forward[g] state
+        forward = [{(0,) * (len(constraints) + 1): 1}]
+        for g, size in enumerate(sizes):
+            layer = {}
+            for state, ways in forward[-1].items():
+                for m in range(min(size, self.count - state[0]) + 1):
+                    new = step(state, g, m)
+                    if new is not None:
+                        layer[new] = layer.get(new, 0) + ways * comb(size, m)
+            forward.append(layer)
+        final = (self.count,) + (0,) * len(constraints)
+        total = forward[-1].get(final, 0)
+        if total == 0:
+            raise ValueError("no hazard placement is consistent with the observations")
+
+        backward = [None] * len(sizes) + [{final: 1}]
+        for g in range(len(sizes) - 1, -1, -1):
+            layer = {}
+            for state in forward[g]:
+                ways = 0
+                for m in range(min(sizes[g], self.count - state[0]) + 1):
+                    new = step(state, g, m)
+                    if new is not None and new in backward[g + 1]:
+                        ways += comb(sizes[g], m) * backward[g + 1][new]
+                if ways:
+                    layer[state] = ways
+            backward[g] = layer
+
+        result = [0.0] * self.rooms
+        for g, size in enumerate(sizes):
+            if not size:
+                continue
+            # Placements with a hazard in one given room of the group: choose the other m - 1
+            hits = 0
+            for state, ways in forward[g].items():
+                for m in range(1, min(size, self.count - state[0]) + 1):
+                    new = step(state, g, m)
+                    if new is not None and new in backward[g + 1]:
+                        hits += ways * comb(size - 1, m - 1) * backward[g + 1][new]
+            p = hits / total
+            for i in members[g]:
+                result[i] = p
+        return result
+
+
+class FactoredKB:
+    """ Same interface as WumpusKB for big caves, with pits, bats and the wumpus tracked
+        separately. The only link kept between them is what a single observation says
+        (a bat room holds no pit or wumpus); the "hazards start in different rooms"
+        coupling is dropped, which moves the marginals by O(1/rooms). """
+    def __init__(self, cave: dict = CAVE, pits: int = PITS, bats: int = BATS):
+        self.rooms = sorted(cave)
+        self.index = {room: i for i, room in enumerate(self.rooms)}
+        self.neighbors = [[self.index[r] for r in cave[room]] for room in self.rooms]
+        self.neighbor_mask = (cave.masks if isinstance(cave, Cave)
+                              else [sum(1 << j for j in near) for near in self.neighbors])
+        n = len(self.rooms)
+        self.pits = HazardCounts(n, pits)
+        self.bats = HazardCounts(n, bats)
+        self.wumpus = [1.0 / n] * n
+        self.version = 0
+        self._cached = None
+
+    def _weigh_wumpus(self, likelihood):
+        wumpus = [p * l for p, l in zip(self.wumpus, likelihood)]
+        total = sum(wumpus)
+        if total > 0:
+            wumpus = [p / total for p in wumpus]
+        self.wumpus = wumpus
+        self.version += 1
+
+    def observe_room(self, room: int, warnings: list[str]):
+        i = self.index[room]
+        near = self.neighbor_mask[i]
+        self.pits.exclude(1 << i)
+        self.pits.require(near, warnings.count(BREEZE))
+        self.bats.require(near, warnings.count(RUSTLE))
+        stench = STENCH in warnings
+        self._weigh_wumpus([float(w != i and bool(near >> w & 1) == stench) for w in range(len(self.rooms))])
+
+    def observe_start(self, room: int, warnings: list[str]):
+        self.bats.exclude(1 << self.index[room])
+        self.observe_room(room, warnings)
+
+    def observe_bat(self, room: int, present: bool):
+        i = self.index[room]
+        if present:
+            self.bats.require(1 << i, 1)
+            self.pits.exclude(1 << i)
+            self._weigh_wumpus([float(w != i) for w in range(len(self.rooms))])
+        else:
+            self.bats.exclude(1 << i)
+            self.version += 1
+
+    def observe_miss(self, path: list[int]):
+        missed = {self.index[room] for room in path}
+        self._weigh_wumpus([0.0 if w in missed else 1.0 for w in range(len(self.rooms))])
+        moved = [p * (1 - WUMPUS_MOVE) for p in self.wumpus]
+        for w, p in enumerate(self.wumpus):
+            if p:
+                share = p * WUMPUS_MOVE / len(self.neighbors[w])
+                for v in self.neighbors[w]:
+                    moved[v] += share
+        self.wumpus = moved
+        self.version += 1
+
+    def wumpus_marginal(self) -> list[float]:
+        return list(self.wumpus)
+
+    def marginals(self) -> dict:
+        if self._cached is not None and self._cached[0] == self.version:
+            return self._cached[1]
+        pit, bat, wumpus = self.pits.marginal(), self.bats.marginal(), self.wumpus
+        result = {
+            'pit': pit,
+            'bat': bat,
+            'wumpus': list(wumpus),
+            'deadly': [p + w - p * w for p, w in zip(pit, wumpus)],
+        }
+        self._cached = (self.version, result)
+        return result
+
+    def probabilities(self) -> dict:
+        """ Same as marginals(), keyed by room number """
+        return {kind: dict(zip(self.rooms, values)) for kind, values in self.marginals().items()}
+
+
+class WumpusAgent:
+    """ Chooses moves and arrow paths from a WumpusKB (a FactoredKB for caves above EXACT_ROOMS).
+        decide() returns ('M', room) or ('S', path). """
+    def __init__(self, cave: dict = DODECAHEDRON, shoot_threshold: float = 0.5, arrows: int = 5,
+                 pits: int = PITS, bats: int = BATS):
+        self.cave = cave
+        self.kb = (WumpusKB if len(cave) <= EXACT_ROOMS else FactoredKB)(cave, pits, bats)
+        self.shoot_threshold = shoot_threshold
+        self.arrows = arrows
+        self.room = None
+        self.visits = {room: 0 for room in cave}
+        self.last_action = None
+        self.latencies = []  # seconds per decide()
+
+    def start(self, room: int, warnings: list[str]):
+        self.room = room
+        self.visits[room] += 1
+        self.kb.observe_start(room, warnings)
+
+    def observe(self, room: int, warnings: list[str], carried: bool = None):
+        """ Called after every action that the player survived. `carried` tells whether a bat
+            snatched the player (WumpusGame.carried); when unknown it is guessed from landing
+            elsewhere, which misses the 1 in 20 drops back into the bat room itself. """
+        kind, target = self.last_action
+        if kind == 'M':
+            self.kb.observe_bat(target, room != target if carried is None else carried)
+        else:
+            self.kb.observe_miss(target)
+        self.room = room
+        self.visits[room] += 1
+        self.kb.observe_room(room, warnings)
+
+    def arrow_paths(self) -> list[list[int]]:
+        """ Every path of 1 to 3 adjacent rooms that does not fly back into the player """
+        paths = [[r] for r in self.cave[self.room]]
+        frontier = paths
+        for _ in range(2):
+            frontier = [path + [r] for path in frontier for r in self.cave[path[-1]] if r != self.room]
+            paths += frontier
+        return paths
+
+    def decide(self):
+        start = time.perf_counter()
+        action = self._decide()
+        self.latencies.append(time.perf_counter() - start)
+        self.last_action = action
+        if action[0] == 'S':
+            self.arrows -= 1
+        return action
+
+    def _decide(self):
+        marginals = self.kb.marginals()
+        index = self.kb.index
+        wumpus = marginals['wumpus']
+
+        reach = None
+        if isinstance(self.cave, Cave):
+            reach = self.cave.arrow_reach[self.cave.index[self.room]]
+        if self.arrows > 0 and (reach is None or sum(wumpus[i] for i in bits(reach)) >= self.shoot_threshold):
+            best, chance = None, 0.0
+            for path in self.arrow_paths():
+                hit = sum(wumpus[index[r]] for r in set(path))
+                if hit > chance:
+                    best, chance = path, hit
+            if chance >= self.shoot_threshold:
+                return ('S', best)
+
+        # Dying when a bat drops the player somewhere: a pit or the wumpus among all rooms
+        drop_risk = (sum(marginals['pit']) + 1) / len(self.cave)
+
+        # Among equally risky rooms, head for where the wumpus most likely is
+        distance = None
+        if reach is not None:
+            distance = self.cave.distance[max(range(len(wumpus)), key=wumpus.__getitem__)]
+
+        def risk(room):
+            i = index[room]
+            tiebreak = 0.001 * distance[self.cave.index[room]] if distance is not None else 0.0
+            return marginals['deadly'][i] + marginals['bat'][i] * drop_risk + 0.01 * self.visits[room] + tiebreak
+
+        return ('M', min(self.cave[self.room], key=risk))
+
+    def latency(self) -> dict:
+        """ Per-decision latency summary in milliseconds """
+        if not self.latencies:
+            return {'decisions': 0}
+        ordered = sorted(self.latencies)
+        return {
+            'decisions': len(ordered),
+            'mean_ms': 1000 * sum(ordered) / len(ordered),
+            'p95_ms': 1000 * ordered[int(0.95 * (len(ordered) - 1))],
+            'max_ms': 1000 * ordered[-1],
+        }
+
+
+def play_agent(game: WumpusGame, agent: WumpusAgent, max_turns: int = 200) -> bool:
+    """ Lets the agent play one game to the end; returns True on a win """
+    agent.start(game.player, game.adjacent_hazards())
+    for _ in range(max_turns):
+        kind, target = agent.decide()
+        if kind == 'M':
+            game.move_player(target)
+        else:
+            game.shoot_arrow(target)
+        if game.game_over:
+            break
+        agent.observe(game.player, game.adjacent_hazards(), carried=game.carried)
+    return game.victory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--threshold", type=float, default=0.5, help="shoot when the hit chance reaches this")
+    parser.add_argument("--cave", default="dodecahedron", help="dodecahedron, grid:WxH, torus:WxH or regular:N[:D[:SEED]]")
+    parser.add_argument("--pits", type=int, default=PITS)
+    parser.add_argument("--bats", type=int, default=BATS)
+    parser.add_argument("--max-turns", type=int, default=200)
+    args = parser.parse_args()
+
+    cave = parse_cave(args.cave)
+    random.seed(args.seed)
+    wins = 0
+    latencies = []
+    for _ in range(args.games):
+        agent = WumpusAgent(cave, args.threshold, pits=args.pits, bats=args.bats)
+        game = WumpusGame(verbose=False, cave=cave, pit_count=args.pits, bat_count=args.bats)
+        wins += play_agent(game, agent, args.max_turns)
+        latencies += agent.latencies
+
+    latencies.sort()
+    print(f"games: {args.games}  wins: {wins} ({100 * wins / args.games:.1f}%)")
+    print(f"decisions: {len(latencies)}  mean {1000 * sum(latencies) / len(latencies):.3f} ms  "
+          f"p95 {1000 * latencies[int(0.95 * (len(latencies) - 1))]:.3f} ms  max {1000 * latencies[-1]:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
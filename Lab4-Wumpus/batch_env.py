@@ -0,0 +1,186 @@
+"""
+    N Wumpus games stepped at once with NumPy.
+
+    Rooms are indices 0..19 (room number - 1). Each game is one lane of the arrays
+        player, wumpus   int8 room index
+        pits, bats       uint32 bitmask over the rooms
+        arrows           int8
+        done, outcome    bool, int8 index into OUTCOMES (-1 while running)
+        carried          whether a bat carried the player off on the last move
+    and every step is a handful of array operations over all lanes, using the
+    precomputed NEIGHBORS table and ADJACENT matrix instead of CAVE lookups.
+    Transitions follow WumpusGame exactly (same placement distribution, same
+    bat drop, ricochet and 75% Wumpus move); only the order in which random
+    numbers are drawn differs, so single games are not reproduced bit for bit.
+
+        env = BatchWumpusEnv(10000, seed=0)
+        obs = env.reset()
+        obs = env.step(kind, target, path)   # kind: MOVE / SHOOT, target: room numbers, path: (N, 3), 0 = unused
+
+    np.bitwise_count needs NumPy 2.0; older versions count bits through unpackbits.
+"""
+
+import numpy as np
+
+from main import CAVE
+
+ROOMS = len(CAVE)
+NEIGHBORS = np.array([[r - 1 for r in CAVE[room]] for room in sorted(CAVE)], dtype=np.int8)  # (20, 3)
+ADJACENT = np.zeros((ROOMS, ROOMS), dtype=bool)
+ADJACENT[np.repeat(np.arange(ROOMS), NEIGHBORS.shape[1]), NEIGHBORS.ravel()] = True
+NEIGHBOR_MASK = (np.uint32(1) << NEIGHBORS.astype(np.uint32)).sum(axis=1, dtype=np.uint32)
+
+MOVE, SHOOT = 0, 1
+UNUSED = -1  # path entry 0 (room index -1): the arrow path ended before it
+OUTCOMES = ['won', 'wumpus', 'pit', 'bat_wumpus', 'bat_pit', 'arrow', 'wumpus_moved']
+WON, WUMPUS, PIT, BAT_WUMPUS, BAT_PIT, ARROW, WUMPUS_MOVED = range(len(OUTCOMES))
+
+
+def _bit_count(masks: np.ndarray) -> np.ndarray:
+    """ Set bits per uint32 mask """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks)
+    return np.unpackbits(masks.view(np.uint8).reshape(-1, 4), axis=1).sum(axis=1, dtype=np.uint8)
+
+
+class BatchWumpusEnv:
+    """ `n` independent games in NumPy arrays """
+    def __init__(self, n: int, seed=None):
+        self.n = n
+        self.rng = np.random.default_rng(seed)
+        self.player  = np.zeros(n, dtype=np.int8)
+        self.wumpus  = np.zeros(n, dtype=np.int8)
+        self.pits    = np.zeros(n, dtype=np.uint32)
+        self.bats    = np.zeros(n, dtype=np.uint32)
+        self.arrows  = np.zeros(n, dtype=np.int8)
+        self.done    = np.zeros(n, dtype=bool)
+        self.outcome = np.full(n, -1, dtype=np.int8)
+        self.carried = np.zeros(n, dtype=bool)
+        self.turn    = np.zeros(n, dtype=np.int32)
+
+    def reset(self, lanes=None) -> dict:
+        """ New games in `lanes` (a bool mask or indices; all lanes when omitted) """
+        lanes = self._lanes(lanes)
+        k = len(lanes)
+        # A random permutation per game: wumpus, 2 pits, 2 bats, then the player among the other 15,
+        # which is the same distribution as reset_game's choice/sample/sample/choice
+        order = self.rng.random((k, ROOMS)).argsort(axis=1).astype(np.int8)
+        bit = np.uint32(1) << order.astype(np.uint32)
+        self.wumpus[lanes] = order[:, 0]
+        self.pits[lanes]   = bit[:, 1] | bit[:, 2]
+        self.bats[lanes]   = bit[:, 3] | bit[:, 4]
+        self.player[lanes] = order[np.arange(k), 5 + self.rng.integers(ROOMS - 5, size=k)]
+        self.arrows[lanes] = 5
+        self.done[lanes] = False
+        self.outcome[lanes] = -1
+        self.carried[lanes] = False
+        self.turn[lanes] = 0
+        return self.observation()
+
+    def _lanes(self, lanes) -> np.ndarray:
+        if lanes is None:
+            return np.arange(self.n)
+        lanes = np.asarray(lanes)
+        return np.flatnonzero(lanes) if lanes.dtype == bool else lanes
+
+    def load(self, game, lanes=None):
+        """ Copies the state of a scalar WumpusGame into `lanes` (all lanes when omitted) """
+        lanes = self._lanes(lanes)
+        self.player[lanes] = game.player - 1
+        self.wumpus[lanes] = game.wumpus - 1
+        self.pits[lanes] = sum(1 << (r - 1) for r in game.pits)
+        self.bats[lanes] = sum(1 << (r - 1) for r in game.bats)
+        self.arrows[lanes] = game.arrows
+        self.done[lanes] = game.game_over
+        self.outcome[lanes] = OUTCOMES.index(game.outcome) if game.outcome else -1
+        self.carried[lanes] = game.carried
+        self.turn[lanes] = 0
+
+    def observation(self) -> dict:
+        """ What each player perceives: room number, neighbor room numbers and warning counts """
+        near = NEIGHBOR_MASK[self.player]
+        return {
+            'room': self.player + 1,
+            'neighbors': NEIGHBORS[self.player] + 1,
+            'stench': ADJACENT[self.player, self.wumpus],
+            'breeze': _bit_count(near & self.pits),
+            'rustle': _bit_count(near & self.bats),
+            'arrows': self.arrows.copy(),
+            'carried': self.carried.copy(),
+            'done': self.done.copy(),
+            'outcome': self.outcome.copy(),
+        }
+
+    def _end(self, lanes: np.ndarray, outcome: int):
+        self.done[lanes] = True
+        self.outcome[lanes] = outcome
+
+    def _has(self, masks: np.ndarray, rooms: np.ndarray) -> np.ndarray:
+        return (masks >> rooms.astype(np.uint32)) & 1 == 1
+
+    def step(self, kind, target=None, path=None) -> dict:
+        """ One action per lane. kind: (N,) MOVE or SHOOT; target: (N,) room numbers for moves;
+            path: (N, 3) room numbers for arrows, 0 from where the path is shorter (any other room
+            that is not a tunnel away ricochets, as in shoot_arrow). Finished lanes are skipped. """
+        kind = np.broadcast_to(np.asarray(kind), (self.n,))
+        active = ~self.done
+        self.carried[:] = False
+
+        moving = np.flatnonzero(active & (kind == MOVE))
+        if len(moving):
+            self._move(moving, np.broadcast_to(np.asarray(target), (self.n,))[moving] - 1)
+        shooting = np.flatnonzero(active & (kind == SHOOT))
+        if len(shooting):
+            self._shoot(shooting, np.asarray(path).reshape(self.n, -1)[shooting] - 1)
+
+        self.turn[active] += 1
+        return self.observation()
+
+    def _move(self, lanes: np.ndarray, target: np.ndarray):
+        # Moves to a non-adjacent room are refused, as in move_player
+        allowed = (target >= 0) & (target < ROOMS) & ADJACENT[self.player[lanes], np.clip(target, 0, ROOMS - 1)]
+        lanes, target = lanes[allowed], target[allowed]
+        self.player[lanes] = target
+
+        eaten = self.wumpus[lanes] == target
+        fell = ~eaten & self._has(self.pits[lanes], target)
+        self._end(lanes[eaten], WUMPUS)
+        self._end(lanes[fell], PIT)
+
+        bat = ~eaten & ~fell & self._has(self.bats[lanes], target)
+        lanes = lanes[bat]
+        self.carried[lanes] = True
+        drop = self.rng.integers(ROOMS, size=len(lanes)).astype(np.int8)
+        self.player[lanes] = drop
+        eaten = self.wumpus[lanes] == drop
+        fell = ~eaten & self._has(self.pits[lanes], drop)
+        self._end(lanes[eaten], BAT_WUMPUS)
+        self._end(lanes[fell], BAT_PIT)
+
+    def _shoot(self, lanes: np.ndarray, path: np.ndarray):
+        loaded = self.arrows[lanes] > 0
+        lanes, path = lanes[loaded], path[loaded]
+        self.arrows[lanes] -= 1
+
+        room = self.player[lanes].copy()
+        flying = np.ones(len(lanes), dtype=bool)
+        for k in range(path.shape[1]):
+            flying &= path[:, k] != UNUSED
+            nxt = path[:, k].copy()
+            # Ricochet: a room that is not adjacent (or does not exist) is replaced by a random tunnel
+            adjacent = (nxt >= 0) & (nxt < ROOMS) & ADJACENT[room, np.clip(nxt, 0, ROOMS - 1)]
+            bounce = flying & ~adjacent
+            nxt[bounce] = NEIGHBORS[room[bounce], self.rng.integers(NEIGHBORS.shape[1], size=int(bounce.sum()))]
+            room = np.where(flying, nxt, room)
+
+            hit = flying & (room == self.wumpus[lanes])
+            self._end(lanes[hit], WON)
+            suicide = flying & ~hit & (room == self.player[lanes])
+            self._end(lanes[suicide], ARROW)
+            flying &= ~hit & ~suicide
+
+        # Missed: the wumpus wakes up with probability 0.75
+        missed = lanes[~self.done[lanes]]
+        wakes = missed[self.rng.random(len(missed)) < 0.75]
+        self.wumpus[wakes] = NEIGHBORS[self.wumpus[wakes], self.rng.integers(NEIGHBORS.shape[1], size=len(wakes))]
+        self._end(wakes[self.wumpus[wakes] == self.player[wakes]], WUMPUS_MOVED)
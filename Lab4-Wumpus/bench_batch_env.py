@@ -0,0 +1,113 @@
+"""
+    Checks BatchWumpusEnv against WumpusGame and measures its throughput.
+
+    Check: for random game states and actions (moves into bat rooms, arrows that
+    ricochet, misses that wake the Wumpus), the same state is stepped --samples
+    times by the scalar game and once in --samples batch lanes. The total
+    variation distance between the two distributions of (outcome, player room,
+    wumpus room) must stay below --tolerance.
+    Throughput: --lanes games play random moves and shots, finished games are reset.
+
+    Usage:
+        python bench_batch_env.py --lanes 100000 --steps 200 --samples 20000
+"""
+
+import argparse
+import copy
+import random
+import time
+from collections import Counter
+
+import numpy as np
+
+from batch_env import MOVE, OUTCOMES, SHOOT, BatchWumpusEnv
+from main import CAVE, WumpusGame
+
+
+def scenarios(rng: random.Random, count: int):
+    """ (game, action) pairs that exercise every random transition """
+    result = []
+    while len(result) < count:
+        game = WumpusGame(rng=random.Random(rng.random()), verbose=False)
+        near = CAVE[game.player]
+        bats = [r for r in near if r in game.bats]
+        if bats:
+            result.append((game, ('M', [bats[0]])))
+        far = [r for r in CAVE if r not in near and r != game.player]
+        result.append((game, ('S', rng.sample(far, 3))))  # ricochets at every step
+        path = [near[0]]
+        path.append(rng.choice([r for r in CAVE[path[0]] if r != game.player]))
+        result.append((game, ('S', path)))
+        result.append((game, ('S', [near[0], -3, rng.choice(far)])))  # a room that does not exist ricochets
+    return result
+
+
+def scalar_distribution(game: WumpusGame, action, samples: int, seed: int) -> Counter:
+    counts = Counter()
+    for i in range(samples):
+        copy_game = copy.copy(game)
+        copy_game.pits, copy_game.bats = set(game.pits), set(game.bats)
+        copy_game.rng = random.Random(seed * samples + i)
+        kind, target = action
+        if kind == 'M':
+            copy_game.move_player(target[0])
+        else:
+            copy_game.shoot_arrow(target)
+        counts[(copy_game.outcome, copy_game.player, copy_game.wumpus)] += 1
+    return counts
+
+
+def batch_distribution(game: WumpusGame, action, samples: int, seed: int) -> Counter:
+    env = BatchWumpusEnv(samples, seed=seed)
+    env.load(game)
+    kind, target = action
+    if kind == 'M':
+        env.step(MOVE, target=target[0])
+    else:
+        path = np.zeros((samples, 3), dtype=np.int64)
+        path[:, :len(target)] = target
+        env.step(SHOOT, path=path)
+    outcomes = [OUTCOMES[o] if o >= 0 else None for o in env.outcome]
+    return Counter(zip(outcomes, (env.player + 1).tolist(), (env.wumpus + 1).tolist()))
+
+
+def throughput(lanes: int, steps: int, seed: int) -> float:
+    env = BatchWumpusEnv(lanes, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    obs = env.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        kind = np.where(obs['stench'] & (rng.random(lanes) < 0.5), SHOOT, MOVE)
+        target = obs['neighbors'][np.arange(lanes), rng.integers(3, size=lanes)]
+        path = np.zeros((lanes, 3), dtype=np.int64)
+        path[:, 0] = target
+        env.step(kind, target, path)
+        obs = env.reset(env.done)
+    return lanes * steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lanes", type=int, default=100000)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--scenarios", type=int, default=8)
+    parser.add_argument("--tolerance", type=float, default=0.03)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    worst = 0.0
+    for i, (game, action) in enumerate(scenarios(random.Random(args.seed), args.scenarios)):
+        scalar = scalar_distribution(game, action, args.samples, args.seed + i)
+        batch = batch_distribution(game, action, args.samples, args.seed + i)
+        distance = sum(abs(scalar[k] - batch[k]) for k in scalar.keys() | batch.keys()) / (2 * args.samples)
+        worst = max(worst, distance)
+        print(f"scenario {i:>2} {action[0]} {str(action[1]):<14} outcomes {len(scalar):>3}  TV distance {distance:.4f}")
+    print(f"worst TV distance {worst:.4f} ({'ok' if worst < args.tolerance else 'MISMATCH'})")
+
+    print(f"throughput: {throughput(args.lanes, args.steps, args.seed):,.0f} game steps/s "
+          f"({args.lanes} lanes x {args.steps} steps)")
+
+
+if __name__ == '__main__':
+    main()
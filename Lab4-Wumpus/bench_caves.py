@@ -0,0 +1,71 @@
+"""
+    Builds generated caves and measures their indexes, the game and the agent on them.
+
+    For every cave spec: time to build the Cave (adjacency bitsets, all-pairs
+    distances, arrow reach), size of the distance matrix, random game steps per
+    second (warnings, moves and arrows), and WumpusAgent latency per decision
+    over --games games with --pits pits and --bats bats.
+
+    Usage:
+        python bench_caves.py --caves dodecahedron torus:40x40 regular:2000:3 grid:70x70
+"""
+
+import argparse
+import random
+import time
+
+from agent import WumpusAgent, play_agent
+from caves import parse_cave
+from main import WumpusGame
+
+
+def game_steps(cave, steps: int, pits: int, bats: int) -> float:
+    """ Random moves and 1-room shots per second, restarting finished games """
+    rng = random.Random(0)
+    game = WumpusGame(rng=rng, verbose=False, cave=cave, pit_count=pits, bat_count=bats)
+    start = time.perf_counter()
+    for _ in range(steps):
+        game.adjacent_hazards()
+        target = rng.choice(cave[game.player])
+        if rng.random() < 0.1 and game.arrows:
+            game.shoot_arrow([target])
+        else:
+            game.move_player(target)
+        if game.game_over:
+            game.reset_game()
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--caves", nargs="+", default=["dodecahedron", "torus:40x40", "regular:2000:3", "grid:70x70"])
+    parser.add_argument("--pits", type=int, default=20)
+    parser.add_argument("--bats", type=int, default=20)
+    parser.add_argument("--games", type=int, default=3)
+    parser.add_argument("--max-turns", type=int, default=1000)
+    parser.add_argument("--steps", type=int, default=100000)
+    args = parser.parse_args()
+
+    for spec in args.caves:
+        start = time.perf_counter()
+        cave = parse_cave(spec)
+        build = time.perf_counter() - start
+        # The classic cave keeps its classic 2 + 2 hazards
+        pits, bats = (2, 2) if len(cave) <= 20 else (args.pits, args.bats)
+
+        random.seed(0)
+        latencies, wins = [], 0
+        for _ in range(args.games):
+            agent = WumpusAgent(cave, pits=pits, bats=bats)
+            game = WumpusGame(verbose=False, cave=cave, pit_count=pits, bat_count=bats)
+            wins += play_agent(game, agent, args.max_turns)
+            latencies += agent.latencies
+
+        print(f"{spec:<16} {len(cave):>5} rooms  build {1000 * build:8.1f} ms  "
+              f"distances {cave.distance.nbytes / 2**20:6.1f} MB (diameter {cave.distance.max()})  "
+              f"{game_steps(cave, args.steps, pits, bats):9,.0f} game steps/s  "
+              f"agent {1000 * sum(latencies) / len(latencies):6.2f} ms/decision, {wins}/{args.games} won")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,245 @@
+"""
+    Cave topologies for WumpusGame and the indexes built for them.
+
+    A Cave is the plain {room: [neighbor rooms]} dict the game has always used
+    (so cave[room] still lists the tunnels), plus indexes built once when it is
+    created. Rooms get indices 0..n-1 in sorted order; `index` maps back.
+        masks        adjacency bitsets, bit j of masks[i] set when rooms i and j connect
+        distance     n x n uint16 matrix of tunnel distances (UNREACHABLE if none)
+        arrow_reach  bitset per room of the rooms an arrow path of 1 to 3 rooms can
+                     reach from it (never the room itself: such a path kills the shooter)
+    The distance matrix comes from one breadth-first search run for all sources
+    at once: row v of a packed bit matrix holds the sources that have reached
+    room v, and a level ORs the rows of v's neighbors. The level number is
+    written straight into bit planes of the result, so nothing is unpacked
+    until the end. A 5000-room torus takes about a second.
+
+    Generators: grid(width, height), torus(width, height) and
+    random_regular(rooms, degree, seed), or parse_cave("torus:40x40");
+    main.DODECAHEDRON is the classic cave.
+"""
+
+import random
+from collections import Counter
+
+import numpy as np
+
+UNREACHABLE = np.iinfo(np.uint16).max
+
+
+class Cave(dict):
+    """ {room: [neighbor rooms]} with adjacency bitsets, all-pairs distances and arrow reach """
+    def __init__(self, tunnels: dict, name: str = 'cave'):
+        super().__init__((room, list(near)) for room, near in tunnels.items())
+        if not self:
+            raise ValueError("a cave needs at least one room")
+        self.name = name
+        self.rooms = sorted(self)
+        self.index = {room: i for i, room in enumerate(self.rooms)}
+        for room, near in self.items():
+            for other in near:
+                if other not in self:
+                    raise ValueError(f"room {room} has a tunnel to missing room {other}")
+                if room not in self[other]:
+                    raise ValueError(f"tunnel {room} -> {other} has no way back")
+                if other == room:
+                    raise ValueError(f"room {room} has a tunnel to itself")
+
+        index = self.index
+        self.masks = [sum(1 << index[r] for r in self[room]) for room in self.rooms]
+        self.distance = self._distances()
+        self.arrow_reach = []
+        for i, mask in enumerate(self.masks):
+            reach = frontier = mask
+            for _ in range(2):
+                step = 0
+                for j in _bits(frontier):
+                    step |= self.masks[j]
+                frontier = step & ~reach
+                reach |= step
+            self.arrow_reach.append(reach & ~(1 << i))
+
+    def _distances(self) -> np.ndarray:
+        n = len(self.rooms)
+        degree = max(1, max(len(near) for near in self.values()))  # a column even if no room has tunnels
+        # Neighbor index table, padded with the room itself (harmless in an OR)
+        neighbors = np.arange(n)[:, None].repeat(degree, axis=1)
+        for i, room in enumerate(self.rooms):
+            neighbors[i, :len(self[room])] = [self.index[r] for r in self[room]]
+
+        reached = np.packbits(np.eye(n, dtype=bool), axis=1)  # row v: sources that reached v
+        planes = []  # bit planes of the distances, packed like `reached`
+        level = 0
+        while True:
+            level += 1
+            step = reached[neighbors[:, 0]]
+            for k in range(1, degree):
+                step |= reached[neighbors[:, k]]
+            frontier = step & ~reached
+            if not frontier.any():
+                break
+            reached |= frontier
+            while len(planes) < level.bit_length():
+                planes.append(np.zeros_like(reached))
+            for b in range(level.bit_length()):
+                if level >> b & 1:
+                    planes[b] |= frontier
+
+        distance = np.zeros((n, n), dtype=np.uint16)
+        for b, plane in enumerate(planes):
+            distance |= np.unpackbits(plane, axis=1, count=n).astype(np.uint16) << b
+        distance[~np.unpackbits(reached, axis=1, count=n).astype(bool)] = UNREACHABLE
+        return distance
+
+    def adjacent(self, a, b) -> bool:
+        """ Whether a tunnel joins rooms a and b (False for rooms that do not exist) """
+        i, j = self.index.get(a), self.index.get(b)
+        return i is not None and j is not None and bool(self.masks[i] >> j & 1)
+
+    def distance_between(self, a, b) -> int:
+        return int(self.distance[self.index[a], self.index[b]])
+
+    def in_arrow_reach(self, a, b) -> bool:
+        """ Whether an arrow shot from a can fly through b """
+        return bool(self.arrow_reach[self.index[a]] >> self.index[b] & 1)
+
+    def reachable_by_arrow(self, room) -> list:
+        return [self.rooms[j] for j in _bits(self.arrow_reach[self.index[room]])]
+
+
+def _bits(mask: int) -> list[int]:
+    result = []
+    while mask:
+        low = mask & -mask
+        result.append(low.bit_length() - 1)
+        mask ^= low
+    return result
+
+
+def grid(width: int, height: int) -> Cave:
+    """ Rooms 1..width*height row by row, tunnels to the 2 to 4 orthogonal neighbors """
+    tunnels = {}
+    for y in range(height):
+        for x in range(width):
+            near = [(x + dx, y + dy) for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0))]
+            tunnels[y * width + x + 1] = [ny * width + nx + 1 for nx, ny in near
+                                          if 0 <= nx < width and 0 <= ny < height]
+    return Cave(tunnels, f"grid:{width}x{height}")
+
+
+def torus(width: int, height: int) -> Cave:
+    """ A grid whose edges wrap around: every room has 4 tunnels """
+    if width < 3 or height < 3:
+        raise ValueError("a torus needs at least 3 rooms each way")
+    tunnels = {}
+    for y in range(height):
+        for x in range(width):
+            near = [((x + dx) % width, (y + dy) % height) for dx, dy in ((0, -1), (1, 0), (0, 1), (-1, 0))]
+            tunnels[y * width + x + 1] = [ny * width + nx + 1 for nx, ny in near]
+    return Cave(tunnels, f"torus:{width}x{height}")
+
+
+def random_regular(rooms: int, degree: int = 3, seed=None) -> Cave:
+    """ A connected random graph where every room has `degree` tunnels (see _regular_tunnels).
+        Above half the rooms, the sparse complement is drawn instead: a graph that dense is
+        always connected. """
+    if rooms * degree % 2 or degree >= rooms:
+        raise ValueError("rooms * degree must be even and degree < rooms")
+    if degree < 2 and rooms > 2:
+        raise ValueError("a cave with fewer than 2 tunnels per room cannot be connected")
+    rng = random.Random(seed)
+    if 2 * degree > rooms - 1:
+        missing = _regular_tunnels(rooms, rooms - 1 - degree, rng, connected=False)
+        tunnels = {room: [other for other in range(1, rooms + 1) if other != room and other not in missing[room]]
+                   for room in range(1, rooms + 1)}
+    else:
+        tunnels = _regular_tunnels(rooms, degree, rng, connected=True)
+    return Cave(tunnels, f"regular:{rooms}:{degree}:{seed}")
+
+
+def _regular_tunnels(rooms: int, degree: int, rng: random.Random, connected: bool) -> dict:
+    """ Pairing model: deal out `degree` tunnel ends per room and pair them at random. Loops
+        and double tunnels are then repaired by switching each one with a random other tunnel,
+        (a, b) + (c, d) -> (a, c) + (b, d), and separate parts are joined by the same switch
+        across them. Only the bad tunnels are redrawn, so high degrees cost no more than low
+        ones; the number of switches is capped. """
+    ends = [room for room in range(1, rooms + 1) for _ in range(degree)]
+    rng.shuffle(ends)
+    edges = [(a, b) for a, b in zip(ends[0::2], ends[1::2])]
+    count = Counter(frozenset(edge) for edge in edges)
+
+    def ok(a, b) -> bool:
+        return a != b and frozenset((a, b)) not in count
+
+    def switch(i: int, j: int) -> bool:
+        """ Replaces edges i and j by a crossed pair of simple, new tunnels, if there is one """
+        (a, b), (c, d) = edges[i], edges[j]
+        if rng.random() < 0.5:
+            c, d = d, c
+        old = frozenset(edges[i]), frozenset(edges[j])
+        for edge in old:
+            count[edge] -= 1
+            if not count[edge]:
+                del count[edge]
+        done = i != j and ok(a, c) and ok(b, d) and frozenset((a, c)) != frozenset((b, d))
+        if done:
+            edges[i], edges[j] = (a, c), (b, d)
+        for edge in (edges[i], edges[j]):
+            count[frozenset(edge)] += 1
+        return done
+
+    budget = 100 * len(edges) + 100
+    bad = [i for i, (a, b) in enumerate(edges) if a == b or count[frozenset((a, b))] > 1]
+    while bad:
+        i = bad.pop()
+        a, b = edges[i]
+        if a != b and count[frozenset((a, b))] == 1:
+            continue  # its twin was switched away already
+        while not switch(i, rng.randrange(len(edges))):
+            budget -= 1
+            if budget <= 0:
+                raise ValueError(f"no simple {degree}-regular cave of {rooms} rooms found")
+
+    while True:
+        tunnels = {room: [] for room in range(1, rooms + 1)}
+        for a, b in edges:
+            tunnels[a].append(b)
+            tunnels[b].append(a)
+        part = _component(tunnels)
+        if not connected or len(part) == rooms:
+            return tunnels
+        inside = [i for i, (a, _) in enumerate(edges) if a in part]
+        outside = [i for i, (a, _) in enumerate(edges) if a not in part]
+        while not switch(rng.choice(inside), rng.choice(outside)) and budget > 0:
+            budget -= 1
+        budget -= 1
+        if budget <= 0:
+            raise ValueError(f"no connected {degree}-regular cave of {rooms} rooms found")
+
+
+def _component(tunnels: dict) -> set:
+    """ The rooms connected to the first room """
+    start = next(iter(tunnels))
+    seen, stack = {start}, [start]
+    while stack:
+        for other in tunnels[stack.pop()]:
+            if other not in seen:
+                seen.add(other)
+                stack.append(other)
+    return seen
+
+
+def parse_cave(spec: str) -> Cave:
+    """ "dodecahedron", "grid:WxH", "torus:WxH" or "regular:ROOMS[:DEGREE[:SEED]]" """
+    kind, _, args = spec.partition(':')
+    if kind == 'dodecahedron':
+        from main import DODECAHEDRON  # main imports this module
+        return DODECAHEDRON
+    if kind in ('grid', 'torus'):
+        width, height = map(int, args.split('x'))
+        return grid(width, height) if kind == 'grid' else torus(width, height)
+    if kind == 'regular':
+        parts = args.split(':')
+        return random_regular(int(parts[0]), int(parts[1]) if len(parts) > 1 else 3,
+                              int(parts[2]) if len(parts) > 2 else 0)
+    raise ValueError(f"unknown cave {spec!r}")
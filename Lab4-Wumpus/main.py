@@ -1,5 +1,12 @@
 import random
 
+from caves import Cave
+
+# Warnings returned by adjacent_hazards, one per neighboring hazard
+STENCH = "You smell a terrible stench."
+BREEZE = "You feel a breeze."
+RUSTLE = "You hear rustling of bat wings."
+
 # The cave is a dodecahedron: 20 rooms, each connected to 3 others.
 CAVE = {
     1:  [2, 5, 8],
@@ -23,104 +30,129 @@ CAVE = {
     19: [11, 18, 20],
     20: [13, 16, 19]
 }
+DODECAHEDRON = Cave(CAVE, 'dodecahedron')  # CAVE with its indexes, the default topology (see caves.py)
 
 class WumpusGame:
-    def __init__(self):
+    def __init__(self, rng=None, verbose: bool = True, cave: Cave = None, pit_count: int = 2, bat_count: int = 2):
+        # rng: anything with choice/sample/random (a random.Random for a private seeded stream)
+        self.rng = rng or random
+        self.verbose = verbose
+        self.cave = cave or DODECAHEDRON
+        self.pit_count = pit_count
+        self.bat_count = bat_count
         self.reset_game()
 
+    def say(self, message: str):
+        if self.verbose:
+            print(message)
+
     def reset_game(self):
-        rooms = list(CAVE.keys())
-        self.wumpus = random.choice(rooms)
+        rooms = self.cave.rooms
+        self.wumpus = self.rng.choice(rooms)
         hazard_rooms = {self.wumpus}
 
         # Place pits
-        self.pits = set(random.sample([r for r in rooms if r not in hazard_rooms], 2))
+        self.pits = set(self.rng.sample([r for r in rooms if r not in hazard_rooms], self.pit_count))
         hazard_rooms.update(self.pits)
 
         # Place bats
-        self.bats = set(random.sample([r for r in rooms if r not in hazard_rooms], 2))
+        self.bats = set(self.rng.sample([r for r in rooms if r not in hazard_rooms], self.bat_count))
         hazard_rooms.update(self.bats)
 
         # Place player
         available_rooms = [r for r in rooms if r not in hazard_rooms]
-        self.player = random.choice(available_rooms)
+        self.player = self.rng.choice(available_rooms)
 
         self.arrows = 5
         self.game_over = False
         self.victory = False
+        self.outcome = None   # how the game ended: 'won', 'wumpus', 'pit', 'bat_wumpus', 'bat_pit', 'arrow', 'wumpus_moved'
+        self.carried = False  # whether a bat carried the player off on the last move
 
     def adjacent_hazards(self):
         warnings = []
-        for neighbor in CAVE[self.player]:
+        for neighbor in self.cave[self.player]:
             if neighbor == self.wumpus:
-                warnings.append("You smell a terrible stench.")
+                warnings.append(STENCH)
             if neighbor in self.pits:
-                warnings.append("You feel a breeze.")
+                warnings.append(BREEZE)
             if neighbor in self.bats:
-                warnings.append("You hear rustling of bat wings.")
+                warnings.append(RUSTLE)
         return warnings
 
     def move_player(self, room):
-        if room not in CAVE[self.player]:
-            print("You can't move there; it's not adjacent.")
+        self.carried = False
+        if not self.cave.adjacent(self.player, room):
+            self.say("You can't move there; it's not adjacent.")
             return
         self.player = room
 
         if self.player == self.wumpus:
-            print("You entered the Wumpus's room! It ate you. Game over.")
-            self.game_over = True
+            self.say("You entered the Wumpus's room! It ate you. Game over.")
+            self.end('wumpus')
         elif self.player in self.pits:
-            print("You fell into a bottomless pit! Game over.")
-            self.game_over = True
+            self.say("You fell into a bottomless pit! Game over.")
+            self.end('pit')
         elif self.player in self.bats:
-            print("A bat snatches you! It drops you in a random room.")
-            self.player = random.choice(list(CAVE.keys()))
+            self.say("A bat snatches you! It drops you in a random room.")
+            self.carried = True
+            self.player = self.rng.choice(self.cave.rooms)
             # Check for hazards again after being dropped
             if self.player == self.wumpus:
-                print("You were dropped into the Wumpus's room! It ate you. Game over.")
-                self.game_over = True
+                self.say("You were dropped into the Wumpus's room! It ate you. Game over.")
+                self.end('bat_wumpus')
             elif self.player in self.pits:
-                print("You were dropped into a pit! Game over.")
-                self.game_over = True
+                self.say("You were dropped into a pit! Game over.")
+                self.end('bat_pit')
+
+    def end(self, outcome: str):
+        self.game_over = True
+        self.victory = outcome == 'won'
+        self.outcome = outcome
 
     def shoot_arrow(self, path):
         if self.arrows <= 0:
-            print("You have no arrows left!")
+            self.say("You have no arrows left!")
             return
         self.arrows -= 1
         room = self.player
         for next_room in path:
-            if next_room not in CAVE[room]:
+            if not self.cave.adjacent(room, next_room):
                 # Ricochet: arrow bounces to a random adjacent room
-                next_room = random.choice(CAVE[room])
+                next_room = self.rng.choice(self.cave[room])
             room = next_room
             if room == self.wumpus:
-                print("Your arrow strikes true! You killed the Wumpus. You win!")
-                self.victory = True
-                self.game_over = True
+                self.say("Your arrow strikes true! You killed the Wumpus. You win!")
+                self.end('won')
                 return
             if room == self.player:
-                print("Your arrow came back and killed you! Game over.")
-                self.game_over = True
+                self.say("Your arrow came back and killed you! Game over.")
+                self.end('arrow')
                 return
-        print("Your arrow missed.")
+        self.say("Your arrow missed.")
         # Wumpus might move after a missed shot
-        if random.random() < 0.75:
+        if self.rng.random() < 0.75:
             self.move_wumpus()
 
     def move_wumpus(self):
-        self.wumpus = random.choice(CAVE[self.wumpus])
+        self.wumpus = self.rng.choice(self.cave[self.wumpus])
         if self.wumpus == self.player:
-            print("You hear a rumble... The Wumpus moved into your room and ate you! Game over.")
-            self.game_over = True
+            self.say("You hear a rumble... The Wumpus moved into your room and ate you! Game over.")
+            self.end('wumpus_moved')
 
-    def play(self):
+    def play(self, advisor=None):
+        """ Interactive game. An advisor (e.g. solver.Advisor) gets start(room, warnings, arrows),
+            record(action, room, warnings, carried) after every action, and suggest() each turn. """
         print("Welcome to Kill the Wumpus!")
+        if advisor:
+            advisor.start(self.player, self.adjacent_hazards(), self.arrows)
         while not self.game_over:
             print(f"\nYou are in room {self.player}.")
-            print("Tunnels lead to rooms:", ", ".join(str(r) for r in CAVE[self.player]))
+            print("Tunnels lead to rooms:", ", ".join(str(r) for r in self.cave[self.player]))
             for warning in self.adjacent_hazards():
                 print(warning)
+            if advisor:
+                print(f"Advisor: {advisor.suggest()}")
             action = input("Move or Shoot (M/S)? ").strip().upper()
             if action == 'M':
                 try:
@@ -128,6 +160,7 @@ class WumpusGame:
                 except ValueError:
                     print("That's not a valid room number.")
                     continue
+                taken = ('M', dest) if self.cave.adjacent(self.player, dest) else None
                 self.move_player(dest)
             elif action == 'S':
                 try:
@@ -138,9 +171,20 @@ class WumpusGame:
                 if len(path) > 3:
                     print("You can only shoot through up to 3 rooms.")
                     continue
+                # After a ricochet the arrow's rooms are unknown; only the valid start of the path is certain
+                valid, room = [], self.player
+                for next_room in path:
+                    if not self.cave.adjacent(room, next_room):
+                        break
+                    valid.append(next_room)
+                    room = next_room
+                taken = ('S', valid) if self.arrows > 0 else None
                 self.shoot_arrow(path)
             else:
                 print("Invalid action. Choose M or S.")
+                continue
+            if advisor and taken and not self.game_over:
+                advisor.record(taken, self.player, self.adjacent_hazards(), self.carried)
 
         if self.victory:
             print("Congratulations, you have slain the Wumpus!")
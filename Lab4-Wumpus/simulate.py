@@ -0,0 +1,237 @@
+"""
+    Headless Monte Carlo runs of WumpusGame for comparing policies.
+
+    WumpusEnv wraps a silent WumpusGame behind an action/observation API:
+        observation = env.reset()
+        observation, done = env.step(('M', room))    or  env.step(('S', [r1, r2, r3]))
+    Every game gets its own random streams seeded from (seed, game index), one
+    for the cave and one for the policy, so results do not depend on how games
+    are split over worker processes.
+
+    A policy is a class built as Policy(rng) with reset(observation) and
+    act(observation) -> action. Built in: 'random', 'cautious' and 'agent'
+    (the exact-inference WumpusAgent). Others can be given as module:Class.
+
+    Usage:
+        python simulate.py --policies random cautious --games 1000000 --workers 4
+        python simulate.py --policies agent --games 2000 --json results.json
+        python simulate.py --policies agent --cave regular:2000:3 --pits 20 --bats 20 --max-turns 2000
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from agent import WumpusAgent
+from caves import parse_cave
+from main import BREEZE, STENCH, WumpusGame
+
+OUTCOMES = ['won', 'wumpus', 'pit', 'bat_wumpus', 'bat_pit', 'arrow', 'wumpus_moved', 'timeout']
+
+
+class WumpusEnv:
+    """ Silent WumpusGame with an action/observation API and a private random stream """
+    def __init__(self, seed=None, cave=None, pits: int = 2, bats: int = 2):
+        self.game = WumpusGame(rng=random.Random(seed), verbose=False, cave=cave, pit_count=pits, bat_count=bats)
+        self.turn = 0
+
+    def reset(self, seed=None) -> dict:
+        if seed is not None:
+            self.game.rng.seed(seed)
+        self.game.reset_game()
+        self.turn = 0
+        return self.observation()
+
+    def observation(self) -> dict:
+        game = self.game
+        return {
+            'room': game.player,
+            'neighbors': game.cave[game.player],
+            'warnings': game.adjacent_hazards(),
+            'arrows': game.arrows,
+            'carried': game.carried,
+            'turn': self.turn,
+            'cave': game.cave,  # the rules of the game: map and hazard counts
+            'pit_count': game.pit_count,
+            'bat_count': game.bat_count,
+        }
+
+    def step(self, action) -> tuple[dict, bool]:
+        kind, target = action
+        if kind == 'M':
+            self.game.move_player(target)
+        elif kind == 'S':
+            self.game.shoot_arrow(target)
+        else:
+            raise ValueError(f"unknown action {kind!r}")
+        self.turn += 1
+        return self.observation(), self.game.game_over
+
+
+class RandomPolicy:
+    """ Wanders at random; with a stench it shoots into a random neighbor half of the time """
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def reset(self, observation: dict):
+        pass
+
+    def act(self, observation: dict):
+        if STENCH in observation['warnings'] and observation['arrows'] and self.rng.random() < 0.5:
+            return ('S', [self.rng.choice(observation['neighbors'])])
+        return ('M', self.rng.choice(observation['neighbors']))
+
+
+class CautiousPolicy:
+    """ Remembers rooms known safe and warnings heard; prefers moves that no warning points at """
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def reset(self, observation: dict):
+        self.safe = {observation['room']}
+        self.suspect = Counter()  # room -> number of stenches/breezes heard next to it
+        self._note(observation)
+
+    def _note(self, observation: dict):
+        self.safe.add(observation['room'])
+        if STENCH in observation['warnings'] or BREEZE in observation['warnings']:
+            for room in observation['neighbors']:
+                if room not in self.safe:
+                    self.suspect[room] += 1
+
+    def act(self, observation: dict):
+        if observation['turn']:
+            self._note(observation)
+        neighbors = observation['neighbors']
+        if STENCH in observation['warnings'] and observation['arrows']:
+            # Shoot at the neighbor most often suspected, if one stands out
+            unknown = [r for r in neighbors if r not in self.safe]
+            if len(unknown) == 1 or (unknown and self.suspect[unknown[0]] > 1):
+                return ('S', [max(unknown, key=lambda r: self.suspect[r])])
+        return ('M', min(neighbors, key=lambda r: (self.suspect[r], r in self.safe, self.rng.random())))
+
+
+class AgentPolicy:
+    """ WumpusAgent from agent.py as a policy """
+    def __init__(self, rng: random.Random):
+        self.agent = None
+
+    def reset(self, observation: dict):
+        self.agent = WumpusAgent(observation['cave'], pits=observation['pit_count'], bats=observation['bat_count'])
+        self.agent.start(observation['room'], observation['warnings'])
+
+    def act(self, observation: dict):
+        if observation['turn']:
+            self.agent.observe(observation['room'], observation['warnings'], observation['carried'])
+        return self.agent.decide()
+
+
+POLICIES = {
+    'random': RandomPolicy,
+    'cautious': CautiousPolicy,
+    'agent': AgentPolicy,
+}
+
+
+def load_policy(name: str):
+    """ A name from POLICIES, or 'module:Class' """
+    if name in POLICIES:
+        return POLICIES[name]
+    module, _, attribute = name.partition(':')
+    return getattr(importlib.import_module(module), attribute)
+
+
+def play_game(policy_class, seed, index: int, max_turns: int, cave=None, pits: int = 2,
+              bats: int = 2) -> tuple[str, int]:
+    """ Plays game number `index` of a run; returns (outcome, turns) """
+    env = WumpusEnv(f"{seed}/{index}/cave", cave, pits, bats)
+    policy = policy_class(random.Random(f"{seed}/{index}/policy"))
+    observation = env.reset()
+    policy.reset(observation)
+    for _ in range(max_turns):
+        observation, done = env.step(policy.act(observation))
+        if done:
+            return env.game.outcome, env.turn
+    return 'timeout', env.turn
+
+
+def run_chunk(policy: str, seed, start: int, stop: int, max_turns: int, cave: str = 'dodecahedron',
+              pits: int = 2, bats: int = 2) -> dict:
+    """ Games start..stop-1 in this process; the cave is given by its parse_cave spec """
+    policy_class = load_policy(policy)
+    cave = parse_cave(cave)
+    outcomes = Counter()
+    turns = 0
+    for index in range(start, stop):
+        outcome, length = play_game(policy_class, seed, index, max_turns, cave, pits, bats)
+        outcomes[outcome] += 1
+        turns += length
+    return {'outcomes': outcomes, 'turns': turns}
+
+
+def simulate(policy: str, games: int, seed=0, workers: int = 1, max_turns: int = 200, chunk: int = 10000,
+             cave: str = 'dodecahedron', pits: int = 2, bats: int = 2) -> dict:
+    """ Runs `games` games of one policy and returns win rate, mean length and the outcome histogram """
+    begin = time.perf_counter()
+    bounds = [(start, min(start + chunk, games)) for start in range(0, games, chunk)]
+    jobs = [(policy, seed, start, stop, max_turns, cave, pits, bats) for start, stop in bounds]
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(workers) as pool:
+            parts = list(pool.map(run_chunk, *zip(*jobs)))
+    else:
+        parts = [run_chunk(*job) for job in jobs]
+
+    outcomes = Counter()
+    turns = 0
+    for part in parts:
+        outcomes.update(part['outcomes'])
+        turns += part['turns']
+    seconds = time.perf_counter() - begin
+    return {
+        'policy': policy,
+        'cave': cave,
+        'games': games,
+        'win_rate': outcomes['won'] / games,
+        'mean_length': turns / games,
+        'outcomes': {name: outcomes[name] for name in OUTCOMES},
+        'seconds': seconds,
+        'games_per_second': games / seconds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--policies", nargs="+", default=['random', 'cautious'])
+    parser.add_argument("--games", type=int, default=100000)
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-turns", type=int, default=200)
+    parser.add_argument("--chunk", type=int, default=10000, help="games per worker task")
+    parser.add_argument("--cave", default="dodecahedron", help="dodecahedron, grid:WxH, torus:WxH or regular:N[:D[:SEED]]")
+    parser.add_argument("--pits", type=int, default=2)
+    parser.add_argument("--bats", type=int, default=2)
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = []
+    for policy in args.policies:
+        result = simulate(policy, args.games, args.seed, args.workers, args.max_turns, args.chunk,
+                          args.cave, args.pits, args.bats)
+        results.append(result)
+        deaths = "  ".join(f"{name}={count}" for name, count in result['outcomes'].items() if name != 'won')
+        print(f"{policy:>10}: win {100 * result['win_rate']:5.1f}%  length {result['mean_length']:5.1f}  "
+              f"{result['games_per_second']:9.0f} games/s  | {deaths}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+"""
+    Load-time checks and statistics for DecisionTreeSolver transition tables.
+
+    Errors (solve() would fail or hang partway through a session):
+        duplicate node IDs   the later entry silently replaced the earlier one
+        missing start node
+        dangling edges       an answer leads to a node ID the table does not define
+        dead ends            a question node without answers (solve() asks forever)
+        cycles               answers that lead back to a node already on the path
+    Warnings: nodes, and leaves in particular, that the start node cannot reach.
+
+    Statistics, as arrays over the compiled node indices: `depth` holds the
+    questions on the shortest way from the start to each node (depth_of),
+    `leaf_count` the distinct leaves each node can reach (leaves_under) and
+    `path_count` its answer paths to a leaf (paths_under). The two counts differ
+    where answers share a node: a shared leaf is one leaf but several paths.
+
+    All of it comes from one breadth-first and one depth-first pass over the
+    compiled node indices. cached_analysis stores the CompiledTree and its
+    TableAnalysis in a pickle named by a hash of the table contents, so a table
+    that was loaded before skips both compiling and analysis.
+
+    Usage:
+        python analysis.py                   # the scientist table
+        python analysis.py --random 50000    # a generated table, timing a cold and a cached load
+"""
+
+import argparse
+import hashlib
+import marshal
+import os
+import pickle
+from collections import Counter
+
+import numpy as np
+
+from compiled import RESERVED, CompiledTree
+
+CACHE_VERSION = 2
+
+
+class TableAnalysis:
+    """ Problems and per-node statistics of a transition table """
+    def __init__(self, transition_table: list, start_node, tree: CompiledTree):
+        nodes = {entry['node']: entry for entry in transition_table}
+        counts = Counter(entry['node'] for entry in transition_table)
+        self.duplicates = [node_id for node_id, count in counts.items() if count > 1]
+        self.start_node = start_node
+        self.missing_start = start_node not in nodes
+        self.dangling = []   # (node, answer, target)
+        self.dead_ends = []
+        children = [[] for _ in tree.node_ids]
+        for i, node_id in enumerate(tree.node_ids):
+            entry = nodes.get(node_id)
+            if entry is None or 'classification' in entry:
+                continue
+            for answer, target in entry.items():
+                if answer in RESERVED:
+                    continue
+                children[i].append(tree.node_index[target])
+                if target not in nodes:
+                    self.dangling.append((node_id, answer, target))
+            if not children[i]:
+                self.dead_ends.append(node_id)
+
+        # Shortest depth, breadth-first from the start
+        depth = [-1] * len(tree.node_ids)
+        if not self.missing_start:
+            depth[0] = 0
+            level = [0]
+            while level:
+                following = []
+                for i in level:
+                    for j in children[i]:
+                        if depth[j] < 0:
+                            depth[j] = depth[i] + 1
+                            following.append(j)
+                level = following
+
+        # Depth-first for cycles, path counts and distinct leaves (-1 where a cycle makes
+        # them unbounded). Without shared nodes the two counts are the same. Otherwise
+        # leaves are numbered as they finish, so the leaves of a subtree that shares no
+        # node are one range of numbers (`span`). Only nodes above a shared node need a
+        # bitset of their leaves, dropped once every parent has used it.
+        self.cycles = []
+        paths = [-1] * len(tree.node_ids)
+        leaves = [-1] * len(tree.node_ids)
+        shared = len(set().union(*children)) < sum(map(len, children))
+        users = Counter(j for c in children for j in set(c)) if shared else None
+        span, below = {}, {}
+        numbered = 0
+        state = [0] * len(tree.node_ids)  # 0 new, 1 on the path, 2 done
+        for root in range(len(tree.node_ids)):
+            if state[root]:
+                continue
+            state[root] = 1
+            path, stack = [root], [iter(children[root])]
+            while stack:
+                j = next(stack[-1], None)
+                if j is None:
+                    i = path.pop()
+                    stack.pop()
+                    state[i] = 2
+                    if tree.leaf[i] >= 0:
+                        paths[i] = leaves[i] = 1
+                        if shared:
+                            span[i] = numbered, numbered + 1
+                            numbered += 1
+                    elif all(paths[c] >= 0 for c in children[i]):
+                        paths[i] = leaves[i] = sum(paths[c] for c in children[i])
+                        if shared:
+                            leaves[i] = self._distinct_leaves(i, children[i], users, span, below)
+                    if shared:
+                        for c in set(children[i]):
+                            users[c] -= 1
+                            if not users[c]:
+                                below.pop(c, None)
+                elif state[j] == 1:
+                    cycle = path[path.index(j):]
+                    self.cycles.append([tree.node_ids[k] for k in cycle] + [tree.node_ids[j]])
+                elif state[j] == 0:
+                    state[j] = 1
+                    path.append(j)
+                    stack.append(iter(children[j]))
+
+        # Indexed like tree.node_ids, -1 where unreachable (depth) or unbounded (the counts)
+        self.node_index = tree.node_index
+        self.depth = np.array(depth, dtype=np.int32)
+        self.leaf_count = np.array(leaves, dtype=np.int64)
+        self.path_count = np.array(paths, dtype=np.int64)
+        self.unreachable = [node_id for node_id, d in zip(tree.node_ids, depth) if d < 0 and node_id in nodes]
+        self.unreachable_leaves = [node_id for node_id in self.unreachable if 'classification' in nodes[node_id]]
+        self.nodes = len(nodes)
+        self.leaves = sum(1 for entry in nodes.values() if 'classification' in entry)
+        self.max_depth = int(self.depth.max(initial=0))
+
+    @staticmethod
+    def _distinct_leaves(i: int, children: list, users: Counter, span: dict, below: dict) -> int:
+        spans = [span.get(c) for c in children]
+        if all(spans) and all(users[c] == 1 for c in children) and len(set(children)) == len(children):
+            low, high = min(a for a, _ in spans), max(b for _, b in spans)
+            if sum(b - a for a, b in spans) == high - low:
+                span[i] = low, high
+                return high - low
+        below[i] = 0
+        for c in children:
+            below[i] |= below[c] if c in below else (1 << span[c][1]) - (1 << span[c][0])
+        return below[i].bit_count()
+
+    def depth_of(self, node_id) -> int:
+        """ Questions asked on the shortest way to `node_id`, -1 if it cannot be reached """
+        return int(self.depth[self.node_index[node_id]]) if node_id in self.node_index else -1
+
+    def leaves_under(self, node_id) -> int:
+        """ Distinct leaves `node_id` can reach, -1 if a cycle or unknown node """
+        return int(self.leaf_count[self.node_index[node_id]]) if node_id in self.node_index else -1
+
+    def paths_under(self, node_id) -> int:
+        """ Answer paths from `node_id` to a leaf, -1 if a cycle or unknown node """
+        return int(self.path_count[self.node_index[node_id]]) if node_id in self.node_index else -1
+
+    @property
+    def errors(self) -> list[str]:
+        errors = [f"node ID {node_id!r} is defined more than once" for node_id in self.duplicates]
+        if self.missing_start:
+            errors.append(f"start node {self.start_node!r} is not in the table")
+        errors += [f"node {node!r} answer {answer!r} leads to unknown node {target!r}"
+                   for node, answer, target in self.dangling]
+        errors += [f"node {node!r} asks a question without answers" for node in self.dead_ends]
+        errors += [f"cycle {' -> '.join(map(repr, cycle))}" for cycle in self.cycles]
+        return errors
+
+    @property
+    def warnings(self) -> list[str]:
+        leaves = set(self.unreachable_leaves)
+        return [f"{'leaf' if node_id in leaves else 'node'} {node_id!r} cannot be reached from {self.start_node!r}"
+                for node_id in self.unreachable]
+
+    def check(self, limit: int = 10):
+        """ Raises ValueError listing (up to `limit` of) the errors, if there are any """
+        errors = self.errors
+        if errors:
+            more = f"\n  ... and {len(errors) - limit} more" if len(errors) > limit else ""
+            raise ValueError(f"invalid transition table ({len(errors)} error{'s' * (len(errors) > 1)}):\n  "
+                             + "\n  ".join(errors[:limit]) + more)
+
+    def report(self) -> str:
+        reachable_leaves = self.leaves - len(self.unreachable_leaves)
+        lines = [f"{self.nodes} nodes, {self.leaves} leaves ({reachable_leaves} reachable), "
+                 f"max depth {self.max_depth}, {max(self.paths_under(self.start_node), 0)} answer paths from the start"]
+        lines += [f"error: {e}" for e in self.errors]
+        lines += [f"warning: {w}" for w in self.warnings]
+        return "\n".join(lines)
+
+
+def content_hash(transition_table: list, start_node) -> str:
+    """ Hash of the table as written (entry and answer order included). marshal is
+        twice as fast as repr on big tables; format version 0 writes no object
+        references or interning flags, so the bytes depend on the contents only. """
+    content = (CACHE_VERSION, start_node, transition_table)
+    try:
+        data = marshal.dumps(content, 0)
+    except ValueError:  # values marshal cannot write
+        data = repr(content).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def cached_analysis(transition_table: list, start_node, cache_dir: str = None) -> tuple:
+    """ (CompiledTree, TableAnalysis) of a table, from `cache_dir` when it was built before """
+    path = None
+    if cache_dir is not None:
+        path = os.path.join(cache_dir, content_hash(transition_table, start_node) + '.pkl')
+        try:
+            with open(path, 'rb') as f:
+                tree, analysis = pickle.load(f)
+            if isinstance(tree, CompiledTree) and isinstance(analysis, TableAnalysis):
+                return tree, analysis
+        except Exception:
+            pass  # not cached yet, a broken file or one from older classes: rebuild it
+    nodes = {entry['node']: entry for entry in transition_table}
+    tree = CompiledTree(nodes, start_node)
+    result = tree, TableAnalysis(transition_table, start_node, tree)
+    if path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path + '.tmp', 'wb') as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + '.tmp', path)
+    return result
+
+
+def main():
+    import tempfile
+    import time
+
+    from main import SCIENTIST_TABLE, DecisionTreeSolver
+    from tables import random_table
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--random", type=int, metavar="NODES", help="analyze a generated table of about NODES nodes")
+    parser.add_argument("--start", default='root')
+    args = parser.parse_args()
+
+    table = random_table(args.random) if args.random else SCIENTIST_TABLE
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for run in ('cold', 'cached'):
+            start = time.perf_counter()
+            solver = DecisionTreeSolver(table, args.start, validate=False, cache_dir=cache_dir)
+            print(f"{run} load: {1000 * (time.perf_counter() - start):.1f} ms")
+    print(solver.analysis.report())
+
+
+if __name__ == '__main__':
+    main()
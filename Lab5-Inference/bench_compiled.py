@@ -0,0 +1,95 @@
+"""
+    Checks DecisionTreeSolver.classify_batch against solve() and measures its throughput.
+
+    Records are answered through solve()'s input_func and print_func hooks, with
+    an invalid answer counting as no result (solve() would ask again). Throughput
+    is records per second for: solve() one record at a time, classify_batch on
+    answer-dicts, on string columns, and encode_columns plus route on those
+    columns. The last line, routing codes that were encoded beforehand, only
+    applies when the same records are classified more than once.
+
+    Usage:
+        python bench_compiled.py --nodes 50000 --records 200000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from compiled import CompiledTree
+from main import DecisionTreeSolver, SCIENTIST_TABLE
+from tables import random_records, random_table
+
+
+class _Rejected(Exception):
+    pass
+
+
+def solve_record(solver: DecisionTreeSolver, record: dict, prompts: dict):
+    def ask(prompt):
+        return record.get(prompts[prompt], '')
+
+    def tell(message):
+        if message.startswith('Invalid answer'):
+            raise _Rejected
+
+    try:
+        return solver.solve(input_func=ask, print_func=tell)
+    except _Rejected:
+        return None
+
+
+def prompt_questions(solver: DecisionTreeSolver) -> dict:
+    """ The prompt solve() shows at each question node -> its question text """
+    prompts = {}
+    for node in solver.nodes.values():
+        if 'classification' not in node:
+            question = node.get('question', '[No question specified]')
+            options = [k for k in node.keys() if k not in ('node', 'question')]
+            prompts[f"{question} ({'/'.join(options)}): "] = question
+    return prompts
+
+
+def rate(function, count: int) -> float:
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=50000)
+    parser.add_argument("--attributes", type=int, default=40)
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--invalid", type=float, default=0.01, help="fraction of answers that are not options")
+    parser.add_argument("--check", type=int, default=5000, help="records compared against solve()")
+    args = parser.parse_args()
+
+    for name, table in (("scientists", SCIENTIST_TABLE),
+                        (f"random:{args.nodes}", random_table(args.nodes, args.attributes))):
+        solver = DecisionTreeSolver(table)
+        start = time.perf_counter()
+        tree = CompiledTree(solver.nodes, solver.start_node)
+        build = time.perf_counter() - start
+        records = random_records(table, args.records, args.invalid)
+        prompts = prompt_questions(solver)
+
+        expected = [solve_record(solver, r, prompts) for r in records[:args.check]]
+        got = solver.classify_batch(records[:args.check])
+        mismatches = sum(e != g for e, g in zip(expected, got))
+
+        columns = {q: np.array([r[q] for r in records]) for q in records[0]}
+        codes = tree.encode_columns(columns)
+        slow = rate(lambda: [solve_record(solver, r, prompts) for r in records[:args.check]], args.check)
+        print(f"{name:<14} {len(tree.node_ids):>6} nodes  compile {1000 * build:7.1f} ms  "
+              f"{mismatches}/{args.check} mismatches vs solve()")
+        print(f"    solve()          {slow:12,.0f} records/s")
+        print(f"    answer-dicts     {rate(lambda: solver.classify_batch(records), len(records)):12,.0f} records/s")
+        print(f"    string columns   {rate(lambda: solver.classify_batch(columns), len(records)):12,.0f} records/s")
+        print(f"    encode + route   {rate(lambda: tree.route(tree.encode_columns(columns)), len(records)):12,.0f} records/s")
+        print(f"    route only       {rate(lambda: tree.route(codes), len(records)):12,.0f} records/s  (pre-encoded)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,232 @@
+"""
+    Compiled form of a DecisionTreeSolver table for non-interactive batch use.
+
+    Nodes are numbered 0..N-1 from the start node in breadth-first order and
+    every answer text gets a code, so the whole tree is a few integer arrays:
+        transitions  (N, answers) int32, next node index, -1 for no such answer
+        leaf         (N,) int32, index into `classifications`, -1 for question nodes
+        attribute    (N,) int32, index into `attributes` (the question text), -1 for leaves
+    A target that names no node gets its own index with no edges and no
+    classification, so records that reach it fail like solve() does.
+
+    Records are answers per question: {question text: answer}. A node ID can be
+    used as the key too, for the question that node asks. Answers are compared
+    after .strip().lower(), as solve() does; keys that are neither are ignored.
+    classify_batch routes all records one level at a time with NumPy fancy
+    indexing, reading only the answers each level asks for; records with a
+    missing or invalid answer, a dangling target or a cycle get None (solve()
+    would re-prompt, print "[Error] Unknown node" or loop). The keys 'node' and
+    'question' are never answers.
+
+        tree = CompiledTree(solver.nodes, 'root')
+        tree.classify_batch([{'What is their primary field?': 'physics', ...}, ...])
+        tree.classify_batch({'What is their primary field?': np.array([...]), ...})   # columnar
+"""
+
+from collections import deque
+
+import numpy as np
+
+RESERVED = ('node', 'question')
+
+
+class CompiledTree:
+    """ Integer-indexed nodes and transitions of a transition table """
+    def __init__(self, nodes: dict, start_node='root'):
+        """ `nodes` is {node ID: table entry}, as in DecisionTreeSolver.nodes """
+        self.node_ids = []
+        self.node_index = {}
+        self.start_known = start_node in nodes
+
+        def number(node_id) -> int:
+            if node_id not in self.node_index:
+                self.node_index[node_id] = len(self.node_ids)
+                self.node_ids.append(node_id)
+            return self.node_index[node_id]
+
+        # Breadth-first from the start, then anything unreachable
+        number(start_node)
+        queue = deque([start_node])
+        while queue:
+            entry = nodes.get(queue.popleft())
+            if entry is None or 'classification' in entry:
+                continue
+            for key, target in entry.items():
+                if key not in RESERVED and target not in self.node_index:
+                    number(target)
+                    queue.append(target)
+        for node_id in nodes:
+            number(node_id)
+
+        self.answers, self.answer_index = [], {}
+        self.attributes, self.attribute_index = [], {}
+        self.classifications, classification_index = [], {}
+        n = len(self.node_ids)
+        self.leaf = np.full(n, -1, dtype=np.int32)
+        self.attribute = np.full(n, -1, dtype=np.int32)
+        edges = []
+        for i, node_id in enumerate(self.node_ids):
+            entry = nodes.get(node_id)
+            if entry is None:
+                continue  # dangling target
+            if 'classification' in entry:
+                text = entry['classification']
+                if text not in classification_index:
+                    classification_index[text] = len(self.classifications)
+                    self.classifications.append(text)
+                self.leaf[i] = classification_index[text]
+                continue
+            question = entry.get('question', '[No question specified]')
+            if question not in self.attribute_index:
+                self.attribute_index[question] = len(self.attributes)
+                self.attributes.append(question)
+            self.attribute[i] = self.attribute_index[question]
+            for answer, target in entry.items():
+                if answer in RESERVED:
+                    continue
+                if answer not in self.answer_index:
+                    self.answer_index[answer] = len(self.answers)
+                    self.answers.append(answer)
+                edges.append((i, self.answer_index[answer], self.node_index[target]))
+
+        self.transitions = np.full((n, max(len(self.answers), 1)), -1, dtype=np.int32)
+        if edges:
+            source, answer, target = np.array(edges, dtype=np.int32).T
+            self.transitions[source, answer] = target
+        self.code_type = np.min_scalar_type(-max(len(self.answers), 1))
+        # Question text for node IDs too, so records may be keyed either way
+        self.key_attribute = dict(self.attribute_index)
+        for node_id, i in self.node_index.items():
+            if self.attribute[i] >= 0:
+                self.key_attribute.setdefault(node_id, int(self.attribute[i]))
+
+    def _attribute_of(self, key, strict: bool) -> int:
+        """ Column of a question or node ID; None for other keys unless `strict` """
+        if key not in self.key_attribute:
+            if strict:
+                raise KeyError(f"{key!r} is neither a question nor a question node")
+            return None
+        return self.key_attribute[key]
+
+    def _code(self, answer) -> int:
+        return self.answer_index.get(str(answer).strip().lower(), -1)
+
+    def encode_records(self, records, strict: bool = False) -> np.ndarray:
+        """ Answer-dicts -> (len(records), attributes) answer codes, -1 where missing or invalid.
+            Keys that are neither questions nor question nodes (an 'id' carried along, say)
+            are ignored, or raise KeyError when `strict`. """
+        codes = np.full((len(records), max(len(self.attributes), 1)), -1, dtype=self.code_type)
+        keys = {}
+        for record in records:
+            keys.update(dict.fromkeys(record))
+        # One column at a time; each distinct raw answer is normalized once. Records
+        # without the key leave the code alone (the question may also be keyed by node ID).
+        known = {None: -2}
+        for key in keys:
+            attribute = self._attribute_of(key, strict)
+            if attribute is None:
+                continue
+            column = [record.get(key) for record in records]
+            for answer in set(column).difference(known):
+                known[answer] = self._code(answer)
+            column = np.array([known[answer] for answer in column], dtype=self.code_type)
+            present = column != -2
+            codes[present, attribute] = column[present]
+        return codes
+
+    def encode_columns(self, columns: dict, strict: bool = False) -> np.ndarray:
+        """ {question or node ID: sequence of answers} -> answer codes. Every column is read
+            as answers, numbers included (2 matches the answer '2'); each distinct value is
+            normalized and looked up once. Other keys are ignored unless `strict`. """
+        rows = len(next(iter(columns.values()))) if columns else 0
+        codes = np.full((rows, max(len(self.attributes), 1)), -1, dtype=self.code_type)
+        for key, values in columns.items():
+            values = np.asarray(values)
+            if len(values) != rows:
+                raise ValueError("all columns need the same length")
+            attribute = self._attribute_of(key, strict)
+            if attribute is None:
+                continue
+            distinct, inverse = np.unique(values, return_inverse=True)
+            lookup = np.array([self._code(v) for v in distinct], dtype=self.code_type)
+            codes[:, attribute] = lookup[inverse.reshape(-1)]
+        return codes
+
+    def route(self, codes: np.ndarray) -> np.ndarray:
+        """ Leaf classification index per row of answer codes, -1 where no leaf is reached.
+            Codes outside 0..len(answers)-1 count as invalid answers. """
+        rows = codes.shape[0]
+        result = np.full(rows, -1, dtype=np.int32)
+        if not self.start_known or rows == 0:
+            return result
+        active = np.arange(rows)
+        node = np.zeros(rows, dtype=np.int32)
+        # Every step moves one level down; more steps than nodes means a cycle
+        for _ in range(len(self.node_ids) + 1):
+            leaf = self.leaf[node]
+            done = leaf >= 0
+            result[active[done]] = leaf[done]
+            keep = ~done & (self.attribute[node] >= 0)  # dangling nodes have neither
+            active, node = active[keep], node[keep]
+            if not len(active):
+                break
+            answer = codes[active, self.attribute[node]].astype(np.intp)
+            answer[(answer < 0) | (answer >= len(self.answers))] = -1
+            node = self.transitions[node, answer]
+            keep = (answer >= 0) & (node >= 0)
+            active, node = active[keep], node[keep]
+        return result
+
+    def route_records(self, records: list) -> np.ndarray:
+        """ route() for answer-dicts, reading only the answer each record needs at each level
+            (the work solve() does, without prompts), instead of encoding whole records """
+        rows = len(records)
+        result = np.full(rows, -1, dtype=np.int32)
+        if not self.start_known or rows == 0:
+            return result
+        keys = [[question] for question in self.attributes]  # the keys that answer each question
+        for key, a in self.key_attribute.items():
+            if key not in self.attribute_index:
+                keys[a].append(key)
+        code = self._code
+        known = {}
+        active = np.arange(rows)
+        node = np.zeros(rows, dtype=np.int32)
+        for _ in range(len(self.node_ids) + 1):
+            leaf = self.leaf[node]
+            done = leaf >= 0
+            result[active[done]] = leaf[done]
+            keep = ~done & (self.attribute[node] >= 0)
+            active, node = active[keep], node[keep]
+            if not len(active):
+                break
+            answers = []
+            for row, a in zip(active.tolist(), self.attribute[node].tolist()):
+                record = records[row]
+                value = None
+                for key in keys[a]:
+                    if key in record:
+                        value = record[key]
+                        break
+                c = known.get(value)
+                if c is None:
+                    c = known[value] = -1 if value is None else code(value)
+                answers.append(c)
+            answer = np.array(answers, dtype=np.intp)
+            node = self.transitions[node, answer]
+            keep = (answer >= 0) & (node >= 0)
+            active, node = active[keep], node[keep]
+        return result
+
+    def classify_batch(self, data) -> list:
+        """ Classification per record (None where solve() would not reach a leaf).
+            `data` is a list of answer-dicts, a dict of answer columns, or an ndarray of
+            answer codes (indices into `answers`, see encode_records / encode_columns). """
+        if isinstance(data, np.ndarray):
+            index = self.route(data)
+        elif isinstance(data, dict):
+            index = self.route(self.encode_columns(data))
+        else:
+            index = self.route_records(data)
+        labels = np.array(self.classifications + [None], dtype=object)
+        return labels[index].tolist()
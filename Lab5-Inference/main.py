@@ -1,5 +1,8 @@
 import sys
 
+from analysis import cached_analysis
+from compiled import CompiledTree
+
 class DecisionTreeSolver:
     """
     Each table entry is a dict with:
@@ -8,12 +11,22 @@ class DecisionTreeSolver:
       - one or more keys for possible answers,
         each mapping to the next node ID
       - OR, at a leaf node, a 'classification' key
+
+    With validate=True the table is compiled and analyzed (see analysis.py) on
+    load, and a table with dangling edges, cycles, dead ends or duplicate node IDs
+    raises ValueError here instead of failing in the middle of solve(). With a
+    cache_dir, the compiled table and its analysis are kept there by content hash.
     """
 
-    def __init__(self, transition_table, start_node='root'):
+    def __init__(self, transition_table, start_node='root', validate=True, cache_dir=None):
         # build lookup by node id
         self.nodes = {entry['node']: entry for entry in transition_table}
         self.start_node = start_node
+        self._compiled = self.analysis = None
+        if validate or cache_dir is not None:
+            self._compiled, self.analysis = cached_analysis(transition_table, start_node, cache_dir)
+            if validate:
+                self.analysis.check()
 
     def solve(self, input_func=input, print_func=print):
         """
@@ -44,125 +57,137 @@ class DecisionTreeSolver:
 
             current = node[answer]
 
+    def compile(self) -> CompiledTree:
+        """ Flat integer-array form of the table (see compiled.py), built once """
+        if self._compiled is None:
+            self._compiled = CompiledTree(self.nodes, self.start_node)
+        return self._compiled
+
+    def classify_batch(self, data) -> list:
+        """ Classifies many records without prompting: a list of {question: answer} dicts
+            or a dict of answer columns. None where solve() would not reach a leaf. """
+        return self.compile().classify_batch(data)
+
+
+# Scientist inference transition table
+SCIENTIST_TABLE = [
+    {
+        'node': 'root',
+        'question': 'What is their primary field?',
+        'physics': 'physics1',
+        'biology': 'biology1',
+        'chemistry': 'chemistry1',
+        'mathematics': 'math1',
+        'computer_science': 'cs1',
+        'other': 'unknown'
+    },
+
+    # Physics branch
+    {
+        'node': 'physics1',
+        'question': 'Are they known for relativity?',
+        'yes': 'einstein',
+        'no': 'physics2'
+    },
+    {
+        'node': 'physics2',
+        'question': 'Are they known for laws of motion?',
+        'yes': 'newton',
+        'no': 'physics3'
+    },
+    {
+        'node': 'physics3',
+        'question': 'Are they a pioneer of quantum theory (e.g. black‐body radiation)?',
+        'yes': 'planck',
+        'no': 'physics4'
+    },
+    {
+        'node': 'physics4',
+        'question': 'Did they formulate the uncertainty principle?',
+        'yes': 'heisenberg',
+        'no': 'unknown'
+    },
+
+    # Biology branch
+    {
+        'node': 'biology1',
+        'question': 'Did they propose evolution by natural selection?',
+        'yes': 'darwin',
+        'no': 'biology2'
+    },
+    {
+        'node': 'biology2',
+        'question': 'Are they considered the father of genetics?',
+        'yes': 'mendel',
+        'no': 'unknown'
+    },
+
+    # Chemistry branch
+    {
+        'node': 'chemistry1',
+        'question': 'Did they discover radioactivity?',
+        'yes': 'marie_curie',
+        'no': 'chemistry2'
+    },
+    {
+        'node': 'chemistry2',
+        'question': 'Did they create the periodic table?',
+        'yes': 'mendeleev',
+        'no': 'unknown'
+    },
+
+    # Mathematics branch
+    {
+        'node': 'math1',
+        'question': 'Are they known as the father of geometry?',
+        'yes': 'euclid',
+        'no': 'math2'
+    },
+    {
+        'node': 'math2',
+        'question': 'Did they make major contributions to number theory?',
+        'yes': 'gauss',
+        'no': 'math3'
+    },
+    {
+        'node': 'math3',
+        'question': 'Did they lay foundations for graph theory?',
+        'yes': 'euler',
+        'no': 'unknown'
+    },
+
+    # Computer Science branch
+    {
+        'node': 'cs1',
+        'question': 'Did they invent the concept of a universal Turing machine?',
+        'yes': 'turing',
+        'no': 'cs2'
+    },
+    {
+        'node': 'cs2',
+        'question': 'Are they known for public‐key cryptography?',
+        'yes': 'diffie_hellman',
+        'no': 'unknown'
+    },
+
+    # Leaf classifications
+    {'node': 'einstein',       'classification': "It's Albert Einstein"},
+    {'node': 'newton',         'classification': "It's Isaac Newton"},
+    {'node': 'planck',         'classification': "It's Max Planck"},
+    {'node': 'heisenberg',     'classification': "It's Werner Heisenberg"},
+    {'node': 'darwin',         'classification': "It's Charles Darwin"},
+    {'node': 'mendel',         'classification': "It's Gregor Mendel"},
+    {'node': 'marie_curie',    'classification': "It's Marie Curie"},
+    {'node': 'mendeleev',      'classification': "It's Dmitri Mendeleev"},
+    {'node': 'euclid',         'classification': "It's Euclid"},
+    {'node': 'gauss',          'classification': "It's Carl Friedrich Gauss"},
+    {'node': 'euler',          'classification': "It's Leonhard Euler"},
+    {'node': 'turing',         'classification': "It's Alan Turing"},
+    {'node': 'diffie_hellman', 'classification': "It's Whitfield Diffie & Martin Hellman"},
+    {'node': 'unknown',        'classification': "Scientist not in database"}
+]
+
 
 if __name__ == '__main__':
-    # Scientist inference transition table
-    transition_table = [
-        {
-            'node': 'root',
-            'question': 'What is their primary field?',
-            'physics': 'physics1',
-            'biology': 'biology1',
-            'chemistry': 'chemistry1',
-            'mathematics': 'math1',
-            'computer_science': 'cs1',
-            'other': 'unknown'
-        },
-
-        # Physics branch
-        {
-            'node': 'physics1',
-            'question': 'Are they known for relativity?',
-            'yes': 'einstein',
-            'no': 'physics2'
-        },
-        {
-            'node': 'physics2',
-            'question': 'Are they known for laws of motion?',
-            'yes': 'newton',
-            'no': 'physics3'
-        },
-        {
-            'node': 'physics3',
-            'question': 'Are they a pioneer of quantum theory (e.g. black‐body radiation)?',
-            'yes': 'planck',
-            'no': 'physics4'
-        },
-        {
-            'node': 'physics4',
-            'question': 'Did they formulate the uncertainty principle?',
-            'yes': 'heisenberg',
-            'no': 'unknown'
-        },
-
-        # Biology branch
-        {
-            'node': 'biology1',
-            'question': 'Did they propose evolution by natural selection?',
-            'yes': 'darwin',
-            'no': 'biology2'
-        },
-        {
-            'node': 'biology2',
-            'question': 'Are they considered the father of genetics?',
-            'yes': 'mendel',
-            'no': 'unknown'
-        },
-
-        # Chemistry branch
-        {
-            'node': 'chemistry1',
-            'question': 'Did they discover radioactivity?',
-            'yes': 'marie_curie',
-            'no': 'chemistry2'
-        },
-        {
-            'node': 'chemistry2',
-            'question': 'Did they create the periodic table?',
-            'yes': 'mendeleev',
-            'no': 'unknown'
-        },
-
-        # Mathematics branch
-        {
-            'node': 'math1',
-            'question': 'Are they known as the father of geometry?',
-            'yes': 'euclid',
-            'no': 'math2'
-        },
-        {
-            'node': 'math2',
-            'question': 'Did they make major contributions to number theory?',
-            'yes': 'gauss',
-            'no': 'math3'
-        },
-        {
-            'node': 'math3',
-            'question': 'Did they lay foundations for graph theory?',
-            'yes': 'euler',
-            'no': 'unknown'
-        },
-
-        # Computer Science branch
-        {
-            'node': 'cs1',
-            'question': 'Did they invent the concept of a universal Turing machine?',
-            'yes': 'turing',
-            'no': 'cs2'
-        },
-        {
-            'node': 'cs2',
-            'question': 'Are they known for public‐key cryptography?',
-            'yes': 'diffie_hellman',
-            'no': 'unknown'
-        },
-
-        # Leaf classifications
-        {'node': 'einstein',       'classification': "It's Albert Einstein"},
-        {'node': 'newton',         'classification': "It's Isaac Newton"},
-        {'node': 'planck',         'classification': "It's Max Planck"},
-        {'node': 'heisenberg',     'classification': "It's Werner Heisenberg"},
-        {'node': 'darwin',         'classification': "It's Charles Darwin"},
-        {'node': 'mendel',         'classification': "It's Gregor Mendel"},
-        {'node': 'marie_curie',    'classification': "It's Marie Curie"},
-        {'node': 'mendeleev',      'classification': "It's Dmitri Mendeleev"},
-        {'node': 'euclid',         'classification': "It's Euclid"},
-        {'node': 'gauss',          'classification': "It's Carl Friedrich Gauss"},
-        {'node': 'euler',          'classification': "It's Leonhard Euler"},
-        {'node': 'turing',         'classification': "It's Alan Turing"},
-        {'node': 'diffie_hellman', 'classification': "It's Whitfield Diffie & Martin Hellman"},
-        {'node': 'unknown',        'classification': "Scientist not in database"}
-    ]
-
-    solver = DecisionTreeSolver(transition_table, start_node='root')
+    solver = DecisionTreeSolver(SCIENTIST_TABLE, start_node='root')
     solver.solve()
@@ -0,0 +1,377 @@
+"""
+    Question-order optimizer for DecisionTreeSolver tables.
+
+    A table is a classifier: every answer to every question leads to one
+    classification. Each start-to-leaf path is a rule ("field = physics and
+    relativity = no and motion = yes -> Newton"), and the rules partition all
+    possible answers. optimize() walks the original tree bottom-up. Each subtree
+    keeps its own question over its improved children, unless an entropy-greedy
+    rebuild from its rules asks fewer questions on average. The greedy rebuild
+    picks, at each node, the question with the largest information gain about
+    the classification. Rules that do not depend on that question go down every
+    branch, and a node becomes a leaf as soon as its remaining rules agree. The
+    new table therefore classifies every complete set of answers exactly like the
+    old one, and it is never worse: a rebuild is only taken if it asks fewer
+    questions on average and no more in the worst case. Identical subtrees are
+    shared, and leaves reuse the original leaf node IDs.
+
+    An if-else-if chain such as physics1 -> physics4 cannot be reordered under
+    that guarantee: someone who answers yes to both relativity and motion is
+    Einstein only if relativity is asked first. With closed_world, each leaf is
+    taken to be one entity that gives a default answer ('no' in those chains) to
+    every question off its path, so at most one answer in a chain is yes. The
+    chain is then free to ask the likeliest scientist first. Answer sets that the
+    table never describes (two yes answers in one chain) may change classification.
+
+    Weights: each leaf gets a prior, given per classification or per leaf node
+    ID, or counted from a log of past classifications (add-one smoothed). Without
+    priors, all leaves weigh the same. The weight of a leaf with several paths
+    (such as 'unknown') is split by path probability, taking every answer of a
+    question as equally likely. A rule that ignores a question splits the same
+    way over that question's answers. path_lengths() gives the expected and
+    worst-case number of questions of any table under these weights.
+
+    Usage:
+        python optimize.py --log classifications.txt --closed-world --print
+        python optimize.py --priors priors.json --out optimized.json
+        python optimize.py --random 20000         # generated table, questions in arbitrary order
+"""
+
+import argparse
+import json
+import math
+import time
+from collections import Counter, defaultdict
+
+from compiled import RESERVED
+
+NO_QUESTION = '[No question specified]'  # what solve() shows for a node without 'question'
+
+
+def domains(transition_table: list) -> dict:
+    """ Question text -> every answer any node asking it offers, in first-seen order """
+    result = defaultdict(dict)
+    for entry in transition_table:
+        if 'classification' not in entry:
+            question = entry.get('question', NO_QUESTION)
+            result[question].update(dict.fromkeys(k for k in entry if k not in RESERVED))
+    return {question: list(answers) for question, answers in result.items()}
+
+
+def leaf_rules(transition_table: list, start_node='root') -> list[tuple]:
+    """ (conditions {question: answer}, classification, leaf node ID) per start-to-leaf path.
+        Paths that answer the same question two ways can never be taken and are left out. """
+    nodes = {entry['node']: entry for entry in transition_table}
+    rules = []
+    stack = [(start_node, {}, 0)]
+    while stack:
+        node_id, conditions, depth = stack.pop()
+        entry = nodes.get(node_id)
+        if entry is None:
+            raise ValueError(f"unknown node {node_id!r}; check the table with analysis.py")
+        if 'classification' in entry:
+            rules.append((conditions, entry['classification'], node_id))
+            continue
+        question = entry.get('question', NO_QUESTION)
+        for answer, target in reversed(list(entry.items())):
+            if answer in RESERVED or conditions.get(question, answer) != answer:
+                continue
+            if depth >= len(nodes):
+                raise ValueError("the table has a cycle; check it with analysis.py")
+            stack.append((target, {**conditions, question: answer}, depth + 1))
+    return rules[::-1]
+
+
+def classification_counts(lines) -> Counter:
+    """ Priors from a log: one classification (or leaf node ID) per line, add-one smoothed
+        by rule_weights """
+    return Counter(line.strip() for line in lines if line.strip())
+
+
+def rule_weights(rules: list[tuple], domain: dict, priors: dict = None, smoothing: float = 0.0) -> list[float]:
+    """ Probability of each rule (sums to 1). `priors` maps a classification or a leaf node ID
+        to a weight; leaves it does not name get `smoothing`. """
+    paths = [math.prod(1 / len(domain[q]) for q in conditions) for conditions, _, _ in rules]
+    if priors is None:
+        prior = {leaf: 1.0 for _, _, leaf in rules}
+        key = [leaf for _, _, leaf in rules]
+    else:
+        by_leaf = any(leaf in priors for _, _, leaf in rules)
+        key = [leaf if by_leaf else classification for _, classification, leaf in rules]
+        prior = {k: priors.get(k, 0) + smoothing for k in key}
+    mass = defaultdict(float)
+    for k, p in zip(key, paths):
+        mass[k] += p
+    weights = [prior[k] * p / mass[k] for k, p in zip(key, paths)]
+    total = sum(weights)
+    if total <= 0:
+        raise ValueError("the priors give every leaf weight 0")
+    return [w / total for w in weights]
+
+
+def _entropy(weights) -> float:
+    total = sum(weights)
+    return -sum(w / total * math.log2(w / total) for w in weights if w > 0) if total > 0 else 0.0
+
+
+def closed_world_rules(rules: list[tuple], domain: dict) -> list[tuple]:
+    """ Completes every rule with a default answer for each question its path does not ask.
+        The default is the answer whose branches hold the most rules, counting each rule by
+        how many rules share its classification ('no' in the scientist chains, which all
+        end in 'unknown'). """
+    size = Counter(classification for _, classification, _ in rules)
+    votes = defaultdict(Counter)
+    for conditions, classification, _ in rules:
+        for question, answer in conditions.items():
+            votes[question][answer] += size[classification]
+    default = {question: max(answers, key=lambda a: (votes[question][a], -answers.index(a)))
+               for question, answers in domain.items()}
+    return [({**default, **conditions}, classification, leaf) for conditions, classification, leaf in rules]
+
+
+class _Builder:
+    """ Entropy-greedy subtrees over rules, with identical nodes shared """
+    def __init__(self, domain: dict, leaf_ids: dict, rebuild_limit: int = None):
+        self.domain = domain
+        self.rebuild_limit = rebuild_limit if rebuild_limit is not None else math.inf
+        self.order = {question: i for i, question in enumerate(domain)}
+        self.leaf_ids = leaf_ids  # classification -> leaf node ID
+        self.entries = {}         # (question, ((answer, child), ...)) -> node ID
+        self.taken = set(leaf_ids.values())
+
+    def node(self, question: str, children: tuple) -> str:
+        key = (question, children)
+        if key not in self.entries:
+            node_id = f"q{len(self.entries) + 1}"
+            while node_id in self.taken:
+                node_id += "_"
+            self.taken.add(node_id)
+            self.entries[key] = node_id
+        return self.entries[key]
+
+    def choose(self, rules: list[tuple]) -> str:
+        """ Question with the largest information gain (ties: fewer rules copied, table order) """
+        total = sum(w for _, w, _ in rules)
+        if total <= 0:  # only zero-weight rules left: count them instead
+            rules = [(conditions, 1.0, c) for conditions, _, c in rules]
+            total = len(rules)
+        by_class = Counter()
+        split = defaultdict(lambda: defaultdict(Counter))  # question -> answer -> class -> weight
+        for conditions, w, c in rules:
+            by_class[c] += w
+            for question, answer in conditions.items():
+                split[question][answer][c] += w
+        before = _entropy(by_class.values())
+        best, best_score = None, None
+        for question, answers in split.items():
+            values = self.domain[question]
+            free = Counter(by_class)
+            for counts in answers.values():
+                free.subtract(counts)
+            after = 0.0
+            for value in values:
+                branch = [answers[value][c] + free[c] / len(values) if value in answers else free[c] / len(values)
+                          for c in by_class]
+                after += sum(branch) / total * _entropy(branch)
+            copied = sum(free[c] for c in by_class)
+            score = (round(before - after, 12), -round(copied, 12), -self.order[question])
+            if best_score is None or score > best_score:
+                best, best_score = question, score
+        return best
+
+    def build(self, rules: list[tuple]) -> tuple:
+        """ (node ID, cost, depth) of a greedy subtree for `rules`; cost is the expected
+            number of questions times the weight of the rules, depth the most questions """
+        classes = {c for _, _, c in rules}
+        if len(classes) == 1:
+            return self.leaf_ids[classes.pop()], 0.0, 0
+        question = self.choose(rules)
+        if question is None:
+            raise ValueError("rules disagree with no question left to tell them apart")
+        values = self.domain[question]
+        branches = {value: [] for value in values}
+        for conditions, w, c in rules:
+            answer = conditions.get(question)
+            if answer is None:
+                for value in values:
+                    branches[value].append((conditions, w / len(values), c))
+            else:
+                rest = dict(conditions)
+                del rest[question]
+                branches[answer].append((rest, w, c))
+        children, cost, depth = [], sum(w for _, w, _ in rules), 0
+        for value, branch in branches.items():
+            if branch:
+                child, child_cost, child_depth = self.build(branch)
+                children.append((value, child))
+                cost += child_cost
+                depth = max(depth, child_depth)
+        return self.node(question, tuple(children)), cost, depth + 1
+
+    def improve(self, nodes: dict, node_id, rules: list[tuple]) -> tuple:
+        """ (node ID, cost, depth) for the original subtree at node_id: the original question
+            over improved children, or a greedy rebuild if that is cheaper and no deeper.
+            `rules` are the rules below node_id without the questions asked above it. """
+        entry = nodes[node_id]
+        classes = {c for _, _, c in rules}
+        if len(classes) == 1:
+            return self.leaf_ids[classes.pop()], 0.0, 0
+        question = entry.get('question', NO_QUESTION)
+        answers = len(self.domain[question])
+        children, cost, depth = [], sum(w for _, w, _ in rules), 0
+        for answer, target in entry.items():
+            if answer in RESERVED:
+                continue
+            # A rule that ignores the question (it was asked above too) follows every answer
+            branch = [({q: a for q, a in conditions.items() if q != question}, w, c) if question in conditions
+                      else (conditions, w / answers, c)
+                      for conditions, w, c in rules if conditions.get(question, answer) == answer]
+            if branch:
+                child, child_cost, child_depth = self.improve(nodes, target, branch)
+                children.append((answer, child))
+                cost += child_cost
+                depth = max(depth, child_depth)
+        kept = self.node(question, tuple(children)), cost, depth + 1
+        if len(rules) > self.rebuild_limit:
+            return kept
+        rebuilt = self.build(rules)
+        return rebuilt if rebuilt[1] < kept[1] - 1e-12 and rebuilt[2] <= kept[2] else kept
+
+    def table(self, root: str, start_node, leaves: list[dict]) -> list[dict]:
+        """ The nodes reachable from `root`, which is renamed to start_node, start first
+            and breadth-first, then the leaves. Nodes that had no question get none. """
+        entries = {node_id: {'node': node_id, **({'question': question} if question != NO_QUESTION else {}),
+                             **dict(children)}
+                   for (question, children), node_id in self.entries.items()}
+        ordered, queue, seen = [], [root], {root}
+        while queue:
+            entry = entries[queue.pop(0)]
+            ordered.append(entry)
+            for key, target in entry.items():
+                if key not in RESERVED and target in entries and target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+        ordered[0] = {**ordered[0], 'node': start_node}
+        used = {target for entry in ordered for key, target in entry.items() if key not in RESERVED}
+        return ordered + [entry for entry in leaves if entry['node'] in used]
+
+
+def optimize(transition_table: list, start_node='root', priors: dict = None, smoothing: float = 0.0,
+             closed_world: bool = False, rebuild_limit: int = 100) -> list[dict]:
+    """ Same-format table with the questions reordered for fewer expected questions under
+        the leaf priors. By default it classifies every complete set of answers like
+        `transition_table`; with closed_world, only the rules completed by
+        closed_world_rules are kept. Each original subtree keeps its own question unless an
+        entropy-greedy rebuild is cheaper, so the result is never worse. Rebuilds are only
+        tried up to `rebuild_limit` rules: larger subtrees rarely gain and cost the most.
+        A rebuild that would ask more questions in the worst case is never taken. """
+    domain = domains(transition_table)
+    rules = leaf_rules(transition_table, start_node)
+    weights = rule_weights(rules, domain, priors, smoothing)
+    leaves, leaf_ids = [], {}
+    for entry in transition_table:
+        if 'classification' in entry and entry['classification'] not in leaf_ids:
+            leaf_ids[entry['classification']] = entry['node']
+            leaves.append(dict(entry))
+    if closed_world:
+        rules = closed_world_rules(rules, domain)
+    rules = [(conditions, w, c) for (conditions, c, _), w in zip(rules, weights)]
+    if len({c for _, _, c in rules}) == 1:
+        return [{'node': start_node, 'classification': rules[0][2]}]
+
+    builder = _Builder(domain, leaf_ids, rebuild_limit)
+    builder.taken.add(start_node)
+    root, _, _ = builder.improve({entry['node']: entry for entry in transition_table}, start_node, rules)
+    return builder.table(root, start_node, leaves)
+
+
+def path_lengths(transition_table: list, rules: list[tuple], weights: list[float], domain: dict,
+                 start_node='root') -> tuple:
+    """ (expected questions, worst-case questions) of a table when answers follow `rules`
+        with probabilities `weights`. Raises ValueError if the table classifies any rule
+        differently, so it doubles as an equivalence check. """
+    nodes = {entry['node']: entry for entry in transition_table}
+    expected, worst = 0.0, 0
+    for (conditions, classification, _), weight in zip(rules, weights):
+        stack = [(start_node, weight, 0)]
+        while stack:
+            node_id, w, depth = stack.pop()
+            entry = nodes[node_id]
+            if 'classification' in entry:
+                if entry['classification'] != classification:
+                    raise ValueError(f"{conditions} gives {entry['classification']!r}, not {classification!r}")
+                expected += w * depth
+                worst = max(worst, depth)
+                continue
+            question = entry.get('question', NO_QUESTION)
+            if question in conditions:
+                stack.append((entry[conditions[question]], w, depth + 1))
+            else:
+                for answer in domain[question]:
+                    stack.append((entry[answer], w / len(domain[question]), depth + 1))
+    return expected, worst
+
+
+def main():
+    from main import SCIENTIST_TABLE
+    from tables import random_table
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--table", help="JSON file with a transition table (default: the scientist table)")
+    parser.add_argument("--random", type=int, metavar="NODES", help="use a generated table of about NODES nodes")
+    parser.add_argument("--start", default='root')
+    parser.add_argument("--priors", help="JSON file {classification or leaf node ID: weight}")
+    parser.add_argument("--log", help="text file of past classifications, one per line")
+    parser.add_argument("--closed-world", action="store_true",
+                        help="assume default answers off each path (see closed_world_rules)")
+    parser.add_argument("--rebuild-limit", type=int, default=100, help="largest subtree (in rules) to rebuild")
+    parser.add_argument("--out", help="write the optimized table here as JSON")
+    parser.add_argument("--print", action="store_true", help="print the optimized table")
+    args = parser.parse_args()
+
+    if args.table:
+        with open(args.table) as f:
+            table = json.load(f)
+    elif args.random:
+        table = random_table(args.random, attributes=30, max_options=3, classes=8)
+    else:
+        table = SCIENTIST_TABLE
+    priors, smoothing = None, 0.0
+    if args.priors:
+        with open(args.priors) as f:
+            priors = json.load(f)
+    elif args.log:
+        with open(args.log) as f:
+            priors, smoothing = classification_counts(f), 1.0
+    if priors is not None:
+        known = {entry.get('classification') for entry in table} | {entry['node'] for entry in table}
+        unknown = sum(weight for name, weight in priors.items() if name not in known)
+        if unknown:
+            print(f"ignoring priors of weight {unknown} that name no leaf")
+
+    start = time.perf_counter()
+    optimized = optimize(table, args.start, priors, smoothing, args.closed_world, args.rebuild_limit)
+    print(f"optimized in {time.perf_counter() - start:.2f} s")
+    domain = domains(table)
+    rules = leaf_rules(table, args.start)
+    weights = rule_weights(rules, domain, priors, smoothing)
+    if args.closed_world:
+        rules = closed_world_rules(rules, domain)
+    lengths = []
+    for name, t in (("before", table), ("after", optimized)):
+        expected, worst = path_lengths(t, rules, weights, domain, args.start)
+        questions = sum(1 for entry in t if 'classification' not in entry)
+        print(f"{name:<7} {questions:>6} question nodes  expected {expected:.3f} questions  worst case {worst}")
+        lengths.append((expected, worst))
+    (expected_before, worst_before), (expected_after, worst_after) = lengths
+    print(f"change  expected {expected_after - expected_before:+.3f}  worst case {worst_after - worst_before:+d}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(optimized, f, indent=4, ensure_ascii=False)
+    if args.print:
+        for entry in optimized:
+            print(entry)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+    Generated transition tables for benchmarks, in the DecisionTreeSolver format.
+
+    random_table builds a tree over `attributes` multiple-choice questions
+    ("Attribute 7?" with answers a0, a1, ...). Every node asks a question not yet
+    asked on its path; nodes turn into leaves with growing probability as they
+    get deeper and once the table has reached `nodes` entries.
+"""
+
+import random
+from collections import deque
+
+
+def random_table(nodes: int = 10000, attributes: int = 40, max_options: int = 4, classes: int = 50,
+                 seed=0) -> list[dict]:
+    rng = random.Random(seed)
+    options = [[f"a{k}" for k in range(rng.randint(2, max_options))] for _ in range(attributes)]
+    table = []
+    queue = deque([('root', frozenset(), 0)])
+    count = 1
+    while queue:
+        node_id, used, depth = queue.popleft()
+        free = [a for a in range(attributes) if a not in used]
+        if not free or count >= nodes or (depth > 2 and rng.random() < depth / attributes):
+            table.append({'node': node_id, 'classification': f"class {rng.randrange(classes)}"})
+            continue
+        attribute = rng.choice(free)
+        entry = {'node': node_id, 'question': f"Attribute {attribute}?"}
+        for answer in options[attribute]:
+            child = f"n{count}"
+            count += 1
+            entry[answer] = child
+            queue.append((child, used | {attribute}, depth + 1))
+        table.append(entry)
+    return table
+
+
+def random_records(table: list[dict], count: int, invalid: float = 0.0, seed=0) -> list[dict]:
+    """ Records with an answer to every question of the table; a fraction `invalid`
+        of the answers are not options ("maybe") """
+    rng = random.Random(seed)
+    questions = {}
+    for entry in table:
+        if 'question' in entry and 'classification' not in entry:
+            answers = [k for k in entry if k not in ('node', 'question')]
+            questions.setdefault(entry['question'], set()).update(answers)
+    questions = {q: sorted(a) for q, a in questions.items()}
+    return [{q: ('maybe' if rng.random() < invalid else rng.choice(a)) for q, a in questions.items()}
+            for _ in range(count)]